@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Benchmark suite covering the library's hot paths.
+
+Each benchmark is a function that takes a size parameter and an output
+stream, performs any setup required, and returns a zero-argument callable.
+That callable is what gets timed. If it returns an integer, that is recorded
+as the number of output bytes produced per call.
+
+Run with::
+
+    python -m bench.suite [--stream memory|pty] [--filter NAME] [--repeat N]
+
+All inputs are generated deterministically, so runs are comparable across
+revisions.
+"""
+
+
+from argparse import ArgumentParser
+from io import StringIO, TextIOBase
+from os import path, openpty, read as os_read, close as os_close, fdopen
+from random import Random
+from threading import Thread
+from timeit import Timer
+
+from pansi import (KeyboardEvent, SGR, TerminalInput, TerminalOutput, markup, measure_text, parse_spans,
+                   segment_cells, strip_ansi)
+from pansi.color import Color, Gradient, oklab, palette_index, oklch, WEB_PALETTE
+
+
+ART = path.join(path.dirname(path.dirname(path.abspath(__file__))), "art")
+
+BENCHMARKS = []
+
+
+def benchmark(name, sizes):
+    """ Register a benchmark function under a given name, to be run once for
+    each of the given sizes.
+    """
+
+    def decorator(f):
+        BENCHMARKS.append((name, sizes, f))
+        return f
+
+    return decorator
+
+
+class CountingStream(TextIOBase):
+    """ Writable text stream that counts the number of UTF-8 bytes written
+    through it, passing data on to an underlying stream.
+    """
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+        self.count = 0
+
+    def write(self, s):
+        self.count += len(s.encode("utf-8"))
+        if isinstance(self._stream, StringIO):
+            # Avoid unbounded growth of the in-memory buffer between calls
+            self._stream.seek(0)
+            self._stream.truncate()
+        return self._stream.write(s)
+
+    def writable(self):
+        return True
+
+    def flush(self):
+        self._stream.flush()
+
+
+class PseudoTerminal:
+    """ Pseudo-terminal pair, with a background thread that continuously
+    drains (and discards) anything written to the slave end.
+    """
+
+    def __init__(self):
+        self._master, slave = openpty()
+        self.stream = fdopen(slave, "w", encoding="utf-8")
+        Thread(target=self._drain, daemon=True).start()
+
+    def _drain(self):
+        try:
+            while os_read(self._master, 65536):
+                pass
+        except OSError:
+            pass
+
+    def close(self):
+        self.stream.close()
+        os_close(self._master)
+
+
+def sample_text(size, alphabet, seed=0):
+    rnd = Random(seed)
+    return "".join(rnd.choice(alphabet) for _ in range(size))
+
+
+ASCII = "abcdefghijklmnopqrstuvwxyz     ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.,;:!?"
+WIDE = "漢字仮名交じり文ｗｏｒｌｄ한국어"
+
+
+@benchmark("measure_text[ascii]", sizes=(10, 100, 1000, 10000))
+def bench_measure_text_ascii(size, _stream):
+    text = sample_text(size, ASCII)
+    return lambda: measure_text(text) and None
+
+
+@benchmark("measure_text[styled]", sizes=(10, 100, 1000, 10000))
+def bench_measure_text_styled(size, _stream):
+    words = sample_text(size, ASCII).split(" ")
+    text = " ".join(f"{SGR(91)}{word}{SGR(0)}" if i % 3 == 0 else word for i, word in enumerate(words))
+    return lambda: measure_text(text) and None
+
+
+@benchmark("measure_text[wide]", sizes=(10, 100, 1000, 10000))
+def bench_measure_text_wide(size, _stream):
+    text = sample_text(size, ASCII + WIDE)
+    return lambda: measure_text(text) and None
+
+
+@benchmark("segment_cells[emoji]", sizes=(10, 100, 1000, 10000))
+def bench_segment_cells_emoji(size, _stream):
+    text = sample_text(size, ASCII + WIDE) + "e\u0301 \U0001F468\u200D\U0001F469\u200D\U0001F467 \U0001F1EC\U0001F1E7"
+    return lambda: segment_cells(text) and None
+
+
+def _lines(count, width=80):
+    return "\n".join(sample_text(width, ASCII, seed=i) for i in range(count)) + "\n"
+
+
+@benchmark("strip_ansi", sizes=(100, 1000, 10000))
+def bench_strip_ansi(size, _stream):
+    words = sample_text(size, ASCII).split(" ")
+    text = " ".join(f"{SGR(91)}{word}{SGR(0)}" if i % 3 == 0 else word for i, word in enumerate(words))
+    return lambda: strip_ansi(text) and None
+
+
+@benchmark("parse_spans", sizes=(100, 1000, 10000))
+def bench_parse_spans(size, _stream):
+    words = sample_text(size, ASCII).split(" ")
+    text = " ".join(f"{SGR(38, 2, i % 256, 0, 0)}{word}{SGR(0)}" if i % 3 == 0 else word
+                    for i, word in enumerate(words))
+    return lambda: sum(1 for _ in parse_spans(text)) and None
+
+
+@benchmark("TerminalOutput.write[plain]", sizes=(1, 10, 100))
+def bench_write_plain(size, stream):
+    output = TerminalOutput(stream)
+    text = _lines(size)
+
+    def run():
+        stream.count = 0
+        output.write(text)
+        return stream.count
+
+    return run
+
+
+@benchmark("TerminalOutput.write[styled]", sizes=(1, 10, 100))
+def bench_write_styled(size, stream):
+    output = TerminalOutput(stream)
+    text = _lines(size)
+
+    def run():
+        stream.count = 0
+        output.write(text, color="red", background_color="#202020", font_weight="bold",
+                     text_decoration="underline")
+        return stream.count
+
+    return run
+
+
+@benchmark("SGR.for_color", sizes=(1, 10, 100))
+def bench_sgr_for_color(size, _stream):
+    rnd = Random(size)
+    names = sorted(WEB_PALETTE)
+    values = [rnd.choice(names) if i % 2 else f"#{rnd.randrange(0x1000000):06X}" for i in range(size)]
+
+    def run():
+        return sum(len(str(SGR.for_color(value))) for value in values)
+
+    return run
+
+
+@benchmark("Color.parse", sizes=(1, 10, 100))
+def bench_color_parse(size, _stream):
+    rnd = Random(size)
+    values = [f"rgb({rnd.randrange(256)} {rnd.randrange(256)} {rnd.randrange(256)})" for _ in range(size)]
+    return lambda: sum(len(Color.parse(value)) for value in values)
+
+
+@benchmark("markup", sizes=(1, 10, 100))
+def bench_markup(size, _stream):
+    values = [f"item-{i}" for i in range(size)]
+
+    def run():
+        return sum(len(markup("[bold red]{name}[/] ok", name=value)) for value in values)
+
+    return run
+
+
+@benchmark("color.oklab", sizes=(1, 10, 100))
+def bench_oklab(size, _stream):
+    rnd = Random(size)
+    values = [(rnd.random(), rnd.uniform(-0.4, 0.4), rnd.uniform(-0.4, 0.4)) for _ in range(size)]
+    return lambda: sum(len(oklab(*value)) for value in values)
+
+
+@benchmark("color.oklch", sizes=(1, 10, 100))
+def bench_oklch(size, _stream):
+    rnd = Random(size)
+    values = [(rnd.random(), rnd.uniform(0, 0.4), rnd.uniform(0, 360)) for _ in range(size)]
+    return lambda: sum(len(oklch(*value)) for value in values)
+
+
+@benchmark("Gradient.paint", sizes=(10, 100, 1000))
+def bench_gradient_paint(size, _stream):
+    gradient = Gradient("red", "yellow", "lime", "cyan", "blue", "magenta", space="oklch")
+    text = sample_text(size, ASCII)
+    gradient.escapes()
+    return lambda: len(gradient.paint(text))
+
+
+@benchmark("ColorIndex.nearest_many", sizes=(1, 10, 100))
+def bench_nearest_color(size, _stream):
+    rnd = Random(size)
+    index = palette_index("web")
+    values = [(rnd.randrange(256), rnd.randrange(256), rnd.randrange(256)) for _ in range(size)]
+    return lambda: index.nearest_many(values) and None
+
+
+KEYS = ["a", "Z", " ", "\r", "\x1b[A", "\x1b[B", "\x1b[1;5C", "\x1b[3~", "\x1b[15;2~", "\x1bOP",
+        "\x1b[57362u", "\x1b[Z"]
+
+
+@benchmark("KeyboardEvent", sizes=(1, 10, 100))
+def bench_keyboard_event(size, _stream):
+    rnd = Random(size)
+    keys = [rnd.choice(KEYS) for _ in range(size)]
+    return lambda: [KeyboardEvent("keypress", key) for key in keys] and None
+
+
+@benchmark("TerminalInput[paste]", sizes=(1000, 10000, 100000))
+def bench_terminal_input(size, _stream):
+    rnd = Random(size)
+    chunks = []
+    total = 0
+    while total < size:
+        chunk = rnd.choice(KEYS) if rnd.random() < 0.05 else sample_text(rnd.randrange(1, 40), ASCII, seed=total)
+        chunks.append(chunk)
+        total += len(chunk)
+    text = "".join(chunks)
+    return lambda: list(TerminalInput(StringIO(text))) and None
+
+
+def _bench_block_image(filename, engine):
+
+    def bench(size, _stream):
+        from PIL import Image
+        from pansi.image import BlockImage
+        with Image.open(path.join(ART, filename)) as image:
+            image.load()
+            lines = size * image.height // image.width // 2
+            block_image = BlockImage(image, lines=lines, cols=size, engine=engine)
+
+        def run():
+            block_image._fragments.clear()
+            block_image._rendered.clear()
+            return sum(len(line.encode("utf-8")) for line in block_image.ansi_lines())
+
+        return run
+
+    return bench
+
+
+for _filename in ("pansies.png", "hello-rainbow.png", "brownies.512x2048.png"):
+    for _engine in ("python", "numpy"):
+        benchmark(f"BlockImage.ansi_lines[{_filename},{_engine}]",
+                  sizes=(40, 80, 160))(_bench_block_image(_filename, _engine))
+
+
+@benchmark("MosaicImage.ansi_lines[pansies.png]", sizes=(40, 80, 160))
+def bench_mosaic_image(size, _stream):
+    from PIL import Image
+    from pansi.image import MosaicImage
+    with Image.open(path.join(ART, "pansies.png")) as image:
+        image.load()
+        lines = size * image.height // image.width // 2
+        mosaic = MosaicImage(image, lines=lines, cols=size, mode="sextant")
+    return lambda: sum(len(line.encode("utf-8")) for line in mosaic.ansi_lines())
+
+
+def run_benchmark(f, size, stream, repeat):
+    func = f(size, stream)
+    output_bytes = func()
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return best, output_bytes
+
+
+def main():
+    parser = ArgumentParser(description="Run the pansi benchmark suite.")
+    parser.add_argument("-s", "--stream", choices=["memory", "pty"], default="memory",
+                        help="output stream to write to (default: memory)")
+    parser.add_argument("-f", "--filter", default="",
+                        help="only run benchmarks whose names contain this string")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="number of timing repeats, of which the best is taken (default: 5)")
+    args = parser.parse_args()
+    if args.stream == "pty":
+        pty = PseudoTerminal()
+        stream = CountingStream(pty.stream)
+    else:
+        pty = None
+        stream = CountingStream(StringIO())
+    try:
+        print(f"{'benchmark':<48} {'size':>8} {'time/op':>12} {'bytes/op':>10}")
+        for name, sizes, f in BENCHMARKS:
+            if args.filter not in name:
+                continue
+            for size in sizes:
+                try:
+                    best, output_bytes = run_benchmark(f, size, stream, args.repeat)
+                except ImportError as error:
+                    print(f"{name:<48} {size:>8} skipped ({error})")
+                    break
+                output_bytes = "-" if output_bytes is None else output_bytes
+                print(f"{name:<48} {size:>8} {best * 1e6:>10.1f}µs {output_bytes:>10}")
+    finally:
+        if pty:
+            pty.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,8 +18,13 @@
 
 from ._codes import *
 from ._keyboard import *
+from ._markup import *
 from ._measurement import *
+from ._parsing import *
+from ._reactor import *
 from ._sgr import *
+from ._style import *
+from ._table import *
 from ._term import *
 
 
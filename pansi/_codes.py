@@ -16,6 +16,9 @@
 # limitations under the License.
 
 
+from re import compile as re_compile, VERBOSE
+
+
 NUL = "\x00"    # ^@ |    | null                      |      | does nothing
 SOH = "\x01"    # ^A |    | start of header           | TC₁  | start of transmission header
 STX = "\x02"    # ^B |    | start of text             | TC₂  | start of transmission content
@@ -109,3 +112,49 @@ C1_CONTROL_TO_ESC_SEQUENCE = str.maketrans(dict(zip(map(chr, range(0x80, 0xA0)),
 # https://www.unicode.org/versions/Unicode16.0.0/core-spec/chapter-5/#G10213
 CRLF = f"{CR}{LF}"
 UNICODE_NEWLINES = {CR, LF, CRLF, NEL, "\x85", VT, FF, "\u2028", "\u2029"}
+
+
+# Regular expression source matching a single escape sequence, following the
+# same rules as the TerminalInput tokenizer. Sequences at the very end of the
+# text may be incomplete, in which case the pattern still matches but
+# _COMPLETE_CHAR_UNIT will not.
+_ESCAPE_SEQUENCE = r"""
+    \x1B[\[O][^@-~]*[@-~]?                        # CSI or SS3
+  | \x1B[PX\]^_](?:(?!\x1B\\)[\s\S])*(?:\x1B\\)?    # DCS, SOS, OSC, PM or APC
+  | \x1B[ -/][^0-~]*[0-~]?                       # nF
+  | \x1B[\s\S]?                                  # any other, or lone ESC
+"""
+
+# A single character unit, as would be returned by iterating through a
+# TerminalInput.
+_CHAR_UNIT = re_compile(r"\r\n? | " + _ESCAPE_SEQUENCE + r" | [\s\S]", VERBOSE)
+
+# A single character unit that does not contribute printable text: an
+# escape sequence, newline, or other control character.
+_CONTROL_UNIT = re_compile(r"\r\n? | " + _ESCAPE_SEQUENCE + r" | [\x00-\x1F\x7F-\x9F\u2028\u2029]", VERBOSE)
+
+_COMPLETE_CHAR_UNIT = re_compile(r"""
+    \x1B[\[O][^@-~]*[@-~]
+  | \x1B[PX\]^_][\s\S]*\x1B\\
+  | \x1B[ -/][^0-~]*[0-~]
+  | \x1B[^\[OPX\]^_ -/]
+  | \x1B
+""", VERBOSE)
+
+
+def _split_char_units(text, final=True) -> ([str], str):
+    """ Split text into character units, as would be returned by iterating
+    through a TerminalInput. Returns a list of complete units, plus any
+    trailing incomplete escape sequence. If `final` is true, the text is
+    assumed to be complete, and the remainder will always be empty.
+
+    A lone ESC at the end of non-final text is also held back, as it may
+    be the start of an escape sequence split across reads. It is up to the
+    caller to decide (typically after a short timeout) when to give up
+    waiting, and pass it back with `final` set, as an Escape keypress.
+    """
+    units = [m.group() for m in _CHAR_UNIT.finditer(text)]
+    if not final and units and units[-1][0] == ESC and (
+            units[-1] == ESC or not _COMPLETE_CHAR_UNIT.fullmatch(units[-1])):
+        return units, units.pop()
+    return units, ""
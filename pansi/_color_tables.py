@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# This file is generated by tools/generate_color_tables.py -- do not edit.
+
+
+#: Number of bits per channel used to index the lookup tables. An RGB
+#: value (r, g, b) is looked up at index
+#: ``(r >> 3) << 10 | (g >> 3) << 5 | (b >> 3)``.
+LUT_BITS = 5
+
+#: RGB values of the CGA 16-colour palette, in terminal colour order.
+CGA_16_RGB = (
+    (0, 0, 0), (170, 0, 0), (0, 170, 0), (170, 85, 0), (0, 0, 170), (170, 0, 170),
+    (0, 170, 170), (170, 170, 170), (85, 85, 85), (255, 85, 85), (85, 255, 85), (255, 255, 85),
+    (85, 85, 255), (255, 85, 255), (85, 255, 255), (255, 255, 255),
+)
+
+#: RGB values of the xterm 256-colour palette.
+XTERM_256_RGB = (
+    (0, 0, 0), (170, 0, 0), (0, 170, 0), (170, 85, 0), (0, 0, 170), (170, 0, 170),
+    (0, 170, 170), (170, 170, 170), (85, 85, 85), (255, 85, 85), (85, 255, 85), (255, 255, 85),
+    (85, 85, 255), (255, 85, 255), (85, 255, 255), (255, 255, 255), (0, 0, 0), (0, 0, 95),
+    (0, 0, 135), (0, 0, 175), (0, 0, 215), (0, 0, 255), (0, 95, 0), (0, 95, 95),
+    (0, 95, 135), (0, 95, 175), (0, 95, 215), (0, 95, 255), (0, 135, 0), (0, 135, 95),
+    (0, 135, 135), (0, 135, 175), (0, 135, 215), (0, 135, 255), (0, 175, 0), (0, 175, 95),
+    (0, 175, 135), (0, 175, 175), (0, 175, 215), (0, 175, 255), (0, 215, 0), (0, 215, 95),
+    (0, 215, 135), (0, 215, 175), (0, 215, 215), (0, 215, 255), (0, 255, 0), (0, 255, 95),
+    (0, 255, 135), (0, 255, 175), (0, 255, 215), (0, 255, 255), (95, 0, 0), (95, 0, 95),
+    (95, 0, 135), (95, 0, 175), (95, 0, 215), (95, 0, 255), (95, 95, 0), (95, 95, 95),
+    (95, 95, 135), (95, 95, 175), (95, 95, 215), (95, 95, 255), (95, 135, 0), (95, 135, 95),
+    (95, 135, 135), (95, 135, 175), (95, 135, 215), (95, 135, 255), (95, 175, 0), (95, 175, 95),
+    (95, 175, 135), (95, 175, 175), (95, 175, 215), (95, 175, 255), (95, 215, 0), (95, 215, 95),
+    (95, 215, 135), (95, 215, 175), (95, 215, 215), (95, 215, 255), (95, 255, 0), (95, 255, 95),
+    (95, 255, 135), (95, 255, 175), (95, 255, 215), (95, 255, 255), (135, 0, 0), (135, 0, 95),
+    (135, 0, 135), (135, 0, 175), (135, 0, 215), (135, 0, 255), (135, 95, 0), (135, 95, 95),
+    (135, 95, 135), (135, 95, 175), (135, 95, 215), (135, 95, 255), (135, 135, 0), (135, 135, 95),
+    (135, 135, 135), (135, 135, 175), (135, 135, 215), (135, 135, 255), (135, 175, 0), (135, 175, 95),
+    (135, 175, 135), (135, 175, 175), (135, 175, 215), (135, 175, 255), (135, 215, 0), (135, 215, 95),
+    (135, 215, 135), (135, 215, 175), (135, 215, 215), (135, 215, 255), (135, 255, 0), (135, 255, 95),
+    (135, 255, 135), (135, 255, 175), (135, 255, 215), (135, 255, 255), (175, 0, 0), (175, 0, 95),
+    (175, 0, 135), (175, 0, 175), (175, 0, 215), (175, 0, 255), (175, 95, 0), (175, 95, 95),
+    (175, 95, 135), (175, 95, 175), (175, 95, 215), (175, 95, 255), (175, 135, 0), (175, 135, 95),
+    (175, 135, 135), (175, 135, 175), (175, 135, 215), (175, 135, 255), (175, 175, 0), (175, 175, 95),
+    (175, 175, 135), (175, 175, 175), (175, 175, 215), (175, 175, 255), (175, 215, 0), (175, 215, 95),
+    (175, 215, 135), (175, 215, 175), (175, 215, 215), (175, 215, 255), (175, 255, 0), (175, 255, 95),
+    (175, 255, 135), (175, 255, 175), (175, 255, 215), (175, 255, 255), (215, 0, 0), (215, 0, 95),
+    (215, 0, 135), (215, 0, 175), (215, 0, 215), (215, 0, 255), (215, 95, 0), (215, 95, 95),
+    (215, 95, 135), (215, 95, 175), (215, 95, 215), (215, 95, 255), (215, 135, 0), (215, 135, 95),
+    (215, 135, 135), (215, 135, 175), (215, 135, 215), (215, 135, 255), (215, 175, 0), (215, 175, 95),
+    (215, 175, 135), (215, 175, 175), (215, 175, 215), (215, 175, 255), (215, 215, 0), (215, 215, 95),
+    (215, 215, 135), (215, 215, 175), (215, 215, 215), (215, 215, 255), (215, 255, 0), (215, 255, 95),
+    (215, 255, 135), (215, 255, 175), (215, 255, 215), (215, 255, 255), (255, 0, 0), (255, 0, 95),
+    (255, 0, 135), (255, 0, 175), (255, 0, 215), (255, 0, 255), (255, 95, 0), (255, 95, 95),
+    (255, 95, 135), (255, 95, 175), (255, 95, 215), (255, 95, 255), (255, 135, 0), (255, 135, 95),
+    (255, 135, 135), (255, 135, 175), (255, 135, 215), (255, 135, 255), (255, 175, 0), (255, 175, 95),
+    (255, 175, 135), (255, 175, 175), (255, 175, 215), (255, 175, 255), (255, 215, 0), (255, 215, 95),
+    (255, 215, 135), (255, 215, 175), (255, 215, 215), (255, 215, 255), (255, 255, 0), (255, 255, 95),
+    (255, 255, 135), (255, 255, 175), (255, 255, 215), (255, 255, 255), (8, 8, 8), (18, 18, 18),
+    (28, 28, 28), (38, 38, 38), (48, 48, 48), (58, 58, 58), (68, 68, 68), (78, 78, 78),
+    (88, 88, 88), (98, 98, 98), (108, 108, 108), (118, 118, 118), (128, 128, 128), (138, 138, 138),
+    (148, 148, 148), (158, 158, 158), (168, 168, 168), (178, 178, 178), (188, 188, 188), (198, 198, 198),
+    (208, 208, 208), (218, 218, 218), (228, 228, 228), (238, 238, 238),
+)
+
+#: Nearest CGA palette index for each quantized RGB value, as a
+#: base64-encoded, zlib-compressed byte string.
+CGA_16_LUT = (
+    b"eNrt2d2abDAQheGtichIuP+73TPd0+SnqhaCxsjpV88ceUv0/Pv3OhV97L9pvZI7m1+94Xvze5g8dGrCBj0ZsUkPJizVhxFruf4z"
+    b"Ya3UG5vZm+n98TpBres67j+nDk/S44Ea9Z+RBxiY1R+oP3L7A/V44Cs579I9zxdxOu98gYEvMLCsjwP/Pu+f0z3Tf7Ouf3v7v/1n"
+    b"+O8u5b9a1i32L/AOfO/jv7n93/7/oP9M38v9Nxn+7Vz/TQXv9xP9b+v7mP7r238y0F3bf77v5+d9U0Hfa3zfV/D9vob/5vZ/+/9j"
+    b"/qtl3e78fl/j+76C9/tq8/v97f+w/utL+uf9ir/PP/s03xX0vcL7vdrnfn/7n+of7ofL+u+29N+t6n8dv/m+q3zfFXy/V/D9PsG/"
+    b"PZv/mD/lv76A/3pn/93p/W/o2871XeX7nnq/t4e+39/+z+6/O5v/FfxWyC/0XeX7nvZ+t1nvd3v7p/zXf85/x/nvTuO/KIrJPvP9"
+    b"TvdtZd/8819B31Wu74/7t3/U/+6/D2gt+Ndak758/ov8d/v6H1cA4dfPxOvX+pXqV/R9Ov/NGv7rC/pPfIdR8/6fkfHfHd5/F/l/"
+    b"KVbesb7/N/I0Wz+zfXj00h49uKg3UU6ff9R/Ji7kvyxL6D+aof3Xn/e/YD9oiXfqN+GtRd6c/6GSvvQp/ReFUsQCKLwFIfZ5+yPq"
+    b"yX5QYD8oeT8owc+E/SD3Ru3ru0Q9HUm6N1F/yn8923/sr0Z+48p1zfmOKuFfB4f0r6/gX8X+YS9Ah/uj4XuyHxT5/TF5Pyh5P6jd"
+    b"9gOlF/q2hO8S+B8mSP8/OdM/8XLWkv/UV1o5/4zPpFL+Q8Ayb60T29D/614g+Os299+t4V8B37l9/v5ohC7sB3FBNOACkeKMezIR"
+    b"7A+Kr78/KL3Qt5V88/5fE4T/3xrbFe4Hz4ef9T/6sLJeyj/vk8ix/9hn5FvP7sC/pv3rM/onF8CRegH2SyN2ekE8H/yC2A+Kef9G"
+    b"+6NkBgS/xH6IBxi/wP8wwfdygEn1kBflP3z4E/+iLyprWd+6/bGgH9F/t5N/BXzu3Yt5+yHtxAXi9eDzXyAxLWY/pAPs+5nv3oTs"
+    b"W/G+vyc83bx/TfZYt/99QOny/Gv6PMAA4Dunb7I/AH/Ov76EfwV8rtyLud3O7MSCKL0FQF0wIlvCfkgGaL/8/ngDF/bD+CdY/2Xw"
+    b"euf9a6Inuof/HzD+x/u9Rv5z++Mz+2W2//FfA0v9d8fxrxTodk4vdu/Av5L9q8QP6uEE6VPeD94A57sE+0G434eKoX/td9mn1nn9"
+    b"sPvjkv671fwr4PPjvQQLYni+UWcWgORfyf7pXoL9ES2IEnzgl+CCL/HX2rkp/rVwHmAArIfV9gfXBdqpbz3Dv+b8dZv77xb6L07o"
+    b"uwAD3sud7eMCkDrlX8n+iV6C/eEPOOf585h62bH+naN6iDvqBH8H+DsNzgN1eX2stD/4vrZ/fQD/rdjb7/O3/I8bQPS9xL+T/RM+"
+    b"FfId5LQbY8Y613/C3wH+DvCH/rc+YH3A/QL4Z/jXC/23cg/0pr0NeXdUPq3/Yqn/kuuhj6QnvuIs+id8vvVyvo2RfZvXeVey+/xX"
+    b"8s/yR/4/vh/QAfw14B/7b2X/sc6oJzrD3rbpAJX9AaqOA33/Yd8O+IU9uN5Lfqke+/Bwkn5NMOCoPk44phvF+jZv3rRvMxwn95F/"
+    b"2tn7AcnfCfon+HfX8f+NBvXnYfy3pM6+p3R6uU/pjhPfuW/p81vZ3v5m4N+5VTvhL7f7r3cj+jWBztSviQYc3Y1i/JpgwPHdf307"
+    b"KpO+QTeGHqA6cT8wwW7wFoSsO9v/x/dDypbu3FQq6114fwNOzueYGb+ot6gPA4BX6M/I3cid4umCHA4Mz+dQgwH/+TVmao9ez2kP"
+    b"X89EN352sr7fbmb2yLcRu6HO0MlqNN+j+0G6F8IFAfifxn87yX88Rfoa8TP++h747Xf3n/L5fcTDTHdjeH/x4xXl2T16/RLPN+qh"
+    b"X0qH93p2sq6NusntJqsn/uPdsN/9YA3f0/wzcy2/ABb7PoD/oc/2Feb53Uzp4vONOvTrMvvV/fs/IBhwQeCvB8e4H4DrvZZv97oH"
+    b"1/uD+u+X+w9+faL9ubxujt6P73tr/+OA4S4IdJ/lf4/7wbz7fXy7p/x4l3vaV39y/+bsfm//G/v3fkAw7AUh6Jv9ftiCCz643/fs"
+    b"9Z710/cf99/f/g/t+/r+Dfp+WON+MOX7IOd+T/nQwa93n/G/5+8D/wHYC8hc"
+)
+
+#: Nearest xterm palette index for each quantized RGB value, as a
+#: base64-encoded, zlib-compressed byte string. Only the colour cube and
+#: greyscale ramp (indexes 16 to 255) are used, since the first sixteen
+#: colours vary between terminals.
+XTERM_256_LUT = (
+    b"eNrt2vl/zme+x/F/Yc6ZCVFrqp3T9nSbU9GZJMgiCIlYa6cqiKo2tloq0TIaKVLEOmhtpZQiqK1oadRenba0lvboQhEJZRpLxfl8"
+    b"rv36fq/r+73vO3cip495//q65p755XldX3nMH/7wM+w/2P4T90fcn3ARERE/k13w6hdg1n6B7OJFW7/IZ8isX2KjWf+PR/BYjBNZ"
+    b"9mK5y5cvu/7jETVq1LgsFwmrRXYfLqJ27RpkkEpKSmpGRooDpNfmvUZNupC764Cz17D0OnVIrYurWbNevXqRkfXrQ2/QgHeyunT1"
+    b"cPVxDXBRUVF1tAP27jxg6XW1H4B+P1mdhmQP4B7E/Rn3XzDa729oO3C/dsDejQfUrhxQf+AhsofpHsH9N+5R3GOwh3wOPOQ+YOwP"
+    b"mX5A6amppKdhb6v8wON0T5A9ifsL7n9wT8G0bjjw+OOuX9A69e3j39e3T2e8TYA5/0vm/3iE0O/tv9jfPwFu8H/Z3z/lX1X+awXn"
+    b"v47bf/3w+6/7/91/i+ruP9Xtvx33/0SF/T/h6d/zff/5QsX8i+fd0/8ls/9LAfkvDtR/5B+9/Jc4/NcW/kvIIi393/7NPyD8N/xd"
+    b"+n8sfP5TFf9t0X96Vfqv6Pse/Pe9oxPePv4pb2MvDsA/f+BD8l9yz/3XtPuvw/0TfcI/XABRUf/2z/lXif9HKug/rer9B+T7wkWv"
+    b"fjHE73ve+fvu6b/Y4r9Y/Re+6+cjdP4G/yp/m/8SP/+qzqr3X6eGUyfyJ/6jLDqru39nr6j/Fsx/y2rpPzWV+k9D/23Rfzr6b1dB"
+    b"/08F4D9cvr3f94sBvO+Xiiv4973iy1b/6j/wUY/0r/G3+C8pUS+Aaujf/rxHefFu4Oyh+4+PD5v/B0Py38LTfwvmvyX6b4U5BXvr"
+    b"kP0/GqR/9ue9h8U/79NlT01V/bdF/+kw4B92/0+a/Dv8WnxHe/oG4NHmv9/J9z062ud9j/b7vo/2/fd948aO971Y/fMe+cCvRS8A"
+    b"/PNeRERtVT8FHor/klKySvv7YExMjJf/mEr3H2/6857o8TjMCQnQE7EnheL/gZD9q897K0dvQUf4t3ygFezBlBTw37p1lflPVf68"
+    b"Tz/v0+nn/WOpcsg/Dfm3Rf7p7dB/+8r2z3XTNcY9/bTj+xwJa/1pt2/Zn8a5fev9r4a/32sd53zfnf1vMP373t0v6w98Ce0k36d0"
+    b"Bbjkx/wJ/RS4wX8pn6VzvVfMvmPcvGWPYYMae/Xq1ci4uLhatZo0gdq0ae3azQj/mBgf/3V9/Md7+nfwTlR7vBjmhIREWP0kWHNc"
+    b"cjLRGV9h/y08/Ave7HkH/8w39BZyLXHIvxXklNa4Nm1U3b7+rV193vUDCm/im3/epz9K3vf2iv80t//27VXdQfh39A4dZO+EvTP2"
+    b"Z6A3IovW/SuAaL/k3S95dYW/7MKn8rhHe/kG4fbOgUd7+qf8Xb1EncG/wp8Ar+X26eGf6S0tvUIWGYl8qd/7msoeEwMxNjY2DtcE"
+    b"1hTXrFkz0WNQ/9WrvDdhnehn/n/BxcWBziZNGjSAHhXVzId3FNPt5E2e7+aqb8q7HvpO4r6Tk5Ol/4QE7j/J4T8+XtFL+Cah3ubS"
+    b"t+f94Ob9IPJ2+m4ofKcovsPj37Onij/eO553/X1PE74Fb/AdVv/G3oEOcseOHYE/+u+M/p8J3H+jSu2Cv+F+kM+7+X5Q33evzgy7"
+    b"uqa/tJTrEt8HYEvgL5Vd9yn8X9F4Kn6vsNk6nIiN9fR/9arRP8+cP/iPq6/0eJV3AvKmz3MD5BkVJfzWNfNNNvAO1j9GyTtR+m8u"
+    b"/Tq+3vm/zqXvhpI3vu4pf6Z829h4p5i7p/9H7L4d/+cc/td5xbfyvPN/vcPz3r4q/HfQnvdO6vP+VAc+1A/+O8GAf2fQD/67dKkK"
+    b"3wH0Yq/OdZvuB/V9t/hXhXv6L1X9Ax/mv1QuzuyfHaG8vfzH2f0T/lf9/P9i8x+TkPALvwCS3P4TTHxVvwmV5B/gcf/0+U5MBL9J"
+    b"SeAX/Se7eWvPdxsDX78enH+hm/k3+35Y8rb4TtP5Mt6h+28n/Wv89c/3p+Trzp/3Tn8hvsnz3qWL8E/4d0T+nSB3Rv7PdKk2/ht5"
+    b"d8bf7h/5Gr8P9Pfdoxt8Q26mPe9e/r19U/6xdv9E/1Uf//R5N/oX/Jn/5kb/13z8J4bXfzLxjxeAgi8xBf23Rv/SZ8uWPv5bhtG/"
+    b"+gM6b9fz3d7C2+3bzNt6P7j9my8QoZvyflLhrfl28Ba+g/Mf7eM35N6oYv4bNSqxdanbeD9or3tpnMu/+rrbfIuv+ys2/1f83nf6"
+    b"r3sv//Lz3uaff95r/uPjGX/u/9o1wAf+8QJIdvi/hksKi39LN/r34G3z7+wtWgb+fRCC/zQb7/apHgfah3Y/aD/Ac1ZWFvah2Ic5"
+    b"/bOPdwPvLppuxwGlqwc6+/hv7OO7cej+zb0rrFs3c+/K1g1n7+CbnOjeXenCPweMvXv3Hpp/5+e9wlP17+Bt9h9n9R0bG+vt3/TP"
+    b"e6X3/kU+79r9EE8ugN7MPweO/uECkD4V/9cE3+bOHti/D0z+MzIyRP+Xt/9f7f7t94Ov/+e9/D+Pwzx4MOQXXkhJGTIE8osvMv9p"
+    b"wfg3dj//VLfCe7jsWWxpQ2Fth8HSh8PajRgxgvvvGKz/Z8z+3T+g8+qOfnr0ACE9ewKQXr3+pvZu2Lvz3tPdCa/uPfAA6700v7L3"
+    b"6IkHfHovV+9m7V313lPvTL+hy+fd/Xw37UX99XY/75rP3uQA5+3y2xvm/LwXvTcb/7x/Ftakb9++z+H69RNdXADQ+/ZlB/r16xfP"
+    b"Mvq/Jnz37du8OfTk5H5Up8r/ust/Btfb/zpO85/Bh7l//8TEAQMGJA2ENc/MzExOHiR6Rn+yf+GwZ+IGDUJ+GRkqfzLUmSl9e38f"
+    b"cL0tUW+rF7Aj39bAt83zfET3YMANvIfAQDf0l56XG4zD/gL2F3EvveR63Y2+ve+HrCwzb+DbPitL4z1U4z1i5EjZs0Qfhn047apu"
+    b"u3/v/jKM9FGjOnUaPRrymDGQx451+Hf66yl9+fWu4endrL1rcP7dvdR8PxA8BHefPn0Qn9T1nOi9MWqd++zH+PVxHnD03n7decDV"
+    b"JX/Nv+jXxJ4dqHSuF20ifthAhecgXe91a2cHQD/lPdDZFf+/Kj8A7jCKx5fy/3Ug6M2EC2CQplfhy3i+pOsdzPW6u4P3EHM3+c9y"
+    b"P//DhW+OF3XD64zPczr6Bd3AW/E7VOc7gvIdmWU4MFw5EIh/jb/D98t0VDfhPRp5j2G8X3mZbxTZaNwY7GNhr7zySnj9d6u03rWi"
+    b"90Mfc1f1OnnCBdDPwjvs/vv4+ScZcFv8E92UP/Gfman5V3h7+wfgXv7F827xD/hRt+YfLwCBj/IvGwj4MjOlz8GDDXxVv37deCAA"
+    b"/+rb7MCHfEdqeA0HstwHhnv4Hxawf9ZV3aNQ9+jOgm8X8KvplrzHjGW+bf7H6v4r3e+98K/0cYAnO2j/wleF/fcJj3/HD6Bvzp9d"
+    b"ANevPwv4mP9Bg4L0P2BAoP4tnT/v4n4g9DIGa/7LYIynwX9ZmcK7UvwPcfkfGqx/Z8/yux+MByzfBy7/dt6e/pWuHhjj47+7j89K"
+    b"6dnZ5j6OLzsbj+R49uzsnJyc7uONfRzvOeNhoiOeceOqv/8JNv8ZeANMcPBG/5nof5CKkxxQeCt++5s+7933g+vzXvTJkz38a/zL"
+    b"ytz+1edfZMv9EJL//Px80t/k/abqX9Vt9O97P/j6n+XpfxYO8uzZw4bNmTNn+PC5c+eOGDFvHvM/ys+/7/3wsu2ApqdbDvGDPl6F"
+    b"9XzttddcvKif8dhfDXvPtvZxFe3j9P8BLL/Wm1XElZ0NuHJyANf48c+9+upzpKOuCZ7+J0wwHOB9AhvWiRNJnzQJ+uuvQ8/NFX3C"
+    b"RLK/4ybBXsfl5uZO0A+IPsnZAd9E9A19IOTMTOiDcnMJTYaz/3X9eUefk9kw5+Xx533KFMxTlT4ZMxxA3VNwU2HTpk0TfTLmPOaf"
+    b"dTgA9qAJnGV8gG8q981s8ue/rOzGjRvCfz4dwYt6p0+/cYP2mTOh54tBhk2HzYDdnIkrKJA9X/TpN2G3aFd0Kzhv4aTvWV7+Z3G8"
+    b"RO8w1Dsc9RK+I2eJQYaB7jlzcfNw8+fLPmu2+8D8+S7+wfr/BxvkBQsWjB69cCHkRYsgv/WW9H/PfYfRf46H/2xnBzmkIq7sbMCT"
+    b"kzNpEvTXZRc4HfpUf+YDik+/7ut/oo//vDxxYIrSVZx5eW/gBF/Vr183HnD7zyMPvPID4I5msAdZ+Ad8U6cWFEzTcBKdhPcNxrcg"
+    b"33hgxgxXV3iD/ps3XV0eQP23mP9Z8ukFvogP8N6imz9f+pQ4Nb7zZ1kOuLqJt8H/HId/blfoXYh6F6Fe4Pv225z3ArKFuEW4t3Bv"
+    b"y+48wHtV+c2uqN+Kdrv/CYy/h28X70nVzT/ag/6G8D8V+rSq9//GG2VO//lUP8VH9RPf6L9A0+3wX6D4fVPlPcPg/039eb9pvh+o"
+    b"f6Jb9T9b10v531b8z55t1Om8H2bb74dZ5gvE6n+e4p/hNfB++x8+B4LzH5DfnMrole4fn3eLf673XvqfWDH/edQ/4AT+U+ACmEr8"
+    b"T8u16K1E//oPqLq5f8Z7aoHd/0wf/zcr4p8979L/bLf/2zCzf413yN8Hcz2+D1z+FwTt39mt3wc2n+N9/Ia7j1vi2RcvXrIETyx1"
+    b"9sV8S8iWLoUTy5YZ+kTely5dBlu+fDn3T2ol+59YUf8rLP4BHlaJD/kT/1PR/zSv51/xG+D3gTzg7GvW+Puf7v68L8g3HFCed8P9"
+    b"MH0G5z3TdT+4Pu9FLywkfaPkL/27+d+mEz5dzz/W3/y+D4LwvxUGeds2yNu3Q94xb96dO3eof42/0b/v/WD17+JDeaCP5cvfeeed"
+    b"qu1LrH1x4H2psS/26RPJBfF3Zyf2Vqg6Fb/v5eauoFMPrMK+ejX2995jfcVKsndxq3CrcUpXDpj7CsMPaD3P/QPQ19ARm2sR5/uK"
+    b"/w3Tpq0RB9bi3oetw63HbdiwYY2Y6PKAu7t+IJ9VxLd2Lfe/bh3gW7++oGBDIZ3AOX0TPu+bUe8H6L+wUJzYCJu+adMm8L1588wP"
+    b"YFu2bBG9cCMZ9E1E9wf0QKHjgOi3bpOu8Bc4b99W/G9lNFEn9u2M/28w6Fv5EC/w3Q6bu2PHjt9I37lzqxz2bdh34D788MM7d7Tu"
+    b"OAD8y8t3Sv0uveXl1PeuXbuUAx9h/xj7HvS/i2/Bgt2whR/BFn38MRzYswcO7P3d+A7M/xJrBzuQ38W+Cvpq1r34Kv5W+vkOwv+7"
+    b"gXS3/7Ve/teuNfBV/fp144EA/BcWsgz2IG/aBH3z5nXrAN/69Vu2bNDwEp2bNuM+cPqWB8y90PADW6z+ATA9oMij9gCf8L9T+tQO"
+    b"MN6/Kd19AICrXTnAeTv86z+A+sE/xbubDvF+9DEO8O7BXs55mw7s2bt37y7LAd4D9RnGvrRSfJsuIA//y6Rvph/9Ax7gvwouANCz"
+    b"fLnwtbL6+wdc0N/Hvg77eugbqoN/cgNIvchf+t/i5X+L4jeI+8HiXz1wW/e/TfdPLwDCe+dW0wVh8L9tm+t5N/nfHrD/8nLFt83/"
+    b"3bu7PA7sDc3/0lD8Lqlsv4H1JdZOnnejf7gB/Hy7+qpw+18Zov81Qj/6B3zAfx1cAIAP/G+oFv65bofO9Vuc/t28K8U/VM2/xp/6"
+    b"57x3ml934v/DnfbvA/55b/0+IP7Lzd8HTv+7d5t4A/673P9u2/O/1+/7wOZ3mY/vYHtFfX9SVFQEfR/2T5X+CV8Rbsm+fXDiUzyw"
+    b"39FXkgP7cJ/C9sOWHziA/kmVuvahrk/t/t+tEv/O9/2gzT/s4MGDEt/hw4DvCPpfv1r4VPkbfQd4P9j9Hztm96/xN/re6Off998H"
+    b"G338Hz9O+gnnDyj8HbxV/+4D7Hm3fR/w593qn33e834aBvnMGcjffiv5l5v5I9+7vv4h793lc0FofCQP4mP/gQMHwtuLrP2TwPu+"
+    b"kPonhv+B7l7k7Adx/IIoOnwY7ocjR+B+OHr06OrPYAfpDtEdxh3BHcXJftCvKwfM/aDhB9z9kLMfo/uc7p+4L2Bf4r6CHTumneBd"
+    b"HDB0eUDtlh+Q/dgJ7QdOYj/11XG2jSdwX+O+wZ3EnTp1ivfjJ8QBczcd0Ppx/b+B/QCDh0N7FN93hP/Jkzt3nj3NBjRhkOHAd7D/"
+    b"xZ09K/pp0s9g/9bY2QnevyO6ta4fKCef93e//17w/wHx/oh4f/qJ84dOhhn20Y8wyHDg3LlzSodh/wH7j9h/gn7u/PnzvxvfRaH5"
+    b"FvnQIdGPOP3b+VaG/8Oh+f/ceIFY/H/h9G/qYfUP9rB/Df2bb5j/U8L/iRMG/6eC9/91KP45XqmX8D15VvFrOhCc/zO6f3bAxJ/6"
+    b"V33/8INbr+b/e8MBOHH+/PeWA+eM/otC9l10r30Xhfq+c/54AQAe4H8ELgDAs3//Z595+j9alf4P+fj/nPj/J/YvsH8J/auvPP1/"
+    b"WQX+wR3Tj/7BHvIH/4AP/Z8K1P+JwL8PLP5P2P2fOWPjffa0xwXhvh/O2O+H0+b/Bqt/yvusyt/Dv+kA8jb5/0n1/389fhfn"
+)
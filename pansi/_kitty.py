@@ -19,11 +19,23 @@
 """ Functionality specific to the Kitty Terminal Emulator
 """
 
+from base64 import b64encode
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from os import environ as os_environ, name as os_name
 from re import compile as re_compile
+from sys import version_info
+from uuid import uuid4
+from zlib import compress as zlib_compress
 
 from ._codes import APC, CSI, ST
 
 
+# Maximum size of the payload in a single graphics command, in bytes of
+# base64-encoded data
+CHUNK_SIZE = 4096
+
+
 def get_kitty_info(terminal):
     info = {}
     identifier = 31
@@ -38,9 +50,107 @@ def get_kitty_info(terminal):
     try:
         terminal.write(f"{APC}Gi={identifier},s=1,v=1,a=q,t=d,f=24;AAAA{ST}{CSI}c")
         terminal.flush()
-        match = terminal.loop(break_key=re_compile(r"\x1B\[\?((\d*)(;(\d*))*)c"))
+        match = terminal.loop(break_key=re_compile(r"\x1B\[\?((\d*)(;(\d*))*)c"),
+                              timeout=terminal._response_timeout)
         if match:
             info["emulation_level"] = int(match.group(2))
         return info
     finally:
         terminal.remove_event_listener("__apc__", on_apc)
+
+
+def is_local_kitty(environ=None) -> bool:
+    """ Return true if the process appears to be running directly within
+    kitty on the same host, in which case the terminal can read pixel
+    data from shared memory. This requires positive evidence of kitty
+    (``KITTY_WINDOW_ID``), and no sign of an SSH session or of tmux in
+    between.
+    """
+    if environ is None:
+        environ = os_environ
+    if "KITTY_WINDOW_ID" not in environ:
+        return False
+    return not any(key in environ for key in ("SSH_CONNECTION", "SSH_CLIENT", "SSH_TTY", "TMUX"))
+
+
+def graphics_command(controls, payload=b"") -> str:
+    """ Return a graphics protocol command, built from a dictionary of
+    control keys and an (already base64-encoded) payload.
+    """
+    keys = ",".join(f"{key}={value}" for key, value in controls.items())
+    if payload:
+        return f"{APC}G{keys};{payload.decode('ascii')}{ST}"
+    else:
+        return f"{APC}G{keys}{ST}"
+
+
+def transmit_direct(data, width, height, /, pixel_format=24, compress=False, **controls) -> [str]:
+    """ Return the graphics commands that transmit raw RGB (`pixel_format`
+    24) or RGBA (`pixel_format` 32) pixel data within the escape codes
+    themselves, which works over any connection, including SSH. The data
+    is optionally compressed with zlib, and the encoded payload is split
+    into chunks of no more than :data:`CHUNK_SIZE` bytes.
+
+    By default, the image is transmitted and displayed at the cursor
+    position (``a=T``), and responses from the terminal are suppressed
+    (``q=2``); either can be overridden by passing other `controls`.
+    """
+    controls = {"a": "T", "q": 2, "f": pixel_format, "s": width, "v": height, **controls}
+    if compress:
+        data = zlib_compress(data)
+        controls["o"] = "z"
+    encoded = b64encode(data)
+    chunks = [encoded[i:i + CHUNK_SIZE] for i in range(0, len(encoded), CHUNK_SIZE)] or [b""]
+    commands = [graphics_command(dict(controls, m=int(len(chunks) > 1)), chunks[0])]
+    # Only the first chunk carries the full set of control keys
+    continuation = {"q": controls["q"]} if "q" in controls else {}
+    for n, chunk in enumerate(chunks[1:], start=2):
+        commands.append(graphics_command(dict(continuation, m=int(n < len(chunks))), chunk))
+    return commands
+
+
+def transmit_shared_memory(data, width, height, /, pixel_format=24, **controls) -> [str]:
+    """ Return the graphics command that transmits raw pixel data through
+    a POSIX shared memory object, which avoids encoding the image at all,
+    but which only works where the terminal runs on the same host. The
+    shared memory object is created here, and removed by the terminal
+    once it has been read.
+    """
+    # The terminal unlinks the object once it has read it. The resource
+    # tracker would otherwise unlink it too when this process exits, which
+    # can happen before the terminal gets to read it, so the object must
+    # not be tracked.
+    untracked = version_info >= (3, 13)
+    memory = SharedMemory(f"pansi-{uuid4().hex[:16]}", create=True, size=len(data),
+                          **({"track": False} if untracked else {}))
+    # POSIX shared memory object names start with a slash, which the name
+    # attribute omits
+    name = f"/{memory.name}" if os_name == "posix" else memory.name
+    if not untracked and os_name == "posix":
+        resource_tracker.unregister(name, "shared_memory")
+    try:
+        memory.buf[:len(data)] = data
+    finally:
+        memory.close()
+    controls = {"a": "T", "q": 2, "f": pixel_format, "s": width, "v": height, "t": "s", "S": len(data),
+                **controls}
+    return [graphics_command(controls, b64encode(name.encode("utf-8")))]
+
+
+def transmit(data, width, height, /, pixel_format=24, medium="auto", compress=False, **controls) -> [str]:
+    """ Return the graphics commands that transmit raw pixel data, using
+    either the 'direct' or 'shared-memory' `medium`. With the 'auto'
+    medium, shared memory is used only where the terminal is known to be
+    a local kitty (see :func:`is_local_kitty`), since a shared memory
+    object that the terminal never reads is left behind; otherwise, data
+    is transmitted directly. Compression applies only to direct
+    transmission.
+    """
+    if medium == "auto":
+        medium = "shared-memory" if data and is_local_kitty() else "direct"
+    if medium == "direct":
+        return transmit_direct(data, width, height, pixel_format=pixel_format, compress=compress, **controls)
+    elif medium == "shared-memory":
+        return transmit_shared_memory(data, width, height, pixel_format=pixel_format, **controls)
+    else:
+        raise ValueError(f"Unknown transmission medium {medium!r}")
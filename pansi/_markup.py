@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from functools import lru_cache
+from re import compile as re_compile
+from string import Formatter
+
+from ._sgr import SGR, reset
+from ._style import Style
+
+
+# Either a format field (which may itself contain square brackets), an
+# escaped "[[", or a tag such as "[bold red]" or "[/]"
+_TOKEN = re_compile(r"\{\{|\{[^{}]*\}|\[\[|\[(/?)([^\[\]]*)\]")
+
+_FORMATTER = Formatter()
+
+_KEYWORDS = {
+    "bold": ("font_weight", "bold"),
+    "light": ("font_weight", 300),
+    "dim": ("font_weight", 300),
+    "italic": ("font_style", "italic"),
+    "underline": ("text_decoration", "underline"),
+    "double": ("text_decoration", "double"),
+    "blink": ("text_decoration", "blink"),
+    "line-through": ("text_decoration", "line-through"),
+    "overline": ("text_decoration", "overline"),
+}
+
+
+class Markup:
+    r""" Markup template, compiled from a string containing style tags and
+    format fields.
+
+    Tags are enclosed in square brackets, and contain space-separated style
+    words: colour names or hex values (optionally preceded by ``on`` to
+    select a background colour), and the keywords ``bold``, ``light`` (or
+    ``dim``), ``italic``, ``underline``, ``double``, ``blink``,
+    ``line-through`` and ``overline``. The tag ``[/]`` closes the most
+    recently opened tag, and any tags still open at the end of the template
+    are closed automatically. A literal ``[`` can be written as ``[[``.
+
+    Format fields are as for :meth:`str.format`.
+
+    Compilation resolves all tags into escape sequences up front, leaving a
+    sequence of literal strings and field slots. Formatting then only fills
+    the slots and joins the result. RGB colours are resolved at the given
+    `color_depth` (24, 8 or 4 bits), as for :class:`TerminalOutput`.
+
+    >>> Markup("[bold red]{name}[/] ok").format(name="disk")
+    '\x1b[91m\x1b[1mdisk\x1b[0m ok'
+    """
+
+    def __init__(self, source, color_depth=24):
+        self._source = source
+        self._parts = []
+        self._slots = []
+        stack = []
+        text = []
+        pos = 0
+        for match in _TOKEN.finditer(source):
+            token = match.group()
+            text.append(source[pos:match.start()])
+            pos = match.end()
+            if token[0] == "{":
+                text.append(token)
+                continue
+            elif token == "[[":
+                text.append("[")
+                continue
+            self._add_text("".join(text))
+            text.clear()
+            if match.group(1):
+                if not stack:
+                    raise ValueError(f"Unbalanced closing tag at position {match.start()} in {source!r}")
+                stack.pop()
+                self._parts.append(str(reset) + "".join(stack))
+            else:
+                prefix = _tag_style(match.group(2)).prefix(color_depth)
+                stack.append(prefix)
+                self._parts.append(prefix)
+        text.append(source[pos:])
+        self._add_text("".join(text))
+        if stack:
+            self._parts.append(str(reset))
+        self._merge_literals()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._source!r})"
+
+    def __str__(self):
+        return self.format()
+
+    def _add_text(self, text):
+        # Split text into literals and format fields
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(text):
+            if literal:
+                self._parts.append(literal)
+            if field_name is not None:
+                self._slots.append((len(self._parts), _Slot(field_name, conversion, format_spec)))
+                self._parts.append(None)
+
+    def _merge_literals(self):
+        parts = []
+        slots = []
+        for i, part in enumerate(self._parts):
+            if part is None:
+                slots.append(len(parts))
+                parts.append(None)
+            elif parts and parts[-1] is not None:
+                parts[-1] += part
+            else:
+                parts.append(part)
+        self._slots = list(zip(slots, (slot for _, slot in self._slots)))
+        self._parts = parts
+        # Number automatic fields, as str.format would
+        auto = 0
+        for _, slot in self._slots:
+            if slot.key == "":
+                slot.key = auto
+                auto += 1
+
+    def format(self, *args, **kwargs) -> str:
+        """ Fill the format fields of this template from the given
+        arguments, returning the final string.
+        """
+        parts = self._parts
+        if not self._slots:
+            return "".join(parts)
+        parts = list(parts)
+        for i, slot in self._slots:
+            parts[i] = slot.render(args, kwargs)
+        return "".join(parts)
+
+
+class _Slot:
+
+    __slots__ = ("key", "field_name", "conversion", "format_spec")
+
+    def __init__(self, field_name, conversion, format_spec):
+        self.field_name = field_name
+        if field_name.isdigit():
+            self.key = int(field_name)
+        elif field_name.isidentifier() or field_name == "":
+            self.key = field_name
+        else:
+            self.key = None  # compound field, such as "x.y" or "x[0]"
+        self.conversion = conversion
+        self.format_spec = format_spec
+
+    def render(self, args, kwargs) -> str:
+        key = self.key
+        if key is None:
+            value, _ = _FORMATTER.get_field(self.field_name, args, kwargs)
+        elif isinstance(key, int):
+            value = args[key]
+        else:
+            value = kwargs[key]
+        if self.conversion:
+            value = _FORMATTER.convert_field(value, self.conversion)
+        format_spec = self.format_spec
+        if "{" in format_spec:
+            # nested fields, such as "{x:{width}}"
+            format_spec = _FORMATTER.vformat(format_spec, args, kwargs)
+        return format(value, format_spec)
+
+
+def _tag_style(tag) -> Style:
+    """ Convert the words of a markup tag into a :class:`Style`.
+    """
+    properties = {}
+    decorations = []
+    words = iter(tag.split())
+    for word in words:
+        if word in _KEYWORDS:
+            key, value = _KEYWORDS[word]
+            if key == "text_decoration":
+                decorations.append(value)
+            else:
+                properties[key] = value
+        elif word == "on":
+            properties["background_color"] = _color_word(next(words, ""), tag)
+        else:
+            properties["color"] = _color_word(word, tag)
+    if decorations:
+        properties["text_decoration"] = " ".join(decorations)
+    return Style(**properties)
+
+
+def _color_word(word, tag) -> str:
+    try:
+        SGR.for_color(word)
+    except ValueError:
+        raise ValueError(f"Unrecognised style {word!r} in markup tag [{tag}]")
+    else:
+        return word
+
+
+@lru_cache(maxsize=256)
+def compile_markup(source, color_depth=24) -> Markup:
+    """ Compile a markup template, caching the result so that each
+    distinct template is compiled only once for each colour depth.
+    """
+    return Markup(source, color_depth)
+
+
+def markup(source, /, *args, color_depth=24, **kwargs) -> str:
+    r""" Render a markup template with the given format arguments, using a
+    cached compiled form of the template. See :class:`Markup` for the
+    syntax. RGB colours are resolved at the given `color_depth`, which
+    should usually be that of the output, such as
+    :attr:`TerminalOutput.color_depth`.
+
+    >>> markup("[[{0}] [green]ok[/]", 200)
+    '[200] \x1b[32mok\x1b[0m'
+    >>> markup("[#FF8000]{}[/]", "warm", color_depth=4)
+    '\x1b[91mwarm\x1b[0m'
+    """
+    return compile_markup(source, color_depth).format(*args, **kwargs)
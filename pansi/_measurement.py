@@ -19,12 +19,23 @@
 # TODO: rename this module
 
 
-from collections import namedtuple
-from io import StringIO
+from bisect import bisect_right
 from re import compile as re_compile
-from unicodedata import category, east_asian_width
 
-from ._codes import BS, HT, ESC, DEL, CSI, APC, UNICODE_NEWLINES
+from ._codes import BS, HT, CSI, UNICODE_NEWLINES, _CONTROL_UNIT
+from ._sgr import reset
+from ._style import Style
+from ._unicode_tables import (
+    WIDTH_STARTS, WIDTHS, GRAPHEME_BREAK_STARTS, GRAPHEME_BREAKS,
+    GCB_CR, GCB_LF, GCB_CONTROL, GCB_EXTEND, GCB_ZWJ, GCB_REGIONAL_INDICATOR, GCB_PREPEND,
+    GCB_SPACING_MARK, GCB_L, GCB_V, GCB_T, GCB_LV, GCB_LVT, GCB_EXTENDED_PICTOGRAPHIC,
+)
+
+
+# Variation selectors, which request emoji or text presentation of the
+# preceding character
+_EMOJI_PRESENTATION = "\uFE0F"
+_TEXT_PRESENTATION = "\uFE0E"
 
 
 class Rect(tuple):
@@ -82,6 +93,8 @@ def measure_text(text, tab_size: int = 8) -> [int]:
     - Regular characters occupy one cell
     - Non-printable characters and escape sequences occupy zero cells
     - Full width characters occupy two cells
+    - Grapheme clusters (such as a character with combining marks, or an
+      emoji ZWJ sequence) are measured as a whole
 
     >>> measure_text("hello, world")
     [12]
@@ -94,69 +107,410 @@ def measure_text(text, tab_size: int = 8) -> [int]:
     >>> measure_text("hello\nworld")
     [5, 5]
     """
-    from ._term import TerminalInput
-    tin = TerminalInput(StringIO(text))
+    if text.isascii() and text.isprintable():
+        # Fast path for the most common case: plain ASCII text, with no
+        # escape sequences or other control characters, on a single line.
+        return [len(text)]
     measurements = []
     cursor = 0
-    while True:
-        char_unit = tin.read(1)
-        if not char_unit:
-            break
-        # Measurement can generally be taken by looking at only the
-        # first character in a sequence. But C1 control codes might
-        # be represented in expanded ESC+X form, so we should
-        # normalise those.
-        first_char = char_unit[0]
-        if first_char == ESC and len(char_unit) > 1:
-            second_char = char_unit[1]
-            if "@" <= second_char <= "_":
-                # collapse 7-bit C1 control codes to 8-bit equivalents
-                first_char = chr(0x40 + ord(second_char))
-        # Now, check specific edge cases and fall back to checking the
-        # Unicode general category.
-        if first_char in UNICODE_NEWLINES:
+    pos = 0
+    for match in _CONTROL_UNIT.finditer(text):
+        start = match.start()
+        if start > pos:
+            cursor += _measure_printable(text[pos:start])
+        pos = match.end()
+        char_unit = match.group()
+        if char_unit in UNICODE_NEWLINES:
             # This detects:
-            # - CR, LF, CRLF (CRLF will be tested as CR, but whatever)
+            # - CR, LF, CRLF
             # - NEL (both 7-bit and 8-bit representations)
             # - VT, FF
             # - LS, PS
             measurements.append(cursor)
             cursor = 0
-        elif first_char == BS:
+        elif char_unit == BS:
             if cursor > 0:
                 cursor -= 1
-            # width = -1
-        elif first_char == HT:
+        elif char_unit == HT:
             # Advance to next multiple of tab_size. This formula should
             # only ever return values between 1 and tab_size inclusive.
             advance = tab_size - (cursor % tab_size)
             cursor += advance
-        elif first_char < " ":
-            # Other control characters do not affect the cursor:
-            # - NUL, BEL, CAN, EM, SUB, ESC
-            # - TC (SOH, STX, ETX, EOT, ENQ, ACK, DLE, NAK, SYN, ETB)
-            # - LS (SI, SO)
-            # - DC (DC1, DC2, DC3, DC4)
-            # - IS (FS, GS, RS, US)
-            pass  # no advance
-        elif first_char <= "~":
-            # Anything else in ASCII range is printable and one cell wide.
-            cursor += 1
-        elif DEL <= first_char <= APC:
-            # TODO: this isn't true for all of these
-            pass  # no advance
         else:
-            # For everything else, check the Unicode general category.
-            major, minor = category(first_char)
-            is_printable = major in {'L', 'N', 'P', 'S'} or (major, minor) == ('Z', 's')
-            if is_printable:
-                cursor += (2 if east_asian_width(first_char) in {'F', 'W'} else 1)
-            else:
-                pass  # not printable, so no visible size
+            # Other control characters and escape sequences do not
+            # affect the cursor.
+            pass  # no advance
+    if pos < len(text):
+        cursor += _measure_printable(text[pos:])
     measurements.append(cursor)
     return measurements
 
 
+def char_width(ch) -> int:
+    """ Return the number of cells (0, 1 or 2) occupied by a single
+    character, as defined by the Unicode tables in :mod:`pansi._unicode_tables`.
+    Control characters are treated as zero width.
+
+    >>> char_width("a")
+    1
+    >>> char_width("ｗ")
+    2
+    """
+    return _width_cache[ch]
+
+
+class _PropertyCache(dict):
+    """ Memo of per-character property values, looked up on demand from a
+    pair of range tables.
+    """
+
+    def __init__(self, starts, values):
+        super().__init__()
+        self._starts = starts
+        self._values = values
+
+    def __missing__(self, ch):
+        value = self[ch] = self._values[bisect_right(self._starts, ord(ch)) - 1]
+        return value
+
+
+_width_cache = _PropertyCache(WIDTH_STARTS, WIDTHS)
+_grapheme_break_cache = _PropertyCache(GRAPHEME_BREAK_STARTS, GRAPHEME_BREAKS)
+
+# Grapheme_Cluster_Break values of characters that can join with a
+# neighbour to form a multi-character grapheme cluster. Text containing none
+# of these can be treated as one cluster per character.
+_JOINING_GRAPHEME_BREAKS = {GCB_CR, GCB_EXTEND, GCB_ZWJ, GCB_REGIONAL_INDICATOR, GCB_PREPEND,
+                            GCB_SPACING_MARK, GCB_L, GCB_V, GCB_T}
+
+
+def _has_joining_chars(text) -> bool:
+    return any(_grapheme_break_cache[ch] in _JOINING_GRAPHEME_BREAKS for ch in set(text))
+
+
+def _split_graphemes(text) -> [str]:
+    """ Split text into extended grapheme clusters, following the rules in
+    UAX #29 (https://www.unicode.org/reports/tr29/#Grapheme_Cluster_Boundary_Rules).
+    """
+    clusters = []
+    start = 0
+    prev = None
+    ri_count = 0        # number of consecutive RIs before this character
+    emoji_state = 0     # 1 after ExtPict Extend*, 2 after ExtPict Extend* ZWJ
+    for i, ch in enumerate(text):
+        prop = _grapheme_break_cache[ch]
+        if prev is None:
+            pass
+        elif prev == GCB_CR and prop == GCB_LF:
+            pass                                                        # GB3
+        elif prev in (GCB_CONTROL, GCB_CR, GCB_LF) or prop in (GCB_CONTROL, GCB_CR, GCB_LF):
+            clusters.append(text[start:i])                              # GB4, GB5
+            start = i
+        elif ((prev == GCB_L and prop in (GCB_L, GCB_V, GCB_LV, GCB_LVT))   # GB6
+              or (prev in (GCB_LV, GCB_V) and prop in (GCB_V, GCB_T))       # GB7
+              or (prev in (GCB_LVT, GCB_T) and prop == GCB_T)               # GB8
+              or prop in (GCB_EXTEND, GCB_ZWJ, GCB_SPACING_MARK)            # GB9, GB9a
+              or prev == GCB_PREPEND                                        # GB9b
+              or (emoji_state == 2 and prop == GCB_EXTENDED_PICTOGRAPHIC)   # GB11
+              or (prop == GCB_REGIONAL_INDICATOR and ri_count % 2 == 1)):   # GB12, GB13
+            pass
+        else:
+            clusters.append(text[start:i])                              # GB999
+            start = i
+        if prop == GCB_EXTENDED_PICTOGRAPHIC:
+            emoji_state = 1
+        elif prop == GCB_ZWJ and emoji_state == 1:
+            emoji_state = 2
+        elif prop != GCB_EXTEND or emoji_state != 1:
+            emoji_state = 0
+        ri_count = ri_count + 1 if prop == GCB_REGIONAL_INDICATOR else 0
+        prev = prop
+    if start < len(text):
+        clusters.append(text[start:])
+    return clusters
+
+
+def _cluster_width(cluster) -> int:
+    """ Measure a single grapheme cluster. This is the width of the widest
+    character within the cluster, except where presentation selectors or
+    regional indicator pairs (flags) dictate otherwise.
+    """
+    if len(cluster) == 1:
+        return _width_cache[cluster]
+    first = _grapheme_break_cache[cluster[0]]
+    if first == GCB_REGIONAL_INDICATOR:
+        return 2 if _grapheme_break_cache[cluster[1]] == GCB_REGIONAL_INDICATOR else 1
+    elif _EMOJI_PRESENTATION in cluster:
+        return 2
+    elif _TEXT_PRESENTATION in cluster and first == GCB_EXTENDED_PICTOGRAPHIC:
+        return 1
+    else:
+        return max(map(_width_cache.__getitem__, cluster))
+
+
+def _measure_printable(text) -> int:
+    """ Measure a run of text, containing no control characters or escape
+    sequences.
+    """
+    if text.isascii():
+        return len(text)
+    elif not _has_joining_chars(text):
+        return sum(map(_width_cache.__getitem__, text))
+    else:
+        return sum(map(_cluster_width, _split_graphemes(text)))
+
+
+def _segment_printable(text) -> [(str, int)]:
+    if text.isascii():
+        return [(ch, 1) for ch in text]
+    elif not _has_joining_chars(text):
+        return [(ch, _width_cache[ch]) for ch in text]
+    else:
+        return [(cluster, _cluster_width(cluster)) for cluster in _split_graphemes(text)]
+
+
+def segment_cells(text, tab_size: int = 8) -> [(str, int)]:
+    r""" Split text into units that each occupy a whole number of cells,
+    returning a list of (unit, width) pairs.
+
+    Printable text is split into extended grapheme clusters, as defined by
+    UAX #29, so that combining marks, emoji sequences and flags are each
+    kept together as a single unit. Escape sequences, newlines and other
+    control characters are returned as zero width units, except for
+    horizontal tabs, which are given the width of their advance.
+
+    >>> segment_cells("e\u0301!")
+    [('é', 1), ('!', 1)]
+    >>> segment_cells("\x1b[32m\U0001F1EC\U0001F1E7\x1b[0m")
+    [('\x1b[32m', 0), ('🇬🇧', 2), ('\x1b[0m', 0)]
+    """
+    cells = []
+    cursor = 0
+    pos = 0
+    for match in _CONTROL_UNIT.finditer(text):
+        start = match.start()
+        if start > pos:
+            segments = _segment_printable(text[pos:start])
+            cells.extend(segments)
+            cursor += sum(width for _, width in segments)
+        pos = match.end()
+        char_unit = match.group()
+        if char_unit in UNICODE_NEWLINES:
+            cells.append((char_unit, 0))
+            cursor = 0
+        elif char_unit == HT:
+            advance = tab_size - (cursor % tab_size)
+            cells.append((char_unit, advance))
+            cursor += advance
+        else:
+            cells.append((char_unit, 0))
+    if pos < len(text):
+        cells.extend(_segment_printable(text[pos:]))
+    return cells
+
+
+def _is_control(unit, width) -> bool:
+    """ Check whether a unit returned from segment_cells is an escape
+    sequence or control character, rather than printable text.
+    """
+    return width == 0 and not unit.isprintable()
+
+
+def _is_sgr(unit) -> bool:
+    return unit.startswith(CSI) and unit.endswith("m")
+
+
+def _update_sgr_state(state, unit):
+    """ Update a list of active SGR sequences with a new SGR sequence.
+    Sequences that begin with a reset clear all previous state.
+    """
+    parameters = unit[len(CSI):-1]
+    first, _, rest = parameters.partition(";")
+    if first in {"", "0"}:
+        state.clear()
+        if rest:
+            state.append(f"{CSI}{rest}m")
+    else:
+        state.append(unit)
+
+
+def _split_cell_lines(text, tab_size=8) -> [([(str, int)], str)]:
+    """ Split text into lines of (unit, width) cells, each paired with the
+    newline unit that terminates it (or an empty string for the final line).
+    """
+    lines = []
+    line = []
+    for unit, width in segment_cells(text, tab_size):
+        if unit in UNICODE_NEWLINES:
+            lines.append((line, unit))
+            line = []
+        else:
+            line.append((unit, width))
+    lines.append((line, ""))
+    return lines
+
+
+def wrap_text(text, width: int, tab_size: int = 8) -> [str]:
+    r""" Wrap text to a given display width, returning a list of lines.
+
+    Lines are broken at spaces where possible; words wider than the full
+    width are broken wherever necessary. Existing newlines are preserved as
+    hard breaks, and tabs are expanded to spaces.
+
+    Any SGR styles active at a line break are reset at the end of that line
+    and re-established at the start of the next, so that each line can be
+    rendered independently.
+
+    >>> wrap_text("hello, world", 8)
+    ['hello,', 'world']
+    >>> wrap_text("\x1b[32mhello, world\x1b[0m", 8)
+    ['\x1b[32mhello,\x1b[0m', '\x1b[32mworld\x1b[0m']
+    """
+    width = max(1, width)
+    lines = []
+    state = []          # SGR sequences active at the current position
+    line_state = []     # SGR sequences active at the start of the line
+    parts = []          # units making up the current line
+    line_width = 0
+    opportunity = None  # (index into parts, width, state) after last space
+
+    def end_line(end, state_at_end):
+        nonlocal parts, line_state, opportunity
+        content = parts[:end]
+        while content and content[-1] == " ":
+            content.pop()
+        if state_at_end:
+            content.append(str(reset))
+        lines.append("".join(line_state + content))
+        line_state = list(state_at_end)
+        parts = parts[end:]
+        opportunity = None
+
+    for unit, unit_width in segment_cells(text, tab_size):
+        if unit in UNICODE_NEWLINES:
+            end_line(len(parts), state)
+            line_width = 0
+        elif _is_control(unit, unit_width):
+            parts.append(unit)
+            if _is_sgr(unit):
+                _update_sgr_state(state, unit)
+        elif unit == " " or unit == HT:
+            for _ in range(tab_size - (line_width % tab_size) if unit == HT else 1):
+                if line_width + 1 > width:
+                    end_line(len(parts), state)
+                    line_width = 0
+                else:
+                    parts.append(" ")
+                    line_width += 1
+                    opportunity = (len(parts), line_width, list(state))
+        else:
+            if line_width + unit_width > width and line_width > 0:
+                if opportunity:
+                    end, break_width, break_state = opportunity
+                    end_line(end, break_state)
+                    line_width -= break_width
+                else:
+                    end_line(len(parts), state)
+                    line_width = 0
+            parts.append(unit)
+            line_width += unit_width
+    end_line(len(parts), state)
+    return lines
+
+
+def truncate(text, width: int, ellipsis: str = "…", tab_size: int = 8) -> str:
+    r""" Truncate each line of text to a given display width. Lines that
+    are cut short end with the `ellipsis` string, which is counted as part
+    of the width.
+
+    Escape sequences are never removed, so styles applied (or reset) beyond
+    the point of truncation still take effect.
+
+    >>> truncate("hello, world", 8)
+    'hello, …'
+    """
+    ellipsis_width = sum(measure_text(ellipsis))
+    out = []
+    for cells, newline in _split_cell_lines(text, tab_size):
+        if sum(w for _, w in cells) <= width:
+            out.extend(unit for unit, _ in cells)
+        else:
+            limit = max(0, width - ellipsis_width)
+            line_width = 0
+            truncated = False
+            for unit, unit_width in cells:
+                if truncated:
+                    if _is_control(unit, unit_width):
+                        out.append(unit)
+                elif line_width + unit_width > limit:
+                    truncated = True
+                    out.append(ellipsis)
+                    if _is_control(unit, unit_width):
+                        out.append(unit)
+                else:
+                    out.append(unit)
+                    line_width += unit_width
+        out.append(newline)
+    return "".join(out)
+
+
+def clip(text, start: int, end: int, tab_size: int = 8) -> str:
+    r""" Cut each line of text to the span of display columns from `start`
+    (inclusive) to `end` (exclusive). Wide characters that straddle either
+    edge of the span are replaced with spaces for the part that remains
+    visible, and tabs are expanded to spaces.
+
+    As with :func:`truncate`, escape sequences are never removed.
+
+    >>> clip("hello, world", 2, 9)
+    'llo, wo'
+    >>> clip("日本語", 1, 5)
+    ' 本 '
+    """
+    out = []
+    for cells, newline in _split_cell_lines(text, tab_size):
+        column = 0
+        for unit, unit_width in cells:
+            if _is_control(unit, unit_width):
+                out.append(unit)
+                continue
+            unit_start = column
+            column += unit_width
+            if start <= unit_start and column <= end:
+                out.append(" " * unit_width if unit == HT else unit)
+            else:
+                overlap = min(column, end) - max(unit_start, start)
+                if overlap > 0:
+                    out.append(" " * overlap)
+        out.append(newline)
+    return "".join(out)
+
+
+def pad(text, width: int, align: str = "left", fillchar: str = " ", tab_size: int = 8) -> str:
+    r""" Pad each line of text to a given display width, aligning the
+    content to the left, right or center. Lines already at or above the
+    given width are left unchanged.
+
+    >>> pad("\x1b[32mhello\x1b[0m", 8, align="right")
+    '   \x1b[32mhello\x1b[0m'
+    """
+    out = []
+    for cells, newline in _split_cell_lines(text, tab_size):
+        content = "".join(unit for unit, _ in cells)
+        padding = width - sum(w for _, w in cells)
+        if padding <= 0:
+            out.append(content)
+        elif align == "right":
+            out.append(fillchar * padding + content)
+        elif align == "center":
+            left = padding // 2
+            out.append(fillchar * left + content + fillchar * (padding - left))
+        else:
+            out.append(content + fillchar * padding)
+        out.append(newline)
+    return "".join(out)
+
+
 class Cursor(Measurable):
 
     def __init__(self, terminal):
@@ -201,75 +555,386 @@ class Cursor(Measurable):
     #     self._terminal.write(f"{CSI}{line};{column}H")
 
 
-class Screen(Measurable):
+class Node(Measurable):
+    """ Node in a retained tree of screen content.
 
-    def __init__(self, terminal):
+    Each node keeps track of whether it has changed since it was last
+    rendered (its "dirty" flag) and of the rectangle, in screen
+    coordinates, that it last occupied. This allows a :class:`Screen` to
+    repaint only those parts of the tree that have changed.
+
+    Text style can be given either as a :class:`Style` object, passed as
+    ``style``, or as individual text style keywords (such as ``color``),
+    or both. Text style is inherited by the children of a container.
+    """
+
+    def __init__(self, **style):
+        text_style = style.pop("style", None)
+        text_properties = {key: style.pop(key) for key in Style.properties if key in style}
+        if text_properties:
+            text_style = Style(text_style, **text_properties)
+        self._text_style = text_style
+        self._style = style
+        self._parent = None
+        self._dirty = True
+        self._rect = None
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def rect(self) -> Rect:
+        """ Rectangle occupied by this node when last rendered, or
+        :const:`None` if not yet rendered.
+        """
+        return self._rect
+
+    @property
+    def text_style(self) -> Style:
+        return self._text_style
+
+    @property
+    def align(self):
+        return self._style.get("align", "start")
+
+    @property
+    def display(self):
+        return self._style.get("display", "inline")
+
+    @property
+    def overflow(self):
+        """ Either "visible" (the default), in which case content may be
+        painted outside of the node, or "hidden", in which case content is
+        clipped to the node's own rectangle.
+        """
+        return self._style.get("overflow", "visible")
+
+    def invalidate(self):
+        """ Mark this node as needing to be measured and repainted.
+        """
+        self._dirty = True
+        if self._parent is not None:
+            self._parent._child_changed(self)
+
+
+class Container(Node):
+    """ Node containing a sequence of other nodes, laid out in flow order.
+
+    Block children begin on a new line and are aligned within the width of
+    the container; inline children follow on from the previous child.
+    Child positions are cached, and only recomputed from the first changed
+    child onwards.
+    """
+
+    def __init__(self, *children, **style):
+        super().__init__(**style)
+        self._children = []
+        self._layout = []           # cached position of each child
+        self._layout_width = None   # width at the time of layout
+        self._size = None
+        self._discarded = []        # rects of removed children, awaiting erasure
+        for child in children:
+            self.add(child)
+
+    @property
+    def children(self):
+        return tuple(self._children)
+
+    def add(self, node):
+        """ Append a node to this container, returning that node.
+        """
+        if node._parent is not None:
+            raise ValueError("Node already belongs to a container")
+        node._parent = self
+        self._children.append(node)
+        self._child_changed(node)
+        return node
+
+    def remove(self, node):
+        """ Remove a node from this container.
+        """
+        index = self._children.index(node)
+        self._child_changed(node)
+        del self._children[index]
+        node._parent = None
+        self._discarded.extend(_rendered_rects(node))
+
+    def paste(self, content, /, **style):
+        """ Append a new :class:`Box` of content to this container,
+        returning that box.
+        """
+        return self.add(Box(content, **style))
+
+    def _child_changed(self, node):
+        index = self._children.index(node)
+        del self._layout[index:]
+        self._size = None
+        if self._parent is not None:
+            self._parent._child_changed(self)
+
+    def measure(self, unit="ch") -> Rect:
+        if unit != "ch":
+            raise NotImplementedError
+        if self._size is None:
+            rects = _flow(self._children, self._style.get("width", 0), [])
+            self._size = Rect(0, 0,
+                              self._style.get("width", max((rect.x + rect.width for rect in rects), default=0)),
+                              self._style.get("height", max((rect.y + rect.height for rect in rects), default=0)))
+        return self._size
+
+    def layout(self, width=None) -> [Rect]:
+        """ Compute the position and size of each child, relative to the
+        origin of this container, returning a list of rectangles, one per
+        child. Only those positions not already cached are computed.
+        """
+        if width is None:
+            width = self.measure().width
+        if width != self._layout_width:
+            self._layout.clear()
+            self._layout_width = width
+        _flow(self._children, width, self._layout)
+        return list(self._layout)
+
+
+def _flow(nodes, width, rects) -> [Rect]:
+    """ Lay out a sequence of nodes within a given width, extending a list
+    of rectangles already computed for the first nodes in the sequence. A
+    width of zero lays out nodes at their natural positions, without
+    alignment.
+    """
+    if rects:
+        cursor = _cursor_after(nodes[len(rects) - 1], rects[-1])
+    else:
+        cursor = Rect(0, 0)
+    for node in nodes[len(rects):]:
+        size = node.measure()
+        x, y = cursor.x, cursor.y
+        if node.display == "block":
+            if x != 0:
+                y += 1
+            if node.align == "center" and width:
+                x = (width - size.width) // 2
+            elif node.align == "right" and width:
+                x = width - size.width
+            elif node.align in ("center", "right"):
+                x = 0
+            else:  # "left" or "start" (with ltr direction)
+                x = 1
+        rect = Rect(x, y, size.width, size.height)
+        rects.append(rect)
+        cursor = _cursor_after(node, rect)
+    return rects
+
+
+def _cursor_after(node, rect) -> Rect:
+    if node.display == "block":
+        return Rect(0, rect.top + rect.height)
+    elif node.display == "inline":
+        return Rect(rect.left + rect.width, rect.top)  # assume inline, move to right
+    else:
+        return Rect(rect.left + rect.width, rect.top + max(rect.height - 1, 0))
+
+
+def _rendered_rects(node):
+    """ Yield the last painted rectangles of all boxes within a node.
+    """
+    if isinstance(node, Container):
+        for child in node._children:
+            yield from _rendered_rects(child)
+        yield from node._discarded
+    elif node._painted is not None:
+        yield node._painted
+
+
+def _intersect(a, b):
+    """ Return the intersection of two rectangles, or :const:`None` if they
+    do not overlap. Either rectangle may be :const:`None`, denoting an
+    unbounded area.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    left = max(a.left, b.left)
+    top = max(a.top, b.top)
+    right = min(a.right, b.right)
+    bottom = min(a.bottom, b.bottom)
+    if left < right and top < bottom:
+        return Rect(left, top, right - left, bottom - top)
+    else:
+        return None
+
+
+class Screen(Container):
+    """ Full screen layout, composed of a tree of boxes and containers.
+
+    The first render clears the screen and paints everything. Subsequent
+    renders repaint only boxes that are dirty or have moved, first erasing
+    the areas they previously occupied. A change of terminal size triggers
+    a full repaint.
+
+    Unlike other nodes, the screen defaults to "hidden" overflow, so that
+    nothing is written outside of the terminal viewport. Boxes wholly
+    outside the viewport (or any other clipping rectangle) are skipped, and
+    partially visible lines are cut to the visible columns.
+    """
+
+    def __init__(self, terminal, **style):
+        style.setdefault("overflow", "hidden")
+        super().__init__(**style)
         self._terminal = terminal
-        self._boxes = []
+        self._rendered_size = None
+        self._inherited_styles = {}
 
     @property
     def terminal(self):
         return self._terminal
 
-    def paste(self, content, /, **style):
-        self._boxes.append(Box(content, **style))
-
     def measure(self, unit="ch") -> Rect:
         return self._terminal.measure(unit)
 
     def render(self):
-        self._terminal.write(f"{CSI}?1049h")
-        self._terminal.write(f"{CSI}H{CSI}2J")
-        size: Rect = self._terminal.measure()
-        for box in self._boxes:
-            box_size: Rect = box.measure()
-            pos: Rect = self._terminal.cursor.measure()
-            if box.display == "block":
-                if pos.x == 0:
-                    y = pos.y
-                else:
-                    y = pos.y + 1
-                if box.align == "center":
-                    x = (size.width - box_size.width) // 2
-                elif box.align == "right":
-                    x = size.width - box_size.width
-                else:  # "left" or "start" (with ltr direction)
-                    x = 1
-                pos = Rect(x, y, pos.width, pos.height)
-            for y, text in enumerate(box.lines()):
-                self._terminal.cursor.move_to(pos, y=y)
-                self._terminal.write(f"{text}")
-            if box.display == "block":
-                self._terminal.cursor.move_to(Rect(0, pos.top + box_size.height))
-            elif box.display == "inline":
-                self._terminal.cursor.move_to(Rect(pos.left + box_size.width, pos.top))  # assume inline, move to right
-        self._terminal.flush()
+        size = self.measure()
+        full = size != self._rendered_size
+        erase = []
+        paint = []
+        self._collect_changes(self, Rect(0, 0, size.width, size.height), None, self._text_style,
+                              full, erase, paint)
+        with self._terminal.frame():
+            if full:
+                self._terminal.write(f"{CSI}?1049h")
+                self._terminal.write(f"{CSI}H{CSI}2J")
+                self._rendered_size = size
+            else:
+                for rect in erase:
+                    blank = " " * rect.width
+                    for y in range(rect.height):
+                        self._terminal.cursor.move_to(rect, y=y)
+                        self._terminal.write(blank)
+            for box, rect, visible, text_style in paint:
+                self._paint(box, rect, visible, text_style)
+            self._terminal.flush()
+
+    def _paint(self, box, rect, visible, text_style):
+        line_width = box._extent.width
+        start = visible.left - rect.x
+        end = visible.right - rect.x
+        for y, text in enumerate(box.lines()):
+            line = rect.y + y
+            if line < visible.top:
+                continue
+            if line >= visible.bottom:
+                break
+            if start > 0 or end < line_width:
+                text = clip(text, start, end)
+            self._terminal.cursor.move_to(rect, x=start, y=y)
+            self._terminal.write(f"{text}", style=text_style)
+
+    def _inherit_style(self, inherited, own):
+        """ Compose a node's own text style with that inherited from its
+        container, caching the result so that it is compiled only once.
+        """
+        if inherited is None:
+            return own
+        if own is None:
+            return inherited
+        try:
+            return self._inherited_styles[inherited, own]
+        except KeyError:
+            style = self._inherited_styles[inherited, own] = inherited + own
+            return style
+
+    def _collect_changes(self, container, rect, clip_rect, text_style, force, erase, paint):
+        """ Walk a container, gathering the rects to erase and the boxes to
+        paint, and recording the new rect of each node.
+        """
+        erase.extend(container._discarded)
+        container._discarded.clear()
+        if container.overflow == "hidden":
+            clip_rect = _intersect(clip_rect, rect)
+        for child, child_rect in zip(container._children, container.layout(rect.width)):
+            child_rect = Rect(rect.x + child_rect.x, rect.y + child_rect.y, child_rect.width, child_rect.height)
+            child_style = self._inherit_style(text_style, child._text_style)
+            if isinstance(child, Container):
+                self._collect_changes(child, child_rect, clip_rect, child_style, force or child._dirty, erase, paint)
+            else:
+                visible = child._visible_rect(child_rect, clip_rect)
+                if force or child._dirty or child._rect != child_rect or child._painted != visible:
+                    if child._painted != visible and child._painted is not None:
+                        erase.append(child._painted)
+                    if visible is not None:
+                        paint.append((child, child_rect, visible, child_style))
+                    child._painted = visible
+            child._rect = child_rect
+            child._dirty = False
+
+
+class Box(Node):
+    """ Rectangular block of text content.
+
+    Content is measured on first use, and the measurement cached until the
+    content is changed with :meth:`set_content`.
+
+    By default, a box is sized to fit its content, but a fixed size can be
+    given with the "width" and "height" style properties. Content larger
+    than a fixed size overflows the box unless "overflow" is "hidden".
+    """
 
+    def __init__(self, content, /, **style):
+        super().__init__(**style)
+        self._content = content
+        self._lines = None
+        self._width = 0
+        self._height = 0
+        self._extent = Rect()   # size of the painted lines
+        self._painted = None    # visible part of the box when last rendered
+
+    def _measure_content(self):
+        if self._lines is None:
+            content = str(self._content).rstrip()
+            lines = content.splitlines(keepends=False)
+            widths = measure_text(content)
+            self._height = self._style.get("height", len(lines))
+            self._width = self._style.get("width", max(widths))
+            line_width = max(self._width, max(widths))
+            self._lines = [line + (" " * (line_width - widths[i])) for i, line in enumerate(lines)]
+            self._lines.extend([" " * line_width] * (self._height - len(lines)))
+            self._extent = Rect(0, 0, line_width, len(self._lines))
+
+    def _visible_rect(self, rect, clip_rect):
+        """ Return the part of this box, positioned at `rect`, that is
+        visible within a clipping rectangle, or :const:`None` if no part is
+        visible.
+        """
+        self._measure_content()
+        if self.overflow == "hidden":
+            clip_rect = _intersect(clip_rect, rect)
+        return _intersect(clip_rect, Rect(rect.x, rect.y, self._extent.width, self._extent.height))
 
-class Box(Measurable):
+    @property
+    def content(self):
+        return self._content
 
-    def __init__(self, content, /, **style):
-        content = str(content).rstrip()
-        lines = content.splitlines(keepends=False)
-        widths = measure_text(content)
-        self._height = len(lines)
-        self._width = max(widths)
-        self._lines = [line + (" " * (self._width - widths[i])) for i, line in enumerate(lines)]
-        self._style = style
+    def set_content(self, content):
+        """ Replace the content of this box, invalidating any cached
+        measurement and layout.
+        """
+        self._content = content
+        self._lines = None
+        self.invalidate()
 
     # TODO: rename this relative to "content"
     def lines(self):
+        self._measure_content()
         return iter(self._lines)
 
-    @property
-    def align(self):
-        return self._style.get("align", "start")
-
-    @property
-    def display(self):
-        return self._style.get("display", "inline")
-
     def measure(self, unit="ch") -> Rect:
         if unit != "ch":
             raise NotImplementedError
+        self._measure_content()
         return Rect(0, 0, self._width, self._height)
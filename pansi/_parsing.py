@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from re import compile as re_compile, VERBOSE
+
+from ._codes import ESC, _ESCAPE_SEQUENCE, _COMPLETE_CHAR_UNIT
+from ._style import Style
+
+
+# Any escape sequence, 8-bit CSI sequence or other C1 control character,
+# except for NEL (U+0085), which is a line break. As with 7-bit sequences,
+# an 8-bit CSI sequence at the very end of the text may be incomplete.
+_ANSI = re_compile(_ESCAPE_SEQUENCE + r"""
+  | \x9B[0-?]*[ -/]*[@-~]?
+  | [\x80-\x84\x86-\x9F]
+""", VERBOSE)
+
+_COMPLETE_8BIT_CSI = re_compile(r"\x9B[0-?]*[ -/]*[@-~]")
+
+_SGR = re_compile(r"(?:\x1B\[|\x9B)([0-9:;]*)m")
+
+# Longest incomplete escape sequence held over between chunks of a stream,
+# beyond which the sequence is assumed to be garbage and discarded.
+_MAX_CARRY = 4096
+
+# Caches of SGR state transitions, (state, parameters) -> state, and of the
+# style for each state. These are shared by all parsers, and cleared when
+# they reach _MAX_CACHED entries.
+_TRANSITIONS = {}
+_STYLES = {}
+_MAX_CACHED = 4096
+
+# Colour names for the basic foreground colour codes, 30-37 and 90-97
+_CGA_NAMES = ("black", "maroon", "green", "olive", "navy", "purple", "teal", "silver",
+              "gray", "red", "lime", "yellow", "blue", "fuchsia", "aqua", "white")
+
+
+def strip_ansi(text) -> str:
+    r""" Remove all escape sequences and C1 control characters from text,
+    leaving only printable text and line breaks and other C0 control
+    characters, such as newlines and tabs (as well as NEL).
+
+    >>> strip_ansi("\x1b[1m\x1b[38;2;255;128;0mhello\x1b[0m, world")
+    'hello, world'
+    """
+    if ESC not in text and text.isascii():
+        return text
+    return _ANSI.sub("", text)
+
+
+def parse_spans(source):
+    r""" Parse text containing escape sequences into spans of text, each
+    paired with the :class:`Style` in effect for that text. The source can
+    be either a string or an iterable of strings, such as a text stream, in
+    which case chunks are processed as they arrive, so that memory use does
+    not grow with the length of the input. Escape sequences split across
+    chunk boundaries are handled correctly.
+
+    SGR sequences are interpreted by a running state machine, which
+    understands everything that pansi itself emits, including 256-colour
+    (``38;5``) and truecolor (``38;2``) selectors. All other escape
+    sequences are discarded. Unstyled text is paired with an empty style.
+
+    >>> list(parse_spans("plain \x1b[1;91mbold red\x1b[0m"))
+    [('plain ', Style()), ('bold red', Style(color='red', font_weight='bold'))]
+    """
+    parser = _SpanParser()
+    if isinstance(source, str):
+        source = (source,)
+    for chunk in source:
+        yield from parser.feed(chunk)
+    yield from parser.end()
+
+
+def _incomplete(unit) -> bool:
+    """ Return true if an escape sequence matched at the end of a chunk may
+    yet be continued in the next chunk.
+    """
+    if unit[0] == ESC:
+        return unit == ESC or not _COMPLETE_CHAR_UNIT.fullmatch(unit)
+    elif unit[0] == "\x9B":
+        return not _COMPLETE_8BIT_CSI.fullmatch(unit)
+    else:
+        return False
+
+
+class _SpanParser:
+
+    def __init__(self):
+        # foreground, background, weight, italic, underline, blink, line-through, overline
+        self.state = (None, None, None, False, None, False, False, False)
+        self.carry = ""
+
+    def feed(self, chunk):
+        text = self.carry + chunk
+        self.carry = ""
+        if ESC not in text and text.isascii():
+            if text:
+                yield text, self.style()
+            return
+        pos = 0
+        parts = []
+        style = self.style()
+        for match in _ANSI.finditer(text):
+            start = match.start()
+            unit = match.group()
+            if match.end() == len(text) and len(unit) < _MAX_CARRY and _incomplete(unit):
+                # Incomplete sequence at the end of the chunk
+                self.carry = unit
+                text = text[:start]
+                break
+            if start > pos:
+                parts.append(text[pos:start])
+            pos = match.end()
+            sgr = _SGR.fullmatch(unit)
+            if sgr:
+                key = (self.state, sgr.group(1))
+                try:
+                    self.state = _TRANSITIONS[key]
+                except KeyError:
+                    if len(_TRANSITIONS) >= _MAX_CACHED:
+                        _TRANSITIONS.clear()
+                    self.state = _TRANSITIONS[key] = self.update(sgr.group(1))
+                new_style = self.style()
+                if new_style is not style:
+                    if parts:
+                        yield "".join(parts), style
+                        parts = []
+                    style = new_style
+        if pos < len(text):
+            parts.append(text[pos:])
+        if parts:
+            yield "".join(parts), style
+
+    def end(self):
+        # Any incomplete escape sequence left over is discarded
+        self.carry = ""
+        return ()
+
+    def style(self) -> Style:
+        key = self.state
+        try:
+            return _STYLES[key]
+        except KeyError:
+            if len(_STYLES) >= _MAX_CACHED:
+                _STYLES.clear()
+            fg, bg, weight, italic, underline, blink, line_through, overline = key
+            decorations = [underline, "blink" if blink else None,
+                           "line-through" if line_through else None, "overline" if overline else None]
+            style = _STYLES[key] = Style(
+                color=fg,
+                background_color=bg,
+                font_weight=weight,
+                font_style="italic" if italic else None,
+                text_decoration=" ".join(filter(None, decorations)) or None,
+            )
+            return style
+
+    def update(self, parameters) -> tuple:
+        """ Return the state that results from applying a set of SGR
+        parameters to the current state.
+        """
+        state = list(self.state)
+        if ":" in parameters:
+            codes = _split_sub_parameters(parameters)
+        else:
+            codes = [int(p) if p else 0 for p in parameters.split(";")]
+        i = 0
+        n = len(codes)
+        while i < n:
+            code = codes[i]
+            i += 1
+            if code == 0:
+                state[:] = [None, None, None, False, None, False, False, False]
+            elif 30 <= code <= 37:
+                state[0] = _CGA_NAMES[code - 30]
+            elif 90 <= code <= 97:
+                state[0] = _CGA_NAMES[code - 82]
+            elif 40 <= code <= 47:
+                state[1] = _CGA_NAMES[code - 40]
+            elif 100 <= code <= 107:
+                state[1] = _CGA_NAMES[code - 92]
+            elif code == 38 or code == 48:
+                color, i = _extended_color(codes, i)
+                state[0 if code == 38 else 1] = color
+            elif code == 39:
+                state[0] = None
+            elif code == 49:
+                state[1] = None
+            elif code == 1:
+                state[2] = "bold"
+            elif code == 2:
+                state[2] = 300
+            elif code == 22:
+                state[2] = None
+            elif code == 3:
+                state[3] = True
+            elif code == 23:
+                state[3] = False
+            elif code == 4:
+                state[4] = "underline"
+            elif code == 21:
+                state[4] = "double underline"
+            elif code == 24:
+                state[4] = None
+            elif code == 5 or code == 6:
+                state[5] = True
+            elif code == 25:
+                state[5] = False
+            elif code == 9:
+                state[6] = True
+            elif code == 29:
+                state[6] = False
+            elif code == 53:
+                state[7] = True
+            elif code == 55:
+                state[7] = False
+            # Anything else (such as invert) has no equivalent style property
+        return tuple(state)
+
+
+def _extended_color(codes, i):
+    """ Decode the arguments of an extended colour selector (38 or 48)
+    starting at index `i`, returning the colour and the index following
+    the arguments.
+    """
+    from pansi.color import xterm_256_rgb
+    mode = codes[i] if i < len(codes) else None
+    if mode == 5 and i + 1 < len(codes):
+        index = codes[i + 1]
+        if index < 16:
+            return _CGA_NAMES[index], i + 2
+        elif index < 256:
+            return "#{:02X}{:02X}{:02X}".format(*xterm_256_rgb(index)), i + 2
+        else:
+            return None, i + 2
+    elif mode == 2 and i + 3 < len(codes):
+        r, g, b = (min(c, 255) for c in codes[i + 1:i + 4])
+        return f"#{r:02X}{g:02X}{b:02X}", i + 4
+    else:
+        return None, len(codes)
+
+
+def _split_sub_parameters(parameters) -> [int]:
+    """ Split SGR parameters that use the colon-separated form of ITU
+    T.416, such as ``38:2::r:g:b``, dropping any colour space id.
+    """
+    codes = []
+    for parameter in parameters.split(";"):
+        sub = parameter.split(":")
+        if len(sub) == 6 and sub[1] == "2":
+            del sub[2]  # colour space id
+        codes.extend(int(p) if p else 0 for p in sub)
+    return codes
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from codecs import getincrementaldecoder
+from os import pipe, read as os_read, write as os_write, close as os_close
+from selectors import DefaultSelector, EVENT_READ
+from threading import Lock, Thread
+from time import monotonic
+
+from ._codes import ESC, _split_char_units
+
+
+class Reactor:
+    """ Selector-based reactor, which reads input for any number of
+    terminals on a single thread.
+
+    Each registered file descriptor is associated with a callback. As input
+    arrives, it is decoded and split into character units, and those units
+    are passed to the callback. Escape sequences split across reads are
+    held back until complete; a lone ESC at the end of a read is passed on
+    as an Escape keypress only if nothing follows it within
+    `escape_timeout` seconds. At end of input, the file descriptor is
+    unregistered automatically and the callback is passed an empty list.
+
+    The reactor thread is started when the first file descriptor is
+    registered. Typically, a reactor is not used directly, but is instead
+    passed to each :class:`Terminal` on construction::
+
+        reactor = Reactor()
+        terminals = [Terminal(fd, fd, reactor=reactor) for fd in pty_fds]
+
+    """
+
+    def __init__(self, encoding="utf-8", read_size=4096, escape_timeout=0.05):
+        self._encoding = encoding
+        self._read_size = read_size
+        self._escape_timeout = escape_timeout
+        self._selector = DefaultSelector()
+        self._lock = Lock()
+        self._thread = None
+        self._closed = False
+        # Self-pipe, used to wake the reactor thread when the set of
+        # registered file descriptors changes, or on close
+        self._wakeup_r, self._wakeup_w = pipe()
+        self._selector.register(self._wakeup_r, EVENT_READ)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._selector.get_map()) - 1
+
+    def _check_closed(self):
+        if self._closed:
+            raise ValueError("Reactor is closed")
+
+    def _wake(self):
+        os_write(self._wakeup_w, b"\x00")
+
+    def register(self, fd, callback):
+        """ Start reading input from a file descriptor, passing each batch of
+        character units received to the given callback.
+        """
+        with self._lock:
+            self._check_closed()
+            decoder = getincrementaldecoder(self._encoding)(errors="replace")
+            self._selector.register(fd, EVENT_READ, _Session(callback, decoder))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wake()
+
+    def unregister(self, fd):
+        """ Stop reading input from a file descriptor. Unregistering a file
+        descriptor that is not registered has no effect.
+        """
+        with self._lock:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError):
+                return
+        self._wake()
+
+    def _pending_sessions(self):
+        with self._lock:
+            return [key.data for key in self._selector.get_map().values()
+                    if key.fd != self._wakeup_r and key.data.escape_pending]
+
+    def _run(self):
+        while not self._closed:
+            pending = self._pending_sessions()
+            if pending:
+                # Wait no longer than it takes for the oldest held back
+                # ESC to time out
+                timeout = max(0, min(session.pending_since for session in pending) +
+                              self._escape_timeout - monotonic())
+            else:
+                timeout = None
+            for key, _ in self._selector.select(timeout):
+                if key.fd == self._wakeup_r:
+                    os_read(self._wakeup_r, self._read_size)
+                    continue
+                try:
+                    data = os_read(key.fd, self._read_size)
+                except OSError:
+                    data = b""
+                if data:
+                    key.data.feed(data)
+                else:
+                    self.unregister(key.fd)
+                    key.data.end()
+            now = monotonic()
+            for session in pending:
+                if session.escape_pending and now - session.pending_since >= self._escape_timeout:
+                    session.flush()
+
+    def close(self):
+        """ Stop the reactor thread and release all resources. Any file
+        descriptors still registered are unregistered, but not closed.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+        self._selector.close()
+        os_close(self._wakeup_r)
+        os_close(self._wakeup_w)
+
+
+class _Session:
+    """ Decoding and tokenizing state for a single input source.
+    """
+
+    def __init__(self, callback, decoder):
+        self._callback = callback
+        self._decoder = decoder
+        self._pending = ""
+        self.pending_since = None
+
+    @property
+    def escape_pending(self):
+        """ True if a lone ESC is being held back.
+        """
+        return self._pending == ESC
+
+    def feed(self, data):
+        units, self._pending = _split_char_units(self._pending + self._decoder.decode(data), final=False)
+        if self._pending != ESC:
+            self.pending_since = None
+        elif units or self.pending_since is None:
+            self.pending_since = monotonic()
+        if units:
+            self._callback(units)
+
+    def flush(self):
+        """ Pass on a held back lone ESC, for which no continuation has
+        arrived, as an Escape keypress.
+        """
+        self._pending = ""
+        self.pending_since = None
+        self._callback([ESC])
+
+    def end(self):
+        units, _ = _split_char_units(self._pending + self._decoder.decode(b"", final=True))
+        self._pending = ""
+        if units:
+            self._callback(units)
+        self._callback([])
@@ -16,6 +16,8 @@
 # limitations under the License.
 
 
+from functools import lru_cache
+
 from ._codes import CSI
 
 
@@ -99,16 +101,31 @@ CGA_PALETTE = {
 class SGR:
     """ Hold the parameters of an SGR control sequence, along with an
     optional reset code.
+
+    SGR objects are immutable, and the escape sequence for each is built
+    once, on construction, so that it can be cheaply reused.
     """
 
+    __slots__ = ("_parameters", "_reset", "_str")
+
     @classmethod
-    def for_color(cls, value, background=False, web_palette_only=False):
+    def for_color(cls, value, background=False, web_palette_only=False, color_depth=24):
         """ Construct an :py:class:`pansi.SGR` object for a given color value.
-        The input can be either a hex colour value, a named colour, or an RGB
-        tuple composed of numbers and/or percentages. The literal string value
+        The input can be a :py:class:`pansi.color.Color`, a hex colour value, a
+        named colour, a CSS functional notation such as ``'oklch(70% 0.2 50)'``,
+        or an RGB tuple composed of numbers and/or percentages. The literal string value
         ``'default'`` can also be passed to explicitly select the terminal
         default colour.
 
+        Results are cached, so repeated calls for the same value return the
+        same object. The basic CGA colour names are served from an interned
+        table; other values are held in a bounded LRU cache.
+
+        RGB colours are selected with 24-bit "truecolor" sequences by default.
+        For terminals with a lower colour depth, these are replaced by the
+        perceptually nearest entry in either the xterm 256-colour palette (8
+        bits) or the CGA 16-colour palette (4 bits).
+
         Note: alpha values are accepted, but ignored and discarded.
 
         :param value:
@@ -116,58 +133,95 @@ class SGR:
         :param web_palette_only: if true, use the web palette for all named
             colours instead of falling back to terminal palette for basic
             CGA colours
+        :param color_depth: colour depth of the terminal in bits; one of
+            24, 8 or 4
         :return: SGR
         """
-        from pansi.color import WEB_PALETTE, decode_hex_color, rgb
-        default = 49 if background else 39
-        if isinstance(value, tuple):
-            value = rgb(*value)
-        else:
-            value = str(value).strip()
-        if value.startswith("#"):
-            c = decode_hex_color(value)
-            return cls(48 if background else 38, 2,
-                       c[0], c[1], c[2], reset=default)
-        else:
-            name = value.lower()
-            if name == "default":
-                return cls(default)
-            elif name in CGA_PALETTE and not web_palette_only:
-                fg, bg = CGA_PALETTE[name]
-                return cls(bg if background else fg, reset=default)
-            elif name in WEB_PALETTE:
-                r, g, b = WEB_PALETTE[name]
-                return cls(48 if background else 38, 2, r, g, b, reset=default)
-            else:
-                raise ValueError(f"Unrecognised color name {value!r}")
+        try:
+            if cls is SGR:
+                return _INTERNED_COLORS[value, background, web_palette_only]
+        except (KeyError, TypeError):
+            pass
+        try:
+            return _cached_sgr_for_color(cls, value, background, web_palette_only, color_depth)
+        except TypeError:
+            # unhashable value, e.g. a list
+            return _sgr_for_color(cls, value, background, web_palette_only, color_depth)
 
     def __init__(self, *parameters, reset=None):
-        self.parameters = parameters
+        self._parameters = parameters
         if not reset:
-            self.reset = ()
+            self._reset = ()
         elif isinstance(reset, tuple):
-            self.reset = reset
+            self._reset = reset
         else:
-            self.reset = (reset,)
+            self._reset = (reset,)
+        self._str = f"{CSI}{';'.join(map(str, parameters))}m"
 
     def __repr__(self):
-        args = list(map(repr, self.parameters))
-        if self.reset:
-            if len(self.reset) == 1:
-                args.append(f"reset={self.reset[0]!r}")
+        args = list(map(repr, self._parameters))
+        if self._reset:
+            if len(self._reset) == 1:
+                args.append(f"reset={self._reset[0]!r}")
             else:
-                args.append(f"reset={self.reset!r}")
+                args.append(f"reset={self._reset!r}")
         return f"{type(self).__name__}({', '.join(args)})"
 
     def __str__(self):
-        return f"{CSI}{';'.join(map(str, self.parameters))}m"
+        return self._str
 
     def __invert__(self):
-        if self.reset:
-            return self.__class__(*self.reset, reset=self.parameters)
+        if self._reset:
+            return self.__class__(*self._reset, reset=self._parameters)
         else:
             return self
 
+    @property
+    def parameters(self) -> tuple:
+        return self._parameters
+
+    @property
+    def reset(self) -> tuple:
+        return self._reset
+
+
+def _sgr_for_color(cls, value, background, web_palette_only, color_depth):
+    from pansi.color import Color
+    if isinstance(value, (tuple, list)):
+        r, g, b = Color.parse(value)[:3]
+        return _sgr_for_rgb(cls, r, g, b, background, color_depth)
+    default = 49 if background else 39
+    name = str(value).strip().lower()
+    if name == "default":
+        return cls(default)
+    elif name in CGA_PALETTE and not web_palette_only:
+        fg, bg = CGA_PALETTE[name]
+        return cls(bg if background else fg, reset=default)
+    else:
+        r, g, b = Color.parse(name)[:3]
+        return _sgr_for_rgb(cls, r, g, b, background, color_depth)
+
+
+def _sgr_for_rgb(cls, r, g, b, background, color_depth):
+    default = 49 if background else 39
+    if color_depth >= 24:
+        return cls(48 if background else 38, 2, r, g, b, reset=default)
+    elif color_depth >= 8:
+        from pansi.color import xterm_256_index
+        return cls(48 if background else 38, 5, xterm_256_index(r, g, b), reset=default)
+    elif color_depth >= 4:
+        from pansi.color import cga_16_index
+        return cls(_CGA_CODES[cga_16_index(r, g, b)] + (10 if background else 0), reset=default)
+    else:
+        raise ValueError(f"Unsupported colour depth {color_depth!r}")
+
+
+# Foreground SGR codes for each CGA palette index, in terminal colour order
+_CGA_CODES = (30, 31, 32, 33, 34, 35, 36, 37, 90, 91, 92, 93, 94, 95, 96, 97)
+
+
+_cached_sgr_for_color = lru_cache(maxsize=1024)(_sgr_for_color)
+
 
 #: The *reset* SGR sequence removes all current styling effects and returns the
 #: text to its default appearance. Given that the ability to nest sequences is
@@ -229,3 +283,18 @@ blue_bg = SGR(104, reset=49)
 fuchsia_bg = magenta_bg = SGR(105, reset=49)
 aqua_bg = cyan_bg = SGR(106, reset=49)
 white_bg = SGR(107, reset=49)
+
+
+# Interned SGR objects for the basic CGA colour names, as used by
+# SGR.for_color when the web palette is not forced. Each name (and each
+# alias) maps to one of the shared objects defined above.
+_INTERNED_COLORS = {}
+for _obj in (black, maroon, green, olive, navy, purple, teal, silver, gray, red, lime, yellow, blue, magenta, cyan,
+             white, black_bg, maroon_bg, green_bg, olive_bg, navy_bg, purple_bg, teal_bg, silver_bg, gray_bg, red_bg,
+             lime_bg, yellow_bg, blue_bg, magenta_bg, cyan_bg, white_bg):
+    for _name, _pair in CGA_PALETTE.items():
+        if _obj.parameters[0] in _pair:
+            _INTERNED_COLORS[_name, _obj.parameters[0] == _pair[1], False] = _obj
+_INTERNED_COLORS["default", False, False] = default_fg
+_INTERNED_COLORS["default", True, False] = default_bg
+del _obj, _name, _pair
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class Style:
+    """ Reusable set of text style properties, as accepted by
+    :meth:`TerminalOutput.write`.
+
+    A style is compiled on first use into a prefix escape sequence and a
+    matching suffix, and the compiled form is kept for reuse, so applying a
+    style to many strings involves no further parsing of property values.
+
+    Styles are immutable. A style can inherit from a parent style, taking
+    all the parent's properties except those it overrides, and two styles
+    can be composed with ``+``, in which case properties of the right hand
+    style take precedence.
+
+    >>> warning = Style(color="yellow")
+    >>> error = Style(warning, color="red", font_weight="bold")
+    >>> error.prefix()
+    '\\x1b[91m\\x1b[1m'
+    """
+
+    properties = ("color", "background_color", "font_weight",
+                  "font_style", "text_decoration", "vertical_align")
+
+    __slots__ = ("_properties", "_compiled")
+
+    def __init__(self, parent=None, /, **properties):
+        for key in properties:
+            if key not in self.properties:
+                raise TypeError(f"Unknown style property {key!r}")
+        inherited = dict(parent._properties) if parent is not None else {}
+        for key, value in properties.items():
+            if value is None:
+                continue
+            if isinstance(value, list):
+                # Colours given as lists of components are held as tuples,
+                # so that styles remain hashable
+                value = tuple(value)
+            inherited[key] = value
+        self._properties = inherited
+        self._compiled = {}
+
+    def __repr__(self):
+        args = ", ".join(f"{key}={value!r}" for key, value in self._properties.items())
+        return f"{type(self).__name__}({args})"
+
+    def __eq__(self, other):
+        if isinstance(other, Style):
+            return self._properties == other._properties
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(sorted(self._properties.items())))
+
+    def __bool__(self):
+        return bool(self._properties)
+
+    def __add__(self, other):
+        if isinstance(other, Style):
+            return Style(self, **other._properties)
+        return NotImplemented
+
+    def __getitem__(self, key):
+        return self._properties[key]
+
+    def get(self, key, default=None):
+        return self._properties.get(key, default)
+
+    def derive(self, **properties):
+        """ Create a new style that inherits from this one, overriding
+        the given properties.
+        """
+        return Style(self, **properties)
+
+    def _compile(self, color_depth):
+        try:
+            return self._compiled[color_depth]
+        except KeyError:
+            from ._sgr import reset
+            from ._term import _style_prefix, _style_function
+            properties = self._properties
+            prefix = _style_prefix(properties.get("color"),
+                                   properties.get("background_color"),
+                                   properties.get("font_weight"),
+                                   properties.get("font_style"),
+                                   properties.get("text_decoration"),
+                                   color_depth)
+            compiled = self._compiled[color_depth] = (
+                prefix,
+                str(reset) if prefix else "",
+                _style_function(prefix, properties.get("vertical_align")),
+            )
+            return compiled
+
+    def compile(self, color_depth=24):
+        """ Return a function that applies this style to a string, as used
+        by :meth:`TerminalOutput.write`. The function is built once per
+        colour depth, and cached.
+        """
+        return self._compile(color_depth)[2]
+
+    def prefix(self, color_depth=24) -> str:
+        """ Escape sequence that switches this style on.
+        """
+        return self._compile(color_depth)[0]
+
+    def suffix(self, color_depth=24) -> str:
+        """ Escape sequence that switches this style off again.
+        """
+        return self._compile(color_depth)[1]
+
+
+class StyleSheet:
+    """ Collection of named styles, such as ``error``, ``dim`` or
+    ``header``, which an application can define once and use throughout.
+
+    A style may inherit from another named style in the same sheet. Looking
+    up several space-separated names composes those styles, in order, and
+    the result is cached.
+
+    >>> sheet = StyleSheet()
+    >>> sheet.define("error", color="red")
+    Style(color='red')
+    >>> sheet.define("fatal", "error", font_weight="bold")
+    Style(color='red', font_weight='bold')
+    >>> sheet.define("dim", font_weight=300)
+    Style(font_weight=300)
+    >>> sheet["error dim"]
+    Style(color='red', font_weight=300)
+    """
+
+    def __init__(self, **styles):
+        self._styles = {}
+        self._composed = {}
+        for name, style in styles.items():
+            self[name] = style
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(self._styles)})"
+
+    def __contains__(self, name):
+        return name in self._styles
+
+    def __iter__(self):
+        return iter(self._styles)
+
+    def __len__(self):
+        return len(self._styles)
+
+    def __getitem__(self, names) -> Style:
+        try:
+            return self._composed[names]
+        except KeyError:
+            style = Style()
+            for name in names.split():
+                style += self._styles[name]
+            self._composed[names] = style
+            return style
+
+    def __setitem__(self, name, style):
+        if not isinstance(style, Style):
+            raise TypeError(f"Expected a Style object, not {type(style).__name__}")
+        if not name or " " in name:
+            raise ValueError(f"Invalid style name {name!r}")
+        self._styles[name] = style
+        self._composed.clear()
+
+    def define(self, name, parent=None, /, **properties) -> Style:
+        """ Define a named style, optionally inheriting from another named
+        style in this sheet, and return it.
+        """
+        style = self[name] = Style(self[parent] if parent else None, **properties)
+        return style
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ._measurement import measure_text, truncate, wrap_text
+
+
+class Column:
+    """ Layout and style for a single table column.
+
+    If `width` is not given, it is estimated from the sampled rows of the
+    table. Cells wider than the column are either clipped (with an
+    ellipsis) or wrapped onto further lines, depending on `overflow`.
+    Style keywords are as accepted by :meth:`TerminalOutput.write`, and are
+    compiled once for each colour depth used.
+    """
+
+    def __init__(self, width=None, /, align="left", overflow="clip", ellipsis="…", **style):
+        if overflow not in {"clip", "wrap"}:
+            raise ValueError(f"Unsupported overflow mode {overflow!r}")
+        self.width = width
+        self.align = align
+        self.overflow = overflow
+        self.ellipsis = ellipsis
+        self._style = style
+        self._styled = bool(style)
+        self._compiled = {}     # colour depth -> style function
+
+    def __repr__(self):
+        return f"{type(self).__name__}(width={self.width!r}, align={self.align!r}, overflow={self.overflow!r})"
+
+    def _style_function(self, color_depth):
+        try:
+            return self._compiled[color_depth]
+        except KeyError:
+            from ._term import _compile_style
+            value = self._compiled[color_depth] = _compile_style(**self._style, color_depth=color_depth)
+            return value
+
+    def format(self, text, width, color_depth=24) -> [str]:
+        """ Lay out the text of a single cell, returning a list of lines,
+        each padded to exactly the given width, and styled for the given
+        colour depth.
+        """
+        if text.isascii() and text.isprintable():
+            # Fast path for plain single-line ASCII cells
+            if len(text) > width:
+                if self.overflow == "wrap":
+                    lines = wrap_text(text, width)
+                else:
+                    lines = [text[:max(0, width - max(measure_text(self.ellipsis)))] + self.ellipsis]
+            else:
+                lines = [text]
+        elif self.overflow == "wrap":
+            lines = wrap_text(text, width)
+        else:
+            lines = truncate(text, width, self.ellipsis).splitlines() or [""]
+        formatted = []
+        apply_style = self._style_function(color_depth) if self._styled else None
+        for line in lines:
+            if line.isascii() and line.isprintable():
+                padding = width - len(line)
+            else:
+                padding = width - max(measure_text(line))
+            if self._styled and line:
+                line = apply_style(line)
+            if padding <= 0:
+                formatted.append(line)
+            elif self.align == "right":
+                formatted.append(" " * padding + line)
+            elif self.align == "center":
+                formatted.append(" " * (padding // 2) + line + " " * (padding - padding // 2))
+            else:
+                formatted.append(line + " " * padding)
+        return formatted
+
+
+class TableWriter:
+    """ Streaming writer for tabular output.
+
+    Rows are written to the `output` (typically a :class:`Terminal`, but
+    any object with a `write` method will do) as they arrive. Column widths
+    are either declared up front or estimated from the first `sample_size`
+    rows, which are buffered until the widths are known. Memory use is
+    therefore bounded by the sample size, however many rows are written.
+
+    Columns can be given as :class:`Column` objects, as plain widths, or as
+    None for an automatically-sized left-aligned column. If no columns are
+    given at all, they are derived from the first row.
+
+    Estimated widths never exceed `max_width`. Column styles are applied
+    at the colour depth of the output, where it has one.
+    """
+
+    def __init__(self, output, columns=None, /, sample_size=100, max_width=40, sep=" ", end="\r\n"):
+        self._output = output
+        self._columns = None if columns is None else [self._column(column) for column in columns]
+        self._sample_size = sample_size
+        self._max_width = max_width
+        self._sep = sep
+        self._end = end
+        self._sample = []
+        self._widths = None
+        if self._columns and all(column.width is not None for column in self._columns):
+            self._widths = [column.width for column in self._columns]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @classmethod
+    def _column(cls, column):
+        if isinstance(column, Column):
+            return column
+        else:
+            return Column(column)
+
+    @property
+    def widths(self) -> [int]:
+        """ Column widths, or None if not yet determined.
+        """
+        return self._widths
+
+    def _estimate_widths(self):
+        widths = []
+        for i, column in enumerate(self._columns):
+            if column.width is not None:
+                widths.append(column.width)
+            else:
+                width = 0
+                for row in self._sample:
+                    if i < len(row):
+                        text = row[i]
+                        if text.isascii() and text.isprintable():
+                            cell_width = len(text)
+                        else:
+                            cell_width = max(measure_text(text))
+                        if cell_width > width:
+                            width = cell_width
+                widths.append(min(width, self._max_width))
+        self._widths = widths
+
+    def _format_row(self, row) -> str:
+        color_depth = getattr(self._output, "color_depth", 24)
+        cells = []
+        for i, column in enumerate(self._columns):
+            text = row[i] if i < len(row) else ""
+            cells.append(column.format(text, self._widths[i], color_depth))
+        height = max(len(cell_lines) for cell_lines in cells)
+        lines = []
+        for y in range(height):
+            lines.append(self._sep.join(cell_lines[y] if y < len(cell_lines) else " " * self._widths[i]
+                                        for i, cell_lines in enumerate(cells)).rstrip(" "))
+        return self._end.join(lines) + self._end
+
+    def _flush_sample(self):
+        self._estimate_widths()
+        self._output.write("".join(map(self._format_row, self._sample)))
+        self._sample.clear()
+
+    def write_row(self, row):
+        """ Write a single row, as a sequence of objects. Each object is
+        converted to a string using :py:func:`str`.
+        """
+        row = [str(value) for value in row]
+        if self._columns is None:
+            self._columns = [Column() for _ in row]
+        if self._widths is None:
+            self._sample.append(row)
+            if len(self._sample) >= self._sample_size:
+                self._flush_sample()
+        else:
+            self._output.write(self._format_row(row))
+
+    def write_rows(self, rows):
+        """ Write a number of rows, as for :meth:`write_row`.
+        """
+        for row in rows:
+            self.write_row(row)
+
+    def close(self):
+        """ Write out any rows still held in the sample buffer.
+        """
+        if self._sample:
+            self._flush_sample()
@@ -16,21 +16,24 @@
 # limitations under the License.
 
 
+from contextlib import contextmanager
 from fcntl import ioctl
-from io import StringIO, TextIOBase
-from os import ctermid, open as os_open, close as os_close, O_RDONLY
+from io import TextIOBase
+from math import ceil
+from os import environ as os_environ, ctermid, open as os_open, close as os_close, O_RDONLY
 from queue import SimpleQueue, Empty
 from re import compile as re_compile, Match
 from select import select
 from signal import signal, SIGWINCH
 from struct import pack, unpack
 from sys import stdin, stdout
-from termios import tcgetattr, tcsetattr, TCSAFLUSH, TIOCGWINSZ
-from threading import Thread
+from termios import tcgetattr, tcsetattr, TCSAFLUSH, TIOCGWINSZ, error as TermiosError
+from threading import Condition, Thread, local
 from time import monotonic
+from weakref import WeakSet
 from tty import setraw, setcbreak
 
-from ._codes import CR, LF, ESC, SS3, CSI, APC, UNICODE_NEWLINES
+from ._codes import CR, LF, ESC, SS3, CSI, APC, NEL, UNICODE_NEWLINES, _split_char_units
 from ._keyboard import ANY_KEY
 from ._measurement import Rect, Screen, Cursor
 from ._sgr import reset
@@ -313,16 +316,251 @@ class TerminalInput(TextIOBase):
         return hasattr(self._stream, "fileno") and callable(self._stream.fileno)
 
 
+# Single characters that can terminate a line (see UNICODE_NEWLINES)
+_NEWLINE_CHARS = "\r\n\x0b\x0c\x85\u2028\u2029"
+
+
+def _split_trailing_newlines(line) -> (str, str):
+    """ Split a line of text into its content and any trailing newlines.
+    """
+    content = line
+    while True:
+        stripped = content.rstrip(_NEWLINE_CHARS)
+        if stripped.endswith(NEL):
+            stripped = stripped[:-len(NEL)]
+        if stripped == content:
+            return content, line[len(content):]
+        content = stripped
+
+
+def _compile_style(color=None,
+                   background_color=None,
+                   font_weight=None,
+                   font_style=None,
+                   text_decoration=None,
+                   vertical_align=None,
+                   color_depth=24):
+    """ Compile a set of style keywords into a function that applies that
+    style to a string. This allows the keywords to be resolved once only,
+    however many strings are then styled.
+    """
+    prefix = _style_prefix(color, background_color, font_weight, font_style, text_decoration, color_depth)
+    return _style_function(prefix, vertical_align)
+
+
+def _resolve_style(style, color_depth, /,
+                   color=None,
+                   background_color=None,
+                   font_weight=None,
+                   font_style=None,
+                   text_decoration=None,
+                   vertical_align=None):
+    """ Resolve either a :class:`Style` object or a set of style keywords
+    (or both, in which case the keywords override the style) into a
+    function that applies that style to a string. A style object on its
+    own is used as already compiled, with no further parsing.
+    """
+    if style is None:
+        return _compile_style(color, background_color, font_weight, font_style,
+                              text_decoration, vertical_align, color_depth)
+    keywords = (color, background_color, font_weight, font_style, text_decoration, vertical_align)
+    if any(value is not None for value in keywords):
+        style = style.derive(color=color, background_color=background_color, font_weight=font_weight,
+                             font_style=font_style, text_decoration=text_decoration,
+                             vertical_align=vertical_align)
+    return style.compile(color_depth)
+
+
+def _style_prefix(color, background_color, font_weight, font_style, text_decoration, color_depth) -> str:
+    """ Resolve style keywords into the escape sequence that switches that
+    style on.
+    """
+    from . import _text
+    return "".join([
+        _text.color(color, color_depth=color_depth),
+        _text.background_color(background_color, color_depth=color_depth),
+        _text.font_weight(font_weight),
+        _text.font_style(font_style),
+        _text.text_decoration(text_decoration),
+    ])
+
+
+def _style_function(prefix, vertical_align):
+    """ Build a function that applies a style, given as a prefix escape
+    sequence and a vertical alignment, to a string.
+    """
+    from . import _text
+    if vertical_align == "sub":
+        table = _text.TO_SUBSCRIPT
+    elif vertical_align == "super":
+        table = _text.TO_SUPERSCRIPT
+    else:
+        table = None
+    if not prefix:
+        return str if table is None else (lambda text: text.translate(table))
+    suffix = str(reset)
+    resets = (f"{CSI}0m", f"{CSI}m")
+
+    def apply_style(text):
+        if table is not None:
+            text = text.translate(table)
+        # If the text contains newlines (e.g. <pre>) then we should add
+        # the style codes to each line. Without this, styled output
+        # displayed in applications like `less` applies the style to
+        # the first line only.
+        parts = []
+        for line in text.splitlines(keepends=True):
+            content, newlines = _split_trailing_newlines(line)
+            if content:
+                parts.append(prefix)
+                parts.append(content)
+                # Add a reset if one does not already exist
+                if not content.endswith(resets):
+                    parts.append(suffix)
+            parts.append(newlines)
+        return "".join(parts)
+
+    return apply_style
+
+
+class ThreadedWriter:
+    """ Writer that accepts chunks of text from any thread and passes them
+    to an underlying stream from a single dedicated writer thread.
+
+    Each chunk is written contiguously, so escape sequences submitted by
+    different threads can never be interleaved. Chunks that accumulate while
+    the writer thread is busy are coalesced into a single write. Submitting
+    a chunk never blocks on the underlying stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._chunks = []
+        self._busy = False
+        self._closed = False
+        self._error = None
+        self._ready = Condition()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._ready:
+                while not self._chunks and not self._closed:
+                    self._ready.wait()
+                if not self._chunks:
+                    return
+                chunks = self._chunks
+                self._chunks = []
+                self._busy = True
+            try:
+                self._stream.write("".join(chunks))
+                self._stream.flush()
+            except Exception as error:
+                self._error = error
+            finally:
+                with self._ready:
+                    self._busy = False
+                    self._ready.notify_all()
+
+    def _check_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(self, s):
+        """ Submit a chunk of text for writing.
+        """
+        with self._ready:
+            if self._closed:
+                raise ValueError("Writer is closed")
+            self._chunks.append(s)
+            self._ready.notify_all()
+        self._check_error()
+
+    def flush(self):
+        """ Block until all chunks submitted so far have been written and
+        flushed to the underlying stream.
+        """
+        with self._ready:
+            while self._chunks or self._busy:
+                self._ready.wait()
+        self._check_error()
+
+    def writable(self):
+        return not self._closed
+
+    def close(self):
+        """ Write any outstanding chunks, then stop the writer thread.
+        """
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+        self._thread.join()
+        self._check_error()
+
+
+def detect_color_depth(environ=None) -> int:
+    """ Detect the colour depth of the terminal, in bits, from the
+    ``COLORTERM`` and ``TERM`` environment variables. Returns 8 for
+    256-colour terminals and 4 (16 colours) for terminals known to support
+    no more than that, such as the Linux console. Otherwise, including
+    where the environment says nothing either way (as is common over SSH,
+    under tmux, or in CI), 24 is returned, so that colours are only ever
+    downsampled for a positively identified limited terminal.
+
+    >>> detect_color_depth({"TERM": "xterm-256color"})
+    8
+    """
+    if environ is None:
+        environ = os_environ
+    colorterm = environ.get("COLORTERM", "").lower()
+    term = environ.get("TERM", "").lower()
+    if colorterm in ("truecolor", "24bit") or term.endswith("-direct"):
+        return 24
+    elif "256color" in term:
+        return 8
+    elif term in _16_COLOR_TERMS or term.endswith(("-16color", "-8color", "-color")):
+        return 4
+    else:
+        return 24
+
+
+# Terminal types that support no more than 16 colours
+_16_COLOR_TERMS = {"ansi", "cygwin", "linux", "vt100", "vt102", "vt220"}
+
+
 class TerminalOutput(TextIOBase):
+    """ Text output to a terminal, with support for styling.
+
+    If `threaded` is true, all writes are passed through a
+    :class:`ThreadedWriter`, which allows any number of threads to share the
+    output without corrupting each other's escape sequences. Writes from
+    within a :meth:`frame` block are held back and submitted together.
 
-    def __init__(self, stream=stdout):
+    RGB colours are written at the given `color_depth` (24, 8 or 4 bits),
+    being downsampled to the nearest palette colour where necessary. If no
+    colour depth is given, it is detected from the environment, with 24
+    bits used unless the terminal is known to be limited (see
+    :func:`detect_color_depth`).
+    """
+
+    def __init__(self, stream=stdout, threaded=False, color_depth=None):
         stream = stream or stdout
         if not hasattr(stream, "write") or not callable(stream.write):
             raise ValueError(f"Stream {stream!r} has no write method")
         if not hasattr(stream, "writable") or not callable(stream.writable) or not stream.writable():
             raise ValueError(f"Stream {stream!r} is not writable")
         self._stream = stream
-        self._original_tty_mode = tcgetattr(self._stream)
+        self._writer = ThreadedWriter(stream) if threaded else stream
+        self._local = local()
+        self.color_depth = detect_color_depth() if color_depth is None else color_depth
+        try:
+            self._original_tty_mode = tcgetattr(self._stream)
+        except (OSError, TermiosError):
+            # Not a tty (e.g. an in-memory stream or a pipe), so there is
+            # no mode to restore later on.
+            self._original_tty_mode = None
         self._closed = False
 
     def __del__(self):
@@ -346,10 +584,59 @@ class TerminalOutput(TextIOBase):
             raise ValueError(f"Unsupported tty mode {tty_mode!r}")
 
     def reset_tty_mode(self):
+        if self._original_tty_mode is None:
+            return
         tcsetattr(self._stream, TCSAFLUSH, self._original_tty_mode)
 
+    def _write(self, s):
+        frame = getattr(self._local, "frame", None)
+        if frame is None:
+            self._writer.write(s)
+        else:
+            frame.append(s)
+
+    def _submit_frame(self):
+        frame = getattr(self._local, "frame", None)
+        if frame:
+            self._writer.write("".join(frame))
+            frame.clear()
+
+    @contextmanager
+    def frame(self):
+        """ Context manager that collects everything written by the current
+        thread and submits it as a single chunk on exit. Frames may be
+        nested, in which case the outermost frame determines when output
+        is submitted. Calls to :meth:`flush` within a frame are deferred
+        until the outermost frame exits, so that a frame is never
+        submitted in part.
+        """
+        if getattr(self._local, "frame", None) is not None:
+            yield
+            return
+        self._local.frame = []
+        self._local.flush_deferred = False
+        try:
+            yield
+        finally:
+            try:
+                self._submit_frame()
+            finally:
+                self._local.frame = None
+            if self._local.flush_deferred:
+                self._writer.flush()
+
     def flush(self):
-        self._stream.flush()
+        if getattr(self._local, "frame", None) is not None:
+            self._local.flush_deferred = True
+            return
+        self._writer.flush()
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            if isinstance(self._writer, ThreadedWriter):
+                self._writer.close()
 
     def write(self, s, /,
               color=None,
@@ -357,47 +644,15 @@ class TerminalOutput(TextIOBase):
               font_weight=None,
               font_style=None,
               text_decoration=None,
-              vertical_align=None):
-        from . import _text
-        if vertical_align == "sub":
-            text = str(s).translate(_text.TO_SUBSCRIPT)
-        elif vertical_align == "super":
-            text = str(s).translate(_text.TO_SUPERSCRIPT)
-        else:
-            text = str(s)
-        seq = [
-            _text.color(color),
-            _text.background_color(background_color),
-            _text.font_weight(font_weight),
-            _text.font_style(font_style),
-            _text.text_decoration(text_decoration),
-        ]
-        prefix = ''.join(map(str, seq))
-        if prefix:
-            # If the text contains newlines (e.g. <pre>) then we should add
-            # the style codes to each line. Without this, styled output
-            # displayed in applications like `less` applies the style to
-            # the first line only.
-            units = []
-            for line in text.splitlines(keepends=True):
-                # Break the line into char sequences
-                line_units = list(TerminalInput(StringIO(line)))
-                # Separate out trailing newlines
-                newlines = []
-                while line_units and line_units[-1] in UNICODE_NEWLINES:
-                    newlines.insert(0, line_units.pop(-1))
-                # Store the prefix
-                units.append(prefix)
-                # Store the line content (without newlines)
-                units.extend(line_units)
-                # Store a reset if one does not already exist
-                if line_units[-1] not in {f"{CSI}0m", f"{CSI}m"}:
-                    units.append(reset)
-                # Store the newlines
-                units.extend(newlines)
-            self._stream.write("".join(map(str, units)))
-        else:
-            self._stream.write(text)
+              vertical_align=None,
+              style=None):
+        apply_style = _resolve_style(style, self.color_depth, color, background_color, font_weight,
+                                     font_style, text_decoration, vertical_align)
+        self._write(apply_style(str(s)))
+
+    def fileno(self):
+        self._check_closed()
+        return self._stream.fileno()
 
     def writable(self) -> bool:
         return self._stream.writable()
@@ -408,32 +663,80 @@ class TerminalOutput(TextIOBase):
                    font_weight=None,
                    font_style=None,
                    text_decoration=None,
-                   vertical_align=None):
-        for line in lines:
-            self.write(line, color, background_color, font_weight,
-                       font_style, text_decoration, vertical_align)
+                   vertical_align=None,
+                   style=None):
+        apply_style = _resolve_style(style, self.color_depth, color, background_color, font_weight,
+                                     font_style, text_decoration, vertical_align)
+        self._write("".join(apply_style(str(line)) for line in lines))
 
 
-class Terminal:
+# Terminals to be notified when the process receives SIGWINCH. A single
+# process-wide handler is shared, as installing one per terminal would
+# replace the handler installed by the previous one.
+_resize_targets = WeakSet()
+_resize_handler_installed = False
+
+
+def _on_sigwinch(_signal, _frame):
+    for terminal in list(_resize_targets):
+        terminal._event_queue.put(Event("resize"))
 
-    def __init__(self, input_stream=None, output_stream=None):
+
+class Terminal:
+    """ Terminal, combining input and output streams with event handling.
+
+    Input and output can each be given as either a stream or a file
+    descriptor (such as either end of a pty). By default, the input is
+    read by a dedicated thread, and resize events are raised when the
+    process receives SIGWINCH. Alternatively, a :class:`Reactor` can be
+    passed, in which case input is read by the reactor (which can be shared
+    by any number of terminals) and no signal handler is installed; resizes
+    should then be notified explicitly via :meth:`resize`.
+
+    If `threaded_output` is true, output is handed off to a dedicated
+    writer thread, and `color_depth` selects the colour depth used for
+    output (detected from the environment by default); see
+    :class:`TerminalOutput` for details.
+    """
+
+    def __init__(self, input_stream=None, output_stream=None, threaded_output=False, reactor=None, color_depth=None):
+        global _resize_handler_installed
+        if isinstance(input_stream, int):
+            input_stream = open(input_stream, "r", encoding="utf-8", closefd=False)
+        if isinstance(output_stream, int):
+            output_stream = open(output_stream, "w", encoding="utf-8", closefd=False)
         self._input = TerminalInput(input_stream)
-        self._output = TerminalOutput(output_stream)
+        self._output = TerminalOutput(output_stream, threaded=threaded_output, color_depth=color_depth)
         self._cursor = Cursor(self)
         self._screen = None
         self._response_timeout = 0.05
+        self._batch_size = 8192
+        self._size = None
+        self._reactor = reactor
 
         # Any thread can put events on the queue, but they should all be
         # "got" and processed by the main thread.
         self._event_queue = SimpleQueue()
         self._event_listeners = {}
-        Thread(target=self._input_reader, daemon=True).start()
-        signal(SIGWINCH, lambda _signal, _frame: self._event_queue.put(Event("resize")))
+        if reactor is None:
+            Thread(target=self._input_reader, daemon=True).start()
+            _resize_targets.add(self)
+            if not _resize_handler_installed:
+                signal(SIGWINCH, _on_sigwinch)
+                _resize_handler_installed = True
+        else:
+            reactor.register(self._input.fileno(), self._receive)
 
     @property
     def cursor(self):
         return self._cursor
 
+    @property
+    def color_depth(self):
+        """ Colour depth used for output, in bits.
+        """
+        return self._output.color_depth
+
     def add_event_listener(self, event_type, listener):
         self._event_listeners.setdefault(event_type, []).append(listener)
 
@@ -451,11 +754,28 @@ class Terminal:
     def _input_reader(self):
         while True:
             char_unit = self._input.read(1)
+            if not char_unit:
+                break
+            self._receive([char_unit])
+
+    def _receive(self, char_units):
+        for char_unit in char_units:
             if char_unit.startswith(APC):
                 self._event_queue.put(KeyboardEvent("__apc__", key=char_unit))
             else:
                 self._event_queue.put(KeyboardEvent("keypress", key=char_unit))
 
+    def resize(self, columns, lines, pixel_width=0, pixel_height=0):
+        """ Notify the terminal of a change in size, raising a resize event.
+        Once called, the given size is used for all measurements, in
+        preference to querying the underlying terminal device.
+
+        This is intended for terminals whose size is known by some other
+        means, such as a pty serving a remote client.
+        """
+        self._size = (lines, columns, pixel_width, pixel_height)
+        self._event_queue.put(Event("resize"))
+
     def loop(self, /, break_key=None, timeout=None) -> Match | str | None:
         """ Run an event-processing loop until either the nominated `break_key`
         is pressed, or a timeout occurs. If neither exit condition is
@@ -503,16 +823,28 @@ class Terminal:
         info.update(get_kitty_info(self))
         return info
 
-    def measure(self, unit="ch") -> (Rect, Rect):
+    def _get_window_size(self):
+        buffer = pack('HHHH', 0, 0, 0, 0)
         try:
-            buffer = pack('HHHH', 0, 0, 0, 0)
-            fd = os_open(ctermid(), O_RDONLY)
-            result = ioctl(fd, TIOCGWINSZ, buffer)
-            os_close(fd)
-        except OSError:
-            lines, columns, pixel_width, pixel_height = 0, 0, 0, 0
+            result = ioctl(self._output.fileno(), TIOCGWINSZ, buffer)
+        except (OSError, ValueError):
+            # Output is not a terminal device, so fall back to the
+            # controlling terminal
+            try:
+                fd = os_open(ctermid(), O_RDONLY)
+                try:
+                    result = ioctl(fd, TIOCGWINSZ, buffer)
+                finally:
+                    os_close(fd)
+            except OSError:
+                return 0, 0, 0, 0
+        return unpack('HHHH', result)
+
+    def measure(self, unit="ch") -> (Rect, Rect):
+        if self._size:
+            lines, columns, pixel_width, pixel_height = self._size
         else:
-            lines, columns, pixel_width, pixel_height = unpack('HHHH', result)
+            lines, columns, pixel_width, pixel_height = self._get_window_size()
         if lines == 0 and columns == 0 and unit == "ch":
             self._output.write(f"{CSI}18t")
             self._output.flush()
@@ -560,6 +892,8 @@ class Terminal:
         self._output.flush()
         self.cursor.show()
         self._output.reset_tty_mode()
+        if self._reactor is not None:
+            self._reactor.unregister(self._input.fileno())
 
     # def keypad_on(self):
     #     self._cout.write(f"{CSI}?1h{ESC}=")
@@ -572,6 +906,12 @@ class Terminal:
     def write(self, s, /, **style):
         self._output.write(s, **style)
 
+    def frame(self):
+        """ Context manager that collects output written by the current
+        thread and submits it as a single chunk on exit.
+        """
+        return self._output.frame()
+
     def flush(self):
         self._output.flush()
 
@@ -595,19 +935,86 @@ class Terminal:
         - ``font_style``
         - ``text_decoration``
 
+        Alternatively, a precompiled :class:`Style` object can be passed as
+        ``style``.
+
+        Everything is assembled into a single string, with style keywords
+        resolved only once, and written to the output in one go.
+
         :param objects:
         :param sep:
         :param end:
         :param flush:
         :param style:
         """
-        for i, obj in enumerate(objects):
-            if i > 0:
-                self._output.write(sep)
-            self._output.write(str(obj), **style)
-        self._output.write(end)
+        apply_style = _resolve_style(style.pop("style", None), self._output.color_depth, **style)
+        self._output._write(sep.join([apply_style(str(obj)) for obj in objects]) + end)
         if flush:
             self._output.flush()
 
-    def draw(self, image, /, method="auto"):
-        raise NotImplementedError
+    def print_many(self, rows, /, sep=' ', end='\r\n', flush=False, **style):
+        """ Print many rows of objects to the terminal output, as if by
+        calling :meth:`print` once per row, but more efficiently.
+
+        Each row should be a sequence of objects (a string is treated as a
+        single object). Rows are consumed lazily, so this can be used to
+        stream output from a generator. Style keywords are resolved only
+        once, and output is written in batches.
+
+        :param rows:
+        :param sep:
+        :param end:
+        :param flush:
+        :param style:
+        """
+        apply_style = _resolve_style(style.pop("style", None), self._output.color_depth, **style)
+        batch = []
+        batch_size = 0
+        for row in rows:
+            if isinstance(row, str):
+                row = (row,)
+            line = sep.join([apply_style(str(obj)) for obj in row]) + end
+            batch.append(line)
+            batch_size += len(line)
+            if batch_size >= self._batch_size:
+                self._output._write("".join(batch))
+                batch.clear()
+                batch_size = 0
+        if batch:
+            self._output._write("".join(batch))
+        if flush:
+            self._output.flush()
+
+    def draw(self, image, /, method="auto", medium="auto", compress=False):
+        """ Draw a PIL image at the cursor position.
+
+        The 'kitty' method sends raw pixel data to the terminal using the
+        kitty graphics protocol, either directly or through shared memory
+        (see :func:`pansi.image.kitty_commands` for `medium` and
+        `compress`). All other methods render the image as coloured
+        characters, scaled to cover roughly the same area as the image
+        (but no wider than the terminal): 'half' blocks, or a 'quadrant',
+        'sextant' or 'braille' mosaic. The 'auto' method selects 'kitty'
+        where the terminal supports the graphics protocol, and 'half'
+        otherwise.
+        """
+        from .image import BlockImage, MosaicImage, kitty_commands, _MOSAIC_MODES
+        if method == "auto":
+            method = "kitty" if self.get_info().get("kitty_graphics_protocol") == "OK" else "half"
+        if method == "kitty":
+            self._output._write("".join(kitty_commands(image, medium=medium, compress=compress)) + "\r\n")
+            return
+        if method != "half" and method not in _MOSAIC_MODES:
+            raise ValueError(f"Unknown drawing method {method!r}")
+        cells = self.measure("ch")
+        pixels = self.measure("px")
+        cell_width = pixels.width / cells.width
+        cell_height = pixels.height / cells.height
+        scale = min(1, cells.width * cell_width / image.width)
+        cols = max(1, ceil(image.width * scale / cell_width))
+        lines = max(1, ceil(image.height * scale / cell_height))
+        if method == "half":
+            rendered = BlockImage(image, lines=lines, cols=cols, color_depth=self._output.color_depth)
+        else:
+            rendered = MosaicImage(image, lines=lines, cols=cols, mode=method, color_depth=self._output.color_depth)
+        self.print_many(rendered.ansi_lines())
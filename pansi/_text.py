@@ -17,6 +17,8 @@ from io import StringIO
 # limitations under the License.
 
 
+from functools import lru_cache
+
 from ._sgr import (SGR, blink, bold, double_underline, italic,
                    light, line_through, overline, underline)
 
@@ -28,26 +30,40 @@ TO_SUPERSCRIPT = str.maketrans(dict(zip("()+-0123456789=in",
                                         "⁽⁾⁺⁻⁰¹²³⁴⁵⁶⁷⁸⁹⁼ⁱⁿ")))
 
 
-def color(value, web_palette_only=False) -> str:
-    """ Generate ANSI escape code string for given foreground colour value.
-    """
+# Interned escape strings for the most common style values
+_FONT_WEIGHTS = {"bold": str(bold), "normal": str(~bold), 700: str(bold), 400: str(~bold)}
+_FONT_STYLES = {"italic": str(italic), "oblique": str(italic), "normal": str(~italic)}
+
+
+def _color_escape(value, background, web_palette_only, color_depth) -> str:
     try:
-        sgr = SGR.for_color(value, web_palette_only=web_palette_only)
+        sgr = SGR.for_color(value, background=background, web_palette_only=web_palette_only,
+                            color_depth=color_depth)
     except ValueError:
         return ""
     else:
         return str(sgr)
 
 
-def background_color(value, web_palette_only=False) -> str:
+_cached_color_escape = lru_cache(maxsize=1024)(_color_escape)
+
+
+def color(value, web_palette_only=False, color_depth=24) -> str:
+    """ Generate ANSI escape code string for given foreground colour value.
+    """
+    try:
+        return _cached_color_escape(value, False, web_palette_only, color_depth)
+    except TypeError:
+        return _color_escape(value, False, web_palette_only, color_depth)
+
+
+def background_color(value, web_palette_only=False, color_depth=24) -> str:
     """ Generate ANSI escape code string for given background colour value.
     """
     try:
-        sgr = SGR.for_color(value, background=True, web_palette_only=web_palette_only)
-    except ValueError:
-        return ""
-    else:
-        return str(sgr)
+        return _cached_color_escape(value, True, web_palette_only, color_depth)
+    except TypeError:
+        return _color_escape(value, True, web_palette_only, color_depth)
 
 
 def font_weight(value) -> str:
@@ -59,6 +75,10 @@ def font_weight(value) -> str:
     '\x1b[1m'
 
     """
+    try:
+        return _FONT_WEIGHTS[value]
+    except (KeyError, TypeError):
+        pass
     try:
         weight = int(value)
     except (ValueError, TypeError):
@@ -83,6 +103,10 @@ def font_weight(value) -> str:
 def font_style(value) -> str:
     r""" Generate ANSI escape sequence for the given font style.
     """
+    try:
+        return _FONT_STYLES[value]
+    except (KeyError, TypeError):
+        pass
     value = str(value)
     if value in {"italic", "oblique"}:
         return str(italic)
@@ -99,7 +123,12 @@ def text_decoration(value) -> str:
     '\x1b[4m'
 
     """
-    values = str(value).lower().split()
+    return _text_decoration(str(value))
+
+
+@lru_cache(maxsize=256)
+def _text_decoration(value) -> str:
+    values = value.lower().split()
     codes = []
     if "underline" in values:
         if "double" in values:
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# This file is generated by tools/generate_unicode_tables.py -- do not edit.
+
+
+#: Version of the Unicode Character Database from which these tables
+#: were generated.
+UNICODE_VERSION = '14.0.0'
+
+#: Display width (0, 1 or 2 cells) of each code point, as a pair of
+#: parallel tables. WIDTHS[i] applies to all code points from
+#: WIDTH_STARTS[i] up to (but not including) WIDTH_STARTS[i + 1].
+WIDTH_STARTS = (
+    0x00000, 0x00020, 0x0007F, 0x000A0, 0x000AD, 0x000AE, 0x00300, 0x00370, 0x00378, 0x0037A,
+    0x00380, 0x00384, 0x0038B, 0x0038C, 0x0038D, 0x0038E, 0x003A2, 0x003A3, 0x00483, 0x0048A,
+    0x00530, 0x00531, 0x00557, 0x00559, 0x0058B, 0x0058D, 0x00590, 0x005BE, 0x005BF, 0x005C0,
+    0x005C1, 0x005C3, 0x005C4, 0x005C6, 0x005C7, 0x005D0, 0x005EB, 0x005EF, 0x005F5, 0x00606,
+    0x00610, 0x0061B, 0x0061C, 0x0061D, 0x0064B, 0x00660, 0x00670, 0x00671, 0x006D6, 0x006DE,
+    0x006DF, 0x006E5, 0x006E7, 0x006E9, 0x006EA, 0x006EE, 0x0070E, 0x00710, 0x00711, 0x00712,
+    0x00730, 0x0074D, 0x007A6, 0x007B1, 0x007B2, 0x007C0, 0x007EB, 0x007F4, 0x007FB, 0x007FE,
+    0x00816, 0x0081A, 0x0081B, 0x00824, 0x00825, 0x00828, 0x00829, 0x00830, 0x0083F, 0x00840,
+    0x00859, 0x0085E, 0x0085F, 0x00860, 0x0086B, 0x00870, 0x0088F, 0x008A0, 0x008CA, 0x00904,
+    0x0093A, 0x0093D, 0x0093E, 0x00950, 0x00951, 0x00958, 0x00962, 0x00964, 0x00981, 0x00985,
+    0x0098D, 0x0098F, 0x00991, 0x00993, 0x009A9, 0x009AA, 0x009B1, 0x009B2, 0x009B3, 0x009B6,
+    0x009BA, 0x009BD, 0x009BE, 0x009CE, 0x009CF, 0x009DC, 0x009DE, 0x009DF, 0x009E2, 0x009E6,
+    0x009FE, 0x00A05, 0x00A0B, 0x00A0F, 0x00A11, 0x00A13, 0x00A29, 0x00A2A, 0x00A31, 0x00A32,
+    0x00A34, 0x00A35, 0x00A37, 0x00A38, 0x00A3A, 0x00A59, 0x00A5D, 0x00A5E, 0x00A5F, 0x00A66,
+    0x00A70, 0x00A72, 0x00A75, 0x00A76, 0x00A77, 0x00A85, 0x00A8E, 0x00A8F, 0x00A92, 0x00A93,
+    0x00AA9, 0x00AAA, 0x00AB1, 0x00AB2, 0x00AB4, 0x00AB5, 0x00ABA, 0x00ABD, 0x00ABE, 0x00AD0,
+    0x00AD1, 0x00AE0, 0x00AE2, 0x00AE6, 0x00AF2, 0x00AF9, 0x00AFA, 0x00B05, 0x00B0D, 0x00B0F,
+    0x00B11, 0x00B13, 0x00B29, 0x00B2A, 0x00B31, 0x00B32, 0x00B34, 0x00B35, 0x00B3A, 0x00B3D,
+    0x00B3E, 0x00B5C, 0x00B5E, 0x00B5F, 0x00B62, 0x00B66, 0x00B78, 0x00B83, 0x00B84, 0x00B85,
+    0x00B8B, 0x00B8E, 0x00B91, 0x00B92, 0x00B96, 0x00B99, 0x00B9B, 0x00B9C, 0x00B9D, 0x00B9E,
+    0x00BA0, 0x00BA3, 0x00BA5, 0x00BA8, 0x00BAB, 0x00BAE, 0x00BBA, 0x00BD0, 0x00BD1, 0x00BE6,
+    0x00BFB, 0x00C05, 0x00C0D, 0x00C0E, 0x00C11, 0x00C12, 0x00C29, 0x00C2A, 0x00C3A, 0x00C3D,
+    0x00C3E, 0x00C58, 0x00C5B, 0x00C5D, 0x00C5E, 0x00C60, 0x00C62, 0x00C66, 0x00C70, 0x00C77,
+    0x00C81, 0x00C84, 0x00C8D, 0x00C8E, 0x00C91, 0x00C92, 0x00CA9, 0x00CAA, 0x00CB4, 0x00CB5,
+    0x00CBA, 0x00CBD, 0x00CBE, 0x00CDD, 0x00CDF, 0x00CE0, 0x00CE2, 0x00CE6, 0x00CF0, 0x00CF1,
+    0x00CF3, 0x00D04, 0x00D0D, 0x00D0E, 0x00D11, 0x00D12, 0x00D3B, 0x00D3D, 0x00D3E, 0x00D4E,
+    0x00D50, 0x00D54, 0x00D57, 0x00D58, 0x00D62, 0x00D66, 0x00D80, 0x00D85, 0x00D97, 0x00D9A,
+    0x00DB2, 0x00DB3, 0x00DBC, 0x00DBD, 0x00DBE, 0x00DC0, 0x00DC7, 0x00DE6, 0x00DF0, 0x00DF4,
+    0x00DF5, 0x00E01, 0x00E31, 0x00E32, 0x00E34, 0x00E3F, 0x00E47, 0x00E4F, 0x00E5C, 0x00E81,
+    0x00E83, 0x00E84, 0x00E85, 0x00E86, 0x00E8B, 0x00E8C, 0x00EA4, 0x00EA5, 0x00EA6, 0x00EA7,
+    0x00EB1, 0x00EB2, 0x00EB4, 0x00EBD, 0x00EBE, 0x00EC0, 0x00EC5, 0x00EC6, 0x00EC7, 0x00ED0,
+    0x00EDA, 0x00EDC, 0x00EE0, 0x00F00, 0x00F18, 0x00F1A, 0x00F35, 0x00F36, 0x00F37, 0x00F38,
+    0x00F39, 0x00F3A, 0x00F3E, 0x00F40, 0x00F48, 0x00F49, 0x00F6D, 0x00F85, 0x00F86, 0x00F88,
+    0x00F8D, 0x00FBE, 0x00FC6, 0x00FC7, 0x00FCD, 0x00FCE, 0x00FDB, 0x01000, 0x0102B, 0x0103F,
+    0x01056, 0x0105A, 0x0105E, 0x01061, 0x01062, 0x01065, 0x01067, 0x0106E, 0x01071, 0x01075,
+    0x01082, 0x0108E, 0x0108F, 0x01090, 0x0109A, 0x0109E, 0x010C6, 0x010C7, 0x010C8, 0x010CD,
+    0x010CE, 0x010D0, 0x01100, 0x01160, 0x01249, 0x0124A, 0x0124E, 0x01250, 0x01257, 0x01258,
+    0x01259, 0x0125A, 0x0125E, 0x01260, 0x01289, 0x0128A, 0x0128E, 0x01290, 0x012B1, 0x012B2,
+    0x012B6, 0x012B8, 0x012BF, 0x012C0, 0x012C1, 0x012C2, 0x012C6, 0x012C8, 0x012D7, 0x012D8,
+    0x01311, 0x01312, 0x01316, 0x01318, 0x0135B, 0x01360, 0x0137D, 0x01380, 0x0139A, 0x013A0,
+    0x013F6, 0x013F8, 0x013FE, 0x01400, 0x0169D, 0x016A0, 0x016F9, 0x01700, 0x01712, 0x0171F,
+    0x01732, 0x01735, 0x01737, 0x01740, 0x01752, 0x01760, 0x0176D, 0x0176E, 0x01771, 0x01780,
+    0x017B4, 0x017D4, 0x017DD, 0x017E0, 0x017EA, 0x017F0, 0x017FA, 0x01800, 0x0180B, 0x01810,
+    0x0181A, 0x01820, 0x01879, 0x01880, 0x01885, 0x01887, 0x018A9, 0x018AA, 0x018AB, 0x018B0,
+    0x018F6, 0x01900, 0x0191F, 0x01940, 0x01941, 0x01944, 0x0196E, 0x01970, 0x01975, 0x01980,
+    0x019AC, 0x019B0, 0x019CA, 0x019D0, 0x019DB, 0x019DE, 0x01A17, 0x01A1E, 0x01A55, 0x01A80,
+    0x01A8A, 0x01A90, 0x01A9A, 0x01AA0, 0x01AAE, 0x01B05, 0x01B34, 0x01B45, 0x01B4D, 0x01B50,
+    0x01B6B, 0x01B74, 0x01B7F, 0x01B83, 0x01BA1, 0x01BAE, 0x01BE6, 0x01BFC, 0x01C24, 0x01C3B,
+    0x01C4A, 0x01C4D, 0x01C89, 0x01C90, 0x01CBB, 0x01CBD, 0x01CC8, 0x01CD3, 0x01CD4, 0x01CE9,
+    0x01CED, 0x01CEE, 0x01CF4, 0x01CF5, 0x01CF7, 0x01CFA, 0x01CFB, 0x01D00, 0x01DC0, 0x01E00,
+    0x01F16, 0x01F18, 0x01F1E, 0x01F20, 0x01F46, 0x01F48, 0x01F4E, 0x01F50, 0x01F58, 0x01F59,
+    0x01F5A, 0x01F5B, 0x01F5C, 0x01F5D, 0x01F5E, 0x01F5F, 0x01F7E, 0x01F80, 0x01FB5, 0x01FB6,
+    0x01FC5, 0x01FC6, 0x01FD4, 0x01FD6, 0x01FDC, 0x01FDD, 0x01FF0, 0x01FF2, 0x01FF5, 0x01FF6,
+    0x01FFF, 0x02000, 0x0200B, 0x02010, 0x02028, 0x0202F, 0x02060, 0x02070, 0x02072, 0x02074,
+    0x0208F, 0x02090, 0x0209D, 0x020A0, 0x020C1, 0x02100, 0x0218C, 0x02190, 0x0231A, 0x0231C,
+    0x02329, 0x0232B, 0x023E9, 0x023ED, 0x023F0, 0x023F1, 0x023F3, 0x023F4, 0x02427, 0x02440,
+    0x0244B, 0x02460, 0x025FD, 0x025FF, 0x02614, 0x02616, 0x02648, 0x02654, 0x0267F, 0x02680,
+    0x02693, 0x02694, 0x026A1, 0x026A2, 0x026AA, 0x026AC, 0x026BD, 0x026BF, 0x026C4, 0x026C6,
+    0x026CE, 0x026CF, 0x026D4, 0x026D5, 0x026EA, 0x026EB, 0x026F2, 0x026F4, 0x026F5, 0x026F6,
+    0x026FA, 0x026FB, 0x026FD, 0x026FE, 0x02705, 0x02706, 0x0270A, 0x0270C, 0x02728, 0x02729,
+    0x0274C, 0x0274D, 0x0274E, 0x0274F, 0x02753, 0x02756, 0x02757, 0x02758, 0x02795, 0x02798,
+    0x027B0, 0x027B1, 0x027BF, 0x027C0, 0x02B1B, 0x02B1D, 0x02B50, 0x02B51, 0x02B55, 0x02B56,
+    0x02B74, 0x02B76, 0x02B96, 0x02B97, 0x02CEF, 0x02CF2, 0x02CF4, 0x02CF9, 0x02D26, 0x02D27,
+    0x02D28, 0x02D2D, 0x02D2E, 0x02D30, 0x02D68, 0x02D6F, 0x02D71, 0x02D80, 0x02D97, 0x02DA0,
+    0x02DA7, 0x02DA8, 0x02DAF, 0x02DB0, 0x02DB7, 0x02DB8, 0x02DBF, 0x02DC0, 0x02DC7, 0x02DC8,
+    0x02DCF, 0x02DD0, 0x02DD7, 0x02DD8, 0x02DDF, 0x02E00, 0x02E5E, 0x02E80, 0x02E9A, 0x02E9B,
+    0x02EF4, 0x02F00, 0x02FD6, 0x02FF0, 0x02FFC, 0x03000, 0x0302A, 0x03030, 0x0303F, 0x03040,
+    0x03041, 0x03097, 0x0309B, 0x03100, 0x03105, 0x03130, 0x03131, 0x0318F, 0x03190, 0x031E4,
+    0x031F0, 0x0321F, 0x03220, 0x03248, 0x03250, 0x04DC0, 0x04E00, 0x0A48D, 0x0A490, 0x0A4C7,
+    0x0A4D0, 0x0A62C, 0x0A640, 0x0A66F, 0x0A673, 0x0A674, 0x0A67E, 0x0A69E, 0x0A6A0, 0x0A6F0,
+    0x0A6F2, 0x0A6F8, 0x0A700, 0x0A7CB, 0x0A7D0, 0x0A7D2, 0x0A7D3, 0x0A7D4, 0x0A7D5, 0x0A7DA,
+    0x0A7F2, 0x0A802, 0x0A803, 0x0A806, 0x0A807, 0x0A80B, 0x0A80C, 0x0A823, 0x0A828, 0x0A82C,
+    0x0A830, 0x0A83A, 0x0A840, 0x0A878, 0x0A882, 0x0A8B4, 0x0A8CE, 0x0A8DA, 0x0A8F2, 0x0A8FF,
+    0x0A900, 0x0A926, 0x0A92E, 0x0A947, 0x0A95F, 0x0A960, 0x0A97D, 0x0A984, 0x0A9B3, 0x0A9C1,
+    0x0A9CE, 0x0A9CF, 0x0A9DA, 0x0A9DE, 0x0A9E5, 0x0A9E6, 0x0A9FF, 0x0AA00, 0x0AA29, 0x0AA40,
+    0x0AA43, 0x0AA44, 0x0AA4C, 0x0AA50, 0x0AA5A, 0x0AA5C, 0x0AA7B, 0x0AA7E, 0x0AAB0, 0x0AAB1,
+    0x0AAB2, 0x0AAB5, 0x0AAB7, 0x0AAB9, 0x0AABE, 0x0AAC0, 0x0AAC1, 0x0AAC2, 0x0AAC3, 0x0AADB,
+    0x0AAEB, 0x0AAF0, 0x0AAF5, 0x0AB01, 0x0AB07, 0x0AB09, 0x0AB0F, 0x0AB11, 0x0AB17, 0x0AB20,
+    0x0AB27, 0x0AB28, 0x0AB2F, 0x0AB30, 0x0AB6C, 0x0AB70, 0x0ABE3, 0x0ABEB, 0x0ABEC, 0x0ABF0,
+    0x0ABFA, 0x0AC00, 0x0D7A4, 0x0D7B0, 0x0D7C7, 0x0D7CB, 0x0D7FC, 0x0F900, 0x0FA6E, 0x0FA70,
+    0x0FADA, 0x0FB00, 0x0FB07, 0x0FB13, 0x0FB18, 0x0FB1D, 0x0FB1E, 0x0FB1F, 0x0FB37, 0x0FB38,
+    0x0FB3D, 0x0FB3E, 0x0FB3F, 0x0FB40, 0x0FB42, 0x0FB43, 0x0FB45, 0x0FB46, 0x0FBC3, 0x0FBD3,
+    0x0FD90, 0x0FD92, 0x0FDC8, 0x0FDCF, 0x0FDD0, 0x0FDF0, 0x0FE00, 0x0FE10, 0x0FE1A, 0x0FE30,
+    0x0FE53, 0x0FE54, 0x0FE67, 0x0FE68, 0x0FE6C, 0x0FE70, 0x0FE75, 0x0FE76, 0x0FEFD, 0x0FF01,
+    0x0FF61, 0x0FFBF, 0x0FFC2, 0x0FFC8, 0x0FFCA, 0x0FFD0, 0x0FFD2, 0x0FFD8, 0x0FFDA, 0x0FFDD,
+    0x0FFE0, 0x0FFE7, 0x0FFE8, 0x0FFEF, 0x0FFFC, 0x0FFFE, 0x10000, 0x1000C, 0x1000D, 0x10027,
+    0x10028, 0x1003B, 0x1003C, 0x1003E, 0x1003F, 0x1004E, 0x10050, 0x1005E, 0x10080, 0x100FB,
+    0x10100, 0x10103, 0x10107, 0x10134, 0x10137, 0x1018F, 0x10190, 0x1019D, 0x101A0, 0x101A1,
+    0x101D0, 0x101FD, 0x10280, 0x1029D, 0x102A0, 0x102D1, 0x102E1, 0x102FC, 0x10300, 0x10324,
+    0x1032D, 0x1034B, 0x10350, 0x10376, 0x10380, 0x1039E, 0x1039F, 0x103C4, 0x103C8, 0x103D6,
+    0x10400, 0x1049E, 0x104A0, 0x104AA, 0x104B0, 0x104D4, 0x104D8, 0x104FC, 0x10500, 0x10528,
+    0x10530, 0x10564, 0x1056F, 0x1057B, 0x1057C, 0x1058B, 0x1058C, 0x10593, 0x10594, 0x10596,
+    0x10597, 0x105A2, 0x105A3, 0x105B2, 0x105B3, 0x105BA, 0x105BB, 0x105BD, 0x10600, 0x10737,
+    0x10740, 0x10756, 0x10760, 0x10768, 0x10780, 0x10786, 0x10787, 0x107B1, 0x107B2, 0x107BB,
+    0x10800, 0x10806, 0x10808, 0x10809, 0x1080A, 0x10836, 0x10837, 0x10839, 0x1083C, 0x1083D,
+    0x1083F, 0x10856, 0x10857, 0x1089F, 0x108A7, 0x108B0, 0x108E0, 0x108F3, 0x108F4, 0x108F6,
+    0x108FB, 0x1091C, 0x1091F, 0x1093A, 0x1093F, 0x10940, 0x10980, 0x109B8, 0x109BC, 0x109D0,
+    0x109D2, 0x10A01, 0x10A10, 0x10A14, 0x10A15, 0x10A18, 0x10A19, 0x10A36, 0x10A40, 0x10A49,
+    0x10A50, 0x10A59, 0x10A60, 0x10AA0, 0x10AC0, 0x10AE5, 0x10AEB, 0x10AF7, 0x10B00, 0x10B36,
+    0x10B39, 0x10B56, 0x10B58, 0x10B73, 0x10B78, 0x10B92, 0x10B99, 0x10B9D, 0x10BA9, 0x10BB0,
+    0x10C00, 0x10C49, 0x10C80, 0x10CB3, 0x10CC0, 0x10CF3, 0x10CFA, 0x10D24, 0x10D30, 0x10D3A,
+    0x10E60, 0x10E7F, 0x10E80, 0x10EAA, 0x10EAD, 0x10EAE, 0x10EB0, 0x10EB2, 0x10F00, 0x10F28,
+    0x10F30, 0x10F46, 0x10F51, 0x10F5A, 0x10F70, 0x10F82, 0x10F86, 0x10F8A, 0x10FB0, 0x10FCC,
+    0x10FE0, 0x10FF7, 0x11003, 0x11038, 0x11047, 0x1104E, 0x11052, 0x11070, 0x11071, 0x11073,
+    0x11075, 0x11076, 0x11083, 0x110B0, 0x110BB, 0x110BD, 0x110BE, 0x110C2, 0x110D0, 0x110E9,
+    0x110F0, 0x110FA, 0x11103, 0x11127, 0x11136, 0x11145, 0x11147, 0x11148, 0x11150, 0x11173,
+    0x11174, 0x11177, 0x11183, 0x111B3, 0x111C1, 0x111C9, 0x111CD, 0x111CE, 0x111D0, 0x111E0,
+    0x111E1, 0x111F5, 0x11200, 0x11212, 0x11213, 0x1122C, 0x11238, 0x1123E, 0x11280, 0x11287,
+    0x11288, 0x11289, 0x1128A, 0x1128E, 0x1128F, 0x1129E, 0x1129F, 0x112AA, 0x112B0, 0x112DF,
+    0x112F0, 0x112FA, 0x11305, 0x1130D, 0x1130F, 0x11311, 0x11313, 0x11329, 0x1132A, 0x11331,
+    0x11332, 0x11334, 0x11335, 0x1133A, 0x1133D, 0x1133E, 0x11350, 0x11351, 0x1135D, 0x11362,
+    0x11400, 0x11435, 0x11447, 0x1145C, 0x1145D, 0x1145E, 0x1145F, 0x11462, 0x11480, 0x114B0,
+    0x114C4, 0x114C8, 0x114D0, 0x114DA, 0x11580, 0x115AF, 0x115C1, 0x115DC, 0x11600, 0x11630,
+    0x11641, 0x11645, 0x11650, 0x1165A, 0x11660, 0x1166D, 0x11680, 0x116AB, 0x116B8, 0x116BA,
+    0x116C0, 0x116CA, 0x11700, 0x1171B, 0x11730, 0x11747, 0x11800, 0x1182C, 0x1183B, 0x1183C,
+    0x118A0, 0x118F3, 0x118FF, 0x11907, 0x11909, 0x1190A, 0x1190C, 0x11914, 0x11915, 0x11917,
+    0x11918, 0x11930, 0x1193F, 0x11940, 0x11941, 0x11942, 0x11944, 0x11947, 0x11950, 0x1195A,
+    0x119A0, 0x119A8, 0x119AA, 0x119D1, 0x119E1, 0x119E4, 0x11A00, 0x11A01, 0x11A0B, 0x11A33,
+    0x11A3A, 0x11A3B, 0x11A3F, 0x11A47, 0x11A50, 0x11A51, 0x11A5C, 0x11A8A, 0x11A9A, 0x11AA3,
+    0x11AB0, 0x11AF9, 0x11C00, 0x11C09, 0x11C0A, 0x11C2F, 0x11C40, 0x11C46, 0x11C50, 0x11C6D,
+    0x11C70, 0x11C90, 0x11D00, 0x11D07, 0x11D08, 0x11D0A, 0x11D0B, 0x11D31, 0x11D46, 0x11D47,
+    0x11D50, 0x11D5A, 0x11D60, 0x11D66, 0x11D67, 0x11D69, 0x11D6A, 0x11D8A, 0x11D98, 0x11D99,
+    0x11DA0, 0x11DAA, 0x11EE0, 0x11EF3, 0x11EF7, 0x11EF9, 0x11FB0, 0x11FB1, 0x11FC0, 0x11FF2,
+    0x11FFF, 0x1239A, 0x12400, 0x1246F, 0x12470, 0x12475, 0x12480, 0x12544, 0x12F90, 0x12FF3,
+    0x13000, 0x1342F, 0x14400, 0x14647, 0x16800, 0x16A39, 0x16A40, 0x16A5F, 0x16A60, 0x16A6A,
+    0x16A6E, 0x16ABF, 0x16AC0, 0x16ACA, 0x16AD0, 0x16AEE, 0x16AF5, 0x16AF6, 0x16B00, 0x16B30,
+    0x16B37, 0x16B46, 0x16B50, 0x16B5A, 0x16B5B, 0x16B62, 0x16B63, 0x16B78, 0x16B7D, 0x16B90,
+    0x16E40, 0x16E9B, 0x16F00, 0x16F4B, 0x16F50, 0x16F51, 0x16F93, 0x16FA0, 0x16FE0, 0x16FE4,
+    0x17000, 0x187F8, 0x18800, 0x18CD6, 0x18D00, 0x18D09, 0x1AFF0, 0x1AFF4, 0x1AFF5, 0x1AFFC,
+    0x1AFFD, 0x1AFFF, 0x1B000, 0x1B123, 0x1B150, 0x1B153, 0x1B164, 0x1B168, 0x1B170, 0x1B2FC,
+    0x1BC00, 0x1BC6B, 0x1BC70, 0x1BC7D, 0x1BC80, 0x1BC89, 0x1BC90, 0x1BC9A, 0x1BC9C, 0x1BC9D,
+    0x1BC9F, 0x1BCA0, 0x1CF50, 0x1CFC4, 0x1D000, 0x1D0F6, 0x1D100, 0x1D127, 0x1D129, 0x1D165,
+    0x1D16A, 0x1D16D, 0x1D183, 0x1D185, 0x1D18C, 0x1D1AA, 0x1D1AE, 0x1D1EB, 0x1D200, 0x1D242,
+    0x1D245, 0x1D246, 0x1D2E0, 0x1D2F4, 0x1D300, 0x1D357, 0x1D360, 0x1D379, 0x1D400, 0x1D455,
+    0x1D456, 0x1D49D, 0x1D49E, 0x1D4A0, 0x1D4A2, 0x1D4A3, 0x1D4A5, 0x1D4A7, 0x1D4A9, 0x1D4AD,
+    0x1D4AE, 0x1D4BA, 0x1D4BB, 0x1D4BC, 0x1D4BD, 0x1D4C4, 0x1D4C5, 0x1D506, 0x1D507, 0x1D50B,
+    0x1D50D, 0x1D515, 0x1D516, 0x1D51D, 0x1D51E, 0x1D53A, 0x1D53B, 0x1D53F, 0x1D540, 0x1D545,
+    0x1D546, 0x1D547, 0x1D54A, 0x1D551, 0x1D552, 0x1D6A6, 0x1D6A8, 0x1D7CC, 0x1D7CE, 0x1DA00,
+    0x1DA37, 0x1DA3B, 0x1DA6D, 0x1DA75, 0x1DA76, 0x1DA84, 0x1DA85, 0x1DA8C, 0x1DF00, 0x1DF1F,
+    0x1E100, 0x1E12D, 0x1E137, 0x1E13E, 0x1E140, 0x1E14A, 0x1E14E, 0x1E150, 0x1E290, 0x1E2AE,
+    0x1E2C0, 0x1E2EC, 0x1E2F0, 0x1E2FA, 0x1E2FF, 0x1E300, 0x1E7E0, 0x1E7E7, 0x1E7E8, 0x1E7EC,
+    0x1E7ED, 0x1E7EF, 0x1E7F0, 0x1E7FF, 0x1E800, 0x1E8C5, 0x1E8C7, 0x1E8D0, 0x1E900, 0x1E944,
+    0x1E94B, 0x1E94C, 0x1E950, 0x1E95A, 0x1E95E, 0x1E960, 0x1EC71, 0x1ECB5, 0x1ED01, 0x1ED3E,
+    0x1EE00, 0x1EE04, 0x1EE05, 0x1EE20, 0x1EE21, 0x1EE23, 0x1EE24, 0x1EE25, 0x1EE27, 0x1EE28,
+    0x1EE29, 0x1EE33, 0x1EE34, 0x1EE38, 0x1EE39, 0x1EE3A, 0x1EE3B, 0x1EE3C, 0x1EE42, 0x1EE43,
+    0x1EE47, 0x1EE48, 0x1EE49, 0x1EE4A, 0x1EE4B, 0x1EE4C, 0x1EE4D, 0x1EE50, 0x1EE51, 0x1EE53,
+    0x1EE54, 0x1EE55, 0x1EE57, 0x1EE58, 0x1EE59, 0x1EE5A, 0x1EE5B, 0x1EE5C, 0x1EE5D, 0x1EE5E,
+    0x1EE5F, 0x1EE60, 0x1EE61, 0x1EE63, 0x1EE64, 0x1EE65, 0x1EE67, 0x1EE6B, 0x1EE6C, 0x1EE73,
+    0x1EE74, 0x1EE78, 0x1EE79, 0x1EE7D, 0x1EE7E, 0x1EE7F, 0x1EE80, 0x1EE8A, 0x1EE8B, 0x1EE9C,
+    0x1EEA1, 0x1EEA4, 0x1EEA5, 0x1EEAA, 0x1EEAB, 0x1EEBC, 0x1EEF0, 0x1EEF2, 0x1F000, 0x1F004,
+    0x1F005, 0x1F02C, 0x1F030, 0x1F094, 0x1F0A0, 0x1F0AF, 0x1F0B1, 0x1F0C0, 0x1F0C1, 0x1F0CF,
+    0x1F0D0, 0x1F0D1, 0x1F0F6, 0x1F100, 0x1F18E, 0x1F18F, 0x1F191, 0x1F19B, 0x1F1AE, 0x1F1E6,
+    0x1F200, 0x1F203, 0x1F210, 0x1F23C, 0x1F240, 0x1F249, 0x1F250, 0x1F252, 0x1F260, 0x1F266,
+    0x1F300, 0x1F321, 0x1F32D, 0x1F336, 0x1F337, 0x1F37D, 0x1F37E, 0x1F394, 0x1F3A0, 0x1F3CB,
+    0x1F3CF, 0x1F3D4, 0x1F3E0, 0x1F3F1, 0x1F3F4, 0x1F3F5, 0x1F3F8, 0x1F43F, 0x1F440, 0x1F441,
+    0x1F442, 0x1F4FD, 0x1F4FF, 0x1F53E, 0x1F54B, 0x1F54F, 0x1F550, 0x1F568, 0x1F57A, 0x1F57B,
+    0x1F595, 0x1F597, 0x1F5A4, 0x1F5A5, 0x1F5FB, 0x1F650, 0x1F680, 0x1F6C6, 0x1F6CC, 0x1F6CD,
+    0x1F6D0, 0x1F6D3, 0x1F6D5, 0x1F6D8, 0x1F6DD, 0x1F6E0, 0x1F6EB, 0x1F6ED, 0x1F6F0, 0x1F6F4,
+    0x1F6FD, 0x1F700, 0x1F774, 0x1F780, 0x1F7D9, 0x1F7E0, 0x1F7EC, 0x1F7F0, 0x1F7F1, 0x1F800,
+    0x1F80C, 0x1F810, 0x1F848, 0x1F850, 0x1F85A, 0x1F860, 0x1F888, 0x1F890, 0x1F8AE, 0x1F8B0,
+    0x1F8B2, 0x1F900, 0x1F90C, 0x1F93B, 0x1F93C, 0x1F946, 0x1F947, 0x1FA00, 0x1FA54, 0x1FA60,
+    0x1FA6E, 0x1FA70, 0x1FA75, 0x1FA78, 0x1FA7D, 0x1FA80, 0x1FA87, 0x1FA90, 0x1FAAD, 0x1FAB0,
+    0x1FABB, 0x1FAC0, 0x1FAC6, 0x1FAD0, 0x1FADA, 0x1FAE0, 0x1FAE8, 0x1FAF0, 0x1FAF7, 0x1FB00,
+    0x1FB93, 0x1FB94, 0x1FBCB, 0x1FBF0, 0x1FBFA, 0x20000, 0x2A6E0, 0x2A700, 0x2B739, 0x2B740,
+    0x2B81E, 0x2B820, 0x2CEA2, 0x2CEB0, 0x2EBE1, 0x2F800, 0x2FA1E, 0x30000, 0x3134B,
+)
+WIDTHS = (
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 2, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 0, 1, 0, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+    2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+    2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 1, 0, 2, 0,
+    2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 1, 2, 1, 2, 0, 2, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 2,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 2, 0, 1, 0, 1, 0, 2, 0, 2,
+    0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 2, 0, 2, 0, 2,
+    0, 2, 0, 1, 0, 1, 0, 2, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 2, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 2, 0,
+    2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 2, 1, 0, 1, 0,
+    1, 0, 1, 0, 1, 2, 0, 1, 0, 1, 2, 1, 2, 1, 0, 1, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 1, 2, 1, 2, 1,
+    2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+    2, 1, 2, 1, 2, 0, 2, 1, 2, 0, 1, 2, 0, 1, 0, 1, 0, 2, 0, 2, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+    0, 1, 2, 1, 2, 1, 2, 1, 0, 1, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 1, 0, 1,
+    0, 1, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0,
+)
+
+#: Grapheme_Cluster_Break property values (UAX #29), with
+#: Extended_Pictographic included as an additional value.
+GCB_OTHER = 0
+GCB_CR = 1
+GCB_LF = 2
+GCB_CONTROL = 3
+GCB_EXTEND = 4
+GCB_ZWJ = 5
+GCB_REGIONAL_INDICATOR = 6
+GCB_PREPEND = 7
+GCB_SPACING_MARK = 8
+GCB_L = 9
+GCB_V = 10
+GCB_T = 11
+GCB_LV = 12
+GCB_LVT = 13
+GCB_EXTENDED_PICTOGRAPHIC = 14
+
+#: Grapheme_Cluster_Break property of each code point, as a pair of
+#: parallel tables, arranged in the same way as the width tables.
+GRAPHEME_BREAK_STARTS = (
+    0x00000, 0x0000A, 0x0000B, 0x0000D, 0x0000E, 0x00020, 0x0007F, 0x000A0, 0x000A9, 0x000AA,
+    0x000AD, 0x000AE, 0x000AF, 0x00300, 0x00370, 0x00483, 0x0048A, 0x00591, 0x005BE, 0x005BF,
+    0x005C0, 0x005C1, 0x005C3, 0x005C4, 0x005C6, 0x005C7, 0x005C8, 0x00600, 0x00606, 0x00610,
+    0x0061B, 0x0061C, 0x0061D, 0x0064B, 0x00660, 0x00670, 0x00671, 0x006D6, 0x006DD, 0x006DE,
+    0x006DF, 0x006E5, 0x006E7, 0x006E9, 0x006EA, 0x006EE, 0x0070F, 0x00710, 0x00711, 0x00712,
+    0x00730, 0x0074B, 0x007A6, 0x007B1, 0x007EB, 0x007F4, 0x007FD, 0x007FE, 0x00816, 0x0081A,
+    0x0081B, 0x00824, 0x00825, 0x00828, 0x00829, 0x0082E, 0x00859, 0x0085C, 0x00890, 0x00892,
+    0x00898, 0x008A0, 0x008CA, 0x008E2, 0x008E3, 0x00903, 0x00904, 0x0093A, 0x0093B, 0x0093C,
+    0x0093D, 0x0093E, 0x00941, 0x00949, 0x0094D, 0x0094E, 0x00950, 0x00951, 0x00958, 0x00962,
+    0x00964, 0x00981, 0x00982, 0x00984, 0x009BC, 0x009BD, 0x009BE, 0x009BF, 0x009C1, 0x009C5,
+    0x009C7, 0x009C9, 0x009CB, 0x009CD, 0x009CE, 0x009D7, 0x009D8, 0x009E2, 0x009E4, 0x009FE,
+    0x009FF, 0x00A01, 0x00A03, 0x00A04, 0x00A3C, 0x00A3D, 0x00A3E, 0x00A41, 0x00A43, 0x00A47,
+    0x00A49, 0x00A4B, 0x00A4E, 0x00A51, 0x00A52, 0x00A70, 0x00A72, 0x00A75, 0x00A76, 0x00A81,
+    0x00A83, 0x00A84, 0x00ABC, 0x00ABD, 0x00ABE, 0x00AC1, 0x00AC6, 0x00AC7, 0x00AC9, 0x00ACA,
+    0x00ACB, 0x00ACD, 0x00ACE, 0x00AE2, 0x00AE4, 0x00AFA, 0x00B00, 0x00B01, 0x00B02, 0x00B04,
+    0x00B3C, 0x00B3D, 0x00B3E, 0x00B40, 0x00B41, 0x00B45, 0x00B47, 0x00B49, 0x00B4B, 0x00B4D,
+    0x00B4E, 0x00B55, 0x00B58, 0x00B62, 0x00B64, 0x00B82, 0x00B83, 0x00BBE, 0x00BBF, 0x00BC0,
+    0x00BC1, 0x00BC3, 0x00BC6, 0x00BC9, 0x00BCA, 0x00BCD, 0x00BCE, 0x00BD7, 0x00BD8, 0x00C00,
+    0x00C01, 0x00C04, 0x00C05, 0x00C3C, 0x00C3D, 0x00C3E, 0x00C41, 0x00C45, 0x00C46, 0x00C49,
+    0x00C4A, 0x00C4E, 0x00C55, 0x00C57, 0x00C62, 0x00C64, 0x00C81, 0x00C82, 0x00C84, 0x00CBC,
+    0x00CBD, 0x00CBE, 0x00CBF, 0x00CC0, 0x00CC2, 0x00CC3, 0x00CC5, 0x00CC6, 0x00CC7, 0x00CC9,
+    0x00CCA, 0x00CCC, 0x00CCE, 0x00CD5, 0x00CD7, 0x00CE2, 0x00CE4, 0x00D00, 0x00D02, 0x00D04,
+    0x00D3B, 0x00D3D, 0x00D3E, 0x00D3F, 0x00D41, 0x00D45, 0x00D46, 0x00D49, 0x00D4A, 0x00D4D,
+    0x00D4E, 0x00D4F, 0x00D57, 0x00D58, 0x00D62, 0x00D64, 0x00D81, 0x00D82, 0x00D84, 0x00DCA,
+    0x00DCB, 0x00DCF, 0x00DD0, 0x00DD2, 0x00DD5, 0x00DD6, 0x00DD7, 0x00DD8, 0x00DDF, 0x00DE0,
+    0x00DF2, 0x00DF4, 0x00E31, 0x00E32, 0x00E33, 0x00E34, 0x00E3B, 0x00E47, 0x00E4F, 0x00EB1,
+    0x00EB2, 0x00EB3, 0x00EB4, 0x00EBD, 0x00EC8, 0x00ECE, 0x00F18, 0x00F1A, 0x00F35, 0x00F36,
+    0x00F37, 0x00F38, 0x00F39, 0x00F3A, 0x00F3E, 0x00F40, 0x00F71, 0x00F7F, 0x00F80, 0x00F85,
+    0x00F86, 0x00F88, 0x00F8D, 0x00F98, 0x00F99, 0x00FBD, 0x00FC6, 0x00FC7, 0x0102D, 0x01031,
+    0x01032, 0x01038, 0x01039, 0x0103B, 0x0103D, 0x0103F, 0x01056, 0x01058, 0x0105A, 0x0105E,
+    0x01061, 0x01071, 0x01075, 0x01082, 0x01083, 0x01084, 0x01085, 0x01087, 0x0108D, 0x0108E,
+    0x0109D, 0x0109E, 0x01100, 0x01160, 0x011A8, 0x01200, 0x0135D, 0x01360, 0x01712, 0x01715,
+    0x01716, 0x01732, 0x01734, 0x01735, 0x01752, 0x01754, 0x01772, 0x01774, 0x017B4, 0x017B6,
+    0x017B7, 0x017BE, 0x017C6, 0x017C7, 0x017C9, 0x017D4, 0x017DD, 0x017DE, 0x0180B, 0x0180E,
+    0x0180F, 0x01810, 0x01885, 0x01887, 0x018A9, 0x018AA, 0x01920, 0x01923, 0x01927, 0x01929,
+    0x0192C, 0x01930, 0x01932, 0x01933, 0x01939, 0x0193C, 0x01A17, 0x01A19, 0x01A1B, 0x01A1C,
+    0x01A55, 0x01A56, 0x01A57, 0x01A58, 0x01A5F, 0x01A60, 0x01A61, 0x01A62, 0x01A63, 0x01A65,
+    0x01A6D, 0x01A73, 0x01A7D, 0x01A7F, 0x01A80, 0x01AB0, 0x01ACF, 0x01B00, 0x01B04, 0x01B05,
+    0x01B34, 0x01B3B, 0x01B3C, 0x01B3D, 0x01B42, 0x01B43, 0x01B45, 0x01B6B, 0x01B74, 0x01B80,
+    0x01B82, 0x01B83, 0x01BA1, 0x01BA2, 0x01BA6, 0x01BA8, 0x01BAA, 0x01BAB, 0x01BAE, 0x01BE6,
+    0x01BE7, 0x01BE8, 0x01BEA, 0x01BED, 0x01BEE, 0x01BEF, 0x01BF2, 0x01BF4, 0x01C24, 0x01C2C,
+    0x01C34, 0x01C36, 0x01C38, 0x01CD0, 0x01CD3, 0x01CD4, 0x01CE1, 0x01CE2, 0x01CE9, 0x01CED,
+    0x01CEE, 0x01CF4, 0x01CF5, 0x01CF7, 0x01CF8, 0x01CFA, 0x01DC0, 0x01E00, 0x0200B, 0x0200C,
+    0x0200D, 0x0200E, 0x02010, 0x02028, 0x0202F, 0x0203C, 0x0203D, 0x02049, 0x0204A, 0x02060,
+    0x02070, 0x020D0, 0x020F1, 0x02122, 0x02123, 0x02139, 0x0213A, 0x02194, 0x0219A, 0x021A9,
+    0x021AB, 0x0231A, 0x0231C, 0x02328, 0x02329, 0x02388, 0x02389, 0x023CF, 0x023D0, 0x023E9,
+    0x023F4, 0x023F8, 0x023FB, 0x024C2, 0x024C3, 0x025AA, 0x025AC, 0x025B6, 0x025B7, 0x025C0,
+    0x025C1, 0x025FB, 0x025FF, 0x02600, 0x02606, 0x02607, 0x02613, 0x02614, 0x02686, 0x02690,
+    0x02706, 0x02708, 0x02713, 0x02714, 0x02715, 0x02716, 0x02717, 0x0271D, 0x0271E, 0x02721,
+    0x02722, 0x02728, 0x02729, 0x02733, 0x02735, 0x02744, 0x02745, 0x02747, 0x02748, 0x0274C,
+    0x0274D, 0x0274E, 0x0274F, 0x02753, 0x02756, 0x02757, 0x02758, 0x02763, 0x02768, 0x02795,
+    0x02798, 0x027A1, 0x027A2, 0x027B0, 0x027B1, 0x027BF, 0x027C0, 0x02934, 0x02936, 0x02B05,
+    0x02B08, 0x02B1B, 0x02B1D, 0x02B50, 0x02B51, 0x02B55, 0x02B56, 0x02CEF, 0x02CF2, 0x02D7F,
+    0x02D80, 0x02DE0, 0x02E00, 0x0302A, 0x03030, 0x03031, 0x0303D, 0x0303E, 0x03099, 0x0309B,
+    0x03297, 0x03298, 0x03299, 0x0329A, 0x0A66F, 0x0A673, 0x0A674, 0x0A67E, 0x0A69E, 0x0A6A0,
+    0x0A6F0, 0x0A6F2, 0x0A802, 0x0A803, 0x0A806, 0x0A807, 0x0A80B, 0x0A80C, 0x0A823, 0x0A825,
+    0x0A827, 0x0A828, 0x0A82C, 0x0A82D, 0x0A880, 0x0A882, 0x0A8B4, 0x0A8C4, 0x0A8C6, 0x0A8E0,
+    0x0A8F2, 0x0A8FF, 0x0A900, 0x0A926, 0x0A92E, 0x0A947, 0x0A952, 0x0A954, 0x0A960, 0x0A97D,
+    0x0A980, 0x0A983, 0x0A984, 0x0A9B3, 0x0A9B4, 0x0A9B6, 0x0A9BA, 0x0A9BC, 0x0A9BE, 0x0A9C1,
+    0x0A9E5, 0x0A9E6, 0x0AA29, 0x0AA2F, 0x0AA31, 0x0AA33, 0x0AA35, 0x0AA37, 0x0AA43, 0x0AA44,
+    0x0AA4C, 0x0AA4D, 0x0AA4E, 0x0AA7C, 0x0AA7D, 0x0AAB0, 0x0AAB1, 0x0AAB2, 0x0AAB5, 0x0AAB7,
+    0x0AAB9, 0x0AABE, 0x0AAC0, 0x0AAC1, 0x0AAC2, 0x0AAEB, 0x0AAEC, 0x0AAEE, 0x0AAF0, 0x0AAF5,
+    0x0AAF6, 0x0AAF7, 0x0ABE3, 0x0ABE5, 0x0ABE6, 0x0ABE8, 0x0ABE9, 0x0ABEB, 0x0ABEC, 0x0ABED,
+    0x0ABEE, 0x0AC00, 0x0AC01, 0x0AC1C, 0x0AC1D, 0x0AC38, 0x0AC39, 0x0AC54, 0x0AC55, 0x0AC70,
+    0x0AC71, 0x0AC8C, 0x0AC8D, 0x0ACA8, 0x0ACA9, 0x0ACC4, 0x0ACC5, 0x0ACE0, 0x0ACE1, 0x0ACFC,
+    0x0ACFD, 0x0AD18, 0x0AD19, 0x0AD34, 0x0AD35, 0x0AD50, 0x0AD51, 0x0AD6C, 0x0AD6D, 0x0AD88,
+    0x0AD89, 0x0ADA4, 0x0ADA5, 0x0ADC0, 0x0ADC1, 0x0ADDC, 0x0ADDD, 0x0ADF8, 0x0ADF9, 0x0AE14,
+    0x0AE15, 0x0AE30, 0x0AE31, 0x0AE4C, 0x0AE4D, 0x0AE68, 0x0AE69, 0x0AE84, 0x0AE85, 0x0AEA0,
+    0x0AEA1, 0x0AEBC, 0x0AEBD, 0x0AED8, 0x0AED9, 0x0AEF4, 0x0AEF5, 0x0AF10, 0x0AF11, 0x0AF2C,
+    0x0AF2D, 0x0AF48, 0x0AF49, 0x0AF64, 0x0AF65, 0x0AF80, 0x0AF81, 0x0AF9C, 0x0AF9D, 0x0AFB8,
+    0x0AFB9, 0x0AFD4, 0x0AFD5, 0x0AFF0, 0x0AFF1, 0x0B00C, 0x0B00D, 0x0B028, 0x0B029, 0x0B044,
+    0x0B045, 0x0B060, 0x0B061, 0x0B07C, 0x0B07D, 0x0B098, 0x0B099, 0x0B0B4, 0x0B0B5, 0x0B0D0,
+    0x0B0D1, 0x0B0EC, 0x0B0ED, 0x0B108, 0x0B109, 0x0B124, 0x0B125, 0x0B140, 0x0B141, 0x0B15C,
+    0x0B15D, 0x0B178, 0x0B179, 0x0B194, 0x0B195, 0x0B1B0, 0x0B1B1, 0x0B1CC, 0x0B1CD, 0x0B1E8,
+    0x0B1E9, 0x0B204, 0x0B205, 0x0B220, 0x0B221, 0x0B23C, 0x0B23D, 0x0B258, 0x0B259, 0x0B274,
+    0x0B275, 0x0B290, 0x0B291, 0x0B2AC, 0x0B2AD, 0x0B2C8, 0x0B2C9, 0x0B2E4, 0x0B2E5, 0x0B300,
+    0x0B301, 0x0B31C, 0x0B31D, 0x0B338, 0x0B339, 0x0B354, 0x0B355, 0x0B370, 0x0B371, 0x0B38C,
+    0x0B38D, 0x0B3A8, 0x0B3A9, 0x0B3C4, 0x0B3C5, 0x0B3E0, 0x0B3E1, 0x0B3FC, 0x0B3FD, 0x0B418,
+    0x0B419, 0x0B434, 0x0B435, 0x0B450, 0x0B451, 0x0B46C, 0x0B46D, 0x0B488, 0x0B489, 0x0B4A4,
+    0x0B4A5, 0x0B4C0, 0x0B4C1, 0x0B4DC, 0x0B4DD, 0x0B4F8, 0x0B4F9, 0x0B514, 0x0B515, 0x0B530,
+    0x0B531, 0x0B54C, 0x0B54D, 0x0B568, 0x0B569, 0x0B584, 0x0B585, 0x0B5A0, 0x0B5A1, 0x0B5BC,
+    0x0B5BD, 0x0B5D8, 0x0B5D9, 0x0B5F4, 0x0B5F5, 0x0B610, 0x0B611, 0x0B62C, 0x0B62D, 0x0B648,
+    0x0B649, 0x0B664, 0x0B665, 0x0B680, 0x0B681, 0x0B69C, 0x0B69D, 0x0B6B8, 0x0B6B9, 0x0B6D4,
+    0x0B6D5, 0x0B6F0, 0x0B6F1, 0x0B70C, 0x0B70D, 0x0B728, 0x0B729, 0x0B744, 0x0B745, 0x0B760,
+    0x0B761, 0x0B77C, 0x0B77D, 0x0B798, 0x0B799, 0x0B7B4, 0x0B7B5, 0x0B7D0, 0x0B7D1, 0x0B7EC,
+    0x0B7ED, 0x0B808, 0x0B809, 0x0B824, 0x0B825, 0x0B840, 0x0B841, 0x0B85C, 0x0B85D, 0x0B878,
+    0x0B879, 0x0B894, 0x0B895, 0x0B8B0, 0x0B8B1, 0x0B8CC, 0x0B8CD, 0x0B8E8, 0x0B8E9, 0x0B904,
+    0x0B905, 0x0B920, 0x0B921, 0x0B93C, 0x0B93D, 0x0B958, 0x0B959, 0x0B974, 0x0B975, 0x0B990,
+    0x0B991, 0x0B9AC, 0x0B9AD, 0x0B9C8, 0x0B9C9, 0x0B9E4, 0x0B9E5, 0x0BA00, 0x0BA01, 0x0BA1C,
+    0x0BA1D, 0x0BA38, 0x0BA39, 0x0BA54, 0x0BA55, 0x0BA70, 0x0BA71, 0x0BA8C, 0x0BA8D, 0x0BAA8,
+    0x0BAA9, 0x0BAC4, 0x0BAC5, 0x0BAE0, 0x0BAE1, 0x0BAFC, 0x0BAFD, 0x0BB18, 0x0BB19, 0x0BB34,
+    0x0BB35, 0x0BB50, 0x0BB51, 0x0BB6C, 0x0BB6D, 0x0BB88, 0x0BB89, 0x0BBA4, 0x0BBA5, 0x0BBC0,
+    0x0BBC1, 0x0BBDC, 0x0BBDD, 0x0BBF8, 0x0BBF9, 0x0BC14, 0x0BC15, 0x0BC30, 0x0BC31, 0x0BC4C,
+    0x0BC4D, 0x0BC68, 0x0BC69, 0x0BC84, 0x0BC85, 0x0BCA0, 0x0BCA1, 0x0BCBC, 0x0BCBD, 0x0BCD8,
+    0x0BCD9, 0x0BCF4, 0x0BCF5, 0x0BD10, 0x0BD11, 0x0BD2C, 0x0BD2D, 0x0BD48, 0x0BD49, 0x0BD64,
+    0x0BD65, 0x0BD80, 0x0BD81, 0x0BD9C, 0x0BD9D, 0x0BDB8, 0x0BDB9, 0x0BDD4, 0x0BDD5, 0x0BDF0,
+    0x0BDF1, 0x0BE0C, 0x0BE0D, 0x0BE28, 0x0BE29, 0x0BE44, 0x0BE45, 0x0BE60, 0x0BE61, 0x0BE7C,
+    0x0BE7D, 0x0BE98, 0x0BE99, 0x0BEB4, 0x0BEB5, 0x0BED0, 0x0BED1, 0x0BEEC, 0x0BEED, 0x0BF08,
+    0x0BF09, 0x0BF24, 0x0BF25, 0x0BF40, 0x0BF41, 0x0BF5C, 0x0BF5D, 0x0BF78, 0x0BF79, 0x0BF94,
+    0x0BF95, 0x0BFB0, 0x0BFB1, 0x0BFCC, 0x0BFCD, 0x0BFE8, 0x0BFE9, 0x0C004, 0x0C005, 0x0C020,
+    0x0C021, 0x0C03C, 0x0C03D, 0x0C058, 0x0C059, 0x0C074, 0x0C075, 0x0C090, 0x0C091, 0x0C0AC,
+    0x0C0AD, 0x0C0C8, 0x0C0C9, 0x0C0E4, 0x0C0E5, 0x0C100, 0x0C101, 0x0C11C, 0x0C11D, 0x0C138,
+    0x0C139, 0x0C154, 0x0C155, 0x0C170, 0x0C171, 0x0C18C, 0x0C18D, 0x0C1A8, 0x0C1A9, 0x0C1C4,
+    0x0C1C5, 0x0C1E0, 0x0C1E1, 0x0C1FC, 0x0C1FD, 0x0C218, 0x0C219, 0x0C234, 0x0C235, 0x0C250,
+    0x0C251, 0x0C26C, 0x0C26D, 0x0C288, 0x0C289, 0x0C2A4, 0x0C2A5, 0x0C2C0, 0x0C2C1, 0x0C2DC,
+    0x0C2DD, 0x0C2F8, 0x0C2F9, 0x0C314, 0x0C315, 0x0C330, 0x0C331, 0x0C34C, 0x0C34D, 0x0C368,
+    0x0C369, 0x0C384, 0x0C385, 0x0C3A0, 0x0C3A1, 0x0C3BC, 0x0C3BD, 0x0C3D8, 0x0C3D9, 0x0C3F4,
+    0x0C3F5, 0x0C410, 0x0C411, 0x0C42C, 0x0C42D, 0x0C448, 0x0C449, 0x0C464, 0x0C465, 0x0C480,
+    0x0C481, 0x0C49C, 0x0C49D, 0x0C4B8, 0x0C4B9, 0x0C4D4, 0x0C4D5, 0x0C4F0, 0x0C4F1, 0x0C50C,
+    0x0C50D, 0x0C528, 0x0C529, 0x0C544, 0x0C545, 0x0C560, 0x0C561, 0x0C57C, 0x0C57D, 0x0C598,
+    0x0C599, 0x0C5B4, 0x0C5B5, 0x0C5D0, 0x0C5D1, 0x0C5EC, 0x0C5ED, 0x0C608, 0x0C609, 0x0C624,
+    0x0C625, 0x0C640, 0x0C641, 0x0C65C, 0x0C65D, 0x0C678, 0x0C679, 0x0C694, 0x0C695, 0x0C6B0,
+    0x0C6B1, 0x0C6CC, 0x0C6CD, 0x0C6E8, 0x0C6E9, 0x0C704, 0x0C705, 0x0C720, 0x0C721, 0x0C73C,
+    0x0C73D, 0x0C758, 0x0C759, 0x0C774, 0x0C775, 0x0C790, 0x0C791, 0x0C7AC, 0x0C7AD, 0x0C7C8,
+    0x0C7C9, 0x0C7E4, 0x0C7E5, 0x0C800, 0x0C801, 0x0C81C, 0x0C81D, 0x0C838, 0x0C839, 0x0C854,
+    0x0C855, 0x0C870, 0x0C871, 0x0C88C, 0x0C88D, 0x0C8A8, 0x0C8A9, 0x0C8C4, 0x0C8C5, 0x0C8E0,
+    0x0C8E1, 0x0C8FC, 0x0C8FD, 0x0C918, 0x0C919, 0x0C934, 0x0C935, 0x0C950, 0x0C951, 0x0C96C,
+    0x0C96D, 0x0C988, 0x0C989, 0x0C9A4, 0x0C9A5, 0x0C9C0, 0x0C9C1, 0x0C9DC, 0x0C9DD, 0x0C9F8,
+    0x0C9F9, 0x0CA14, 0x0CA15, 0x0CA30, 0x0CA31, 0x0CA4C, 0x0CA4D, 0x0CA68, 0x0CA69, 0x0CA84,
+    0x0CA85, 0x0CAA0, 0x0CAA1, 0x0CABC, 0x0CABD, 0x0CAD8, 0x0CAD9, 0x0CAF4, 0x0CAF5, 0x0CB10,
+    0x0CB11, 0x0CB2C, 0x0CB2D, 0x0CB48, 0x0CB49, 0x0CB64, 0x0CB65, 0x0CB80, 0x0CB81, 0x0CB9C,
+    0x0CB9D, 0x0CBB8, 0x0CBB9, 0x0CBD4, 0x0CBD5, 0x0CBF0, 0x0CBF1, 0x0CC0C, 0x0CC0D, 0x0CC28,
+    0x0CC29, 0x0CC44, 0x0CC45, 0x0CC60, 0x0CC61, 0x0CC7C, 0x0CC7D, 0x0CC98, 0x0CC99, 0x0CCB4,
+    0x0CCB5, 0x0CCD0, 0x0CCD1, 0x0CCEC, 0x0CCED, 0x0CD08, 0x0CD09, 0x0CD24, 0x0CD25, 0x0CD40,
+    0x0CD41, 0x0CD5C, 0x0CD5D, 0x0CD78, 0x0CD79, 0x0CD94, 0x0CD95, 0x0CDB0, 0x0CDB1, 0x0CDCC,
+    0x0CDCD, 0x0CDE8, 0x0CDE9, 0x0CE04, 0x0CE05, 0x0CE20, 0x0CE21, 0x0CE3C, 0x0CE3D, 0x0CE58,
+    0x0CE59, 0x0CE74, 0x0CE75, 0x0CE90, 0x0CE91, 0x0CEAC, 0x0CEAD, 0x0CEC8, 0x0CEC9, 0x0CEE4,
+    0x0CEE5, 0x0CF00, 0x0CF01, 0x0CF1C, 0x0CF1D, 0x0CF38, 0x0CF39, 0x0CF54, 0x0CF55, 0x0CF70,
+    0x0CF71, 0x0CF8C, 0x0CF8D, 0x0CFA8, 0x0CFA9, 0x0CFC4, 0x0CFC5, 0x0CFE0, 0x0CFE1, 0x0CFFC,
+    0x0CFFD, 0x0D018, 0x0D019, 0x0D034, 0x0D035, 0x0D050, 0x0D051, 0x0D06C, 0x0D06D, 0x0D088,
+    0x0D089, 0x0D0A4, 0x0D0A5, 0x0D0C0, 0x0D0C1, 0x0D0DC, 0x0D0DD, 0x0D0F8, 0x0D0F9, 0x0D114,
+    0x0D115, 0x0D130, 0x0D131, 0x0D14C, 0x0D14D, 0x0D168, 0x0D169, 0x0D184, 0x0D185, 0x0D1A0,
+    0x0D1A1, 0x0D1BC, 0x0D1BD, 0x0D1D8, 0x0D1D9, 0x0D1F4, 0x0D1F5, 0x0D210, 0x0D211, 0x0D22C,
+    0x0D22D, 0x0D248, 0x0D249, 0x0D264, 0x0D265, 0x0D280, 0x0D281, 0x0D29C, 0x0D29D, 0x0D2B8,
+    0x0D2B9, 0x0D2D4, 0x0D2D5, 0x0D2F0, 0x0D2F1, 0x0D30C, 0x0D30D, 0x0D328, 0x0D329, 0x0D344,
+    0x0D345, 0x0D360, 0x0D361, 0x0D37C, 0x0D37D, 0x0D398, 0x0D399, 0x0D3B4, 0x0D3B5, 0x0D3D0,
+    0x0D3D1, 0x0D3EC, 0x0D3ED, 0x0D408, 0x0D409, 0x0D424, 0x0D425, 0x0D440, 0x0D441, 0x0D45C,
+    0x0D45D, 0x0D478, 0x0D479, 0x0D494, 0x0D495, 0x0D4B0, 0x0D4B1, 0x0D4CC, 0x0D4CD, 0x0D4E8,
+    0x0D4E9, 0x0D504, 0x0D505, 0x0D520, 0x0D521, 0x0D53C, 0x0D53D, 0x0D558, 0x0D559, 0x0D574,
+    0x0D575, 0x0D590, 0x0D591, 0x0D5AC, 0x0D5AD, 0x0D5C8, 0x0D5C9, 0x0D5E4, 0x0D5E5, 0x0D600,
+    0x0D601, 0x0D61C, 0x0D61D, 0x0D638, 0x0D639, 0x0D654, 0x0D655, 0x0D670, 0x0D671, 0x0D68C,
+    0x0D68D, 0x0D6A8, 0x0D6A9, 0x0D6C4, 0x0D6C5, 0x0D6E0, 0x0D6E1, 0x0D6FC, 0x0D6FD, 0x0D718,
+    0x0D719, 0x0D734, 0x0D735, 0x0D750, 0x0D751, 0x0D76C, 0x0D76D, 0x0D788, 0x0D789, 0x0D7A4,
+    0x0D7B0, 0x0D7C7, 0x0D7CB, 0x0D7FC, 0x0FB1E, 0x0FB1F, 0x0FE00, 0x0FE10, 0x0FE20, 0x0FE30,
+    0x0FEFF, 0x0FF00, 0x0FF9E, 0x0FFA0, 0x0FFF0, 0x0FFFC, 0x101FD, 0x101FE, 0x102E0, 0x102E1,
+    0x10376, 0x1037B, 0x10A01, 0x10A04, 0x10A05, 0x10A07, 0x10A0C, 0x10A10, 0x10A38, 0x10A3B,
+    0x10A3F, 0x10A40, 0x10AE5, 0x10AE7, 0x10D24, 0x10D28, 0x10EAB, 0x10EAD, 0x10F46, 0x10F51,
+    0x10F82, 0x10F86, 0x11000, 0x11001, 0x11002, 0x11003, 0x11038, 0x11047, 0x11070, 0x11071,
+    0x11073, 0x11075, 0x1107F, 0x11082, 0x11083, 0x110B0, 0x110B3, 0x110B7, 0x110B9, 0x110BB,
+    0x110BD, 0x110BE, 0x110C2, 0x110C3, 0x110CD, 0x110CE, 0x11100, 0x11103, 0x11127, 0x1112C,
+    0x1112D, 0x11135, 0x11145, 0x11147, 0x11173, 0x11174, 0x11180, 0x11182, 0x11183, 0x111B3,
+    0x111B6, 0x111BF, 0x111C1, 0x111C2, 0x111C4, 0x111C9, 0x111CD, 0x111CE, 0x111CF, 0x111D0,
+    0x1122C, 0x1122F, 0x11232, 0x11234, 0x11235, 0x11236, 0x11238, 0x1123E, 0x1123F, 0x112DF,
+    0x112E0, 0x112E3, 0x112EB, 0x11300, 0x11302, 0x11304, 0x1133B, 0x1133D, 0x1133E, 0x1133F,
+    0x11340, 0x11341, 0x11345, 0x11347, 0x11349, 0x1134B, 0x1134E, 0x11357, 0x11358, 0x11362,
+    0x11364, 0x11366, 0x1136D, 0x11370, 0x11375, 0x11435, 0x11438, 0x11440, 0x11442, 0x11445,
+    0x11446, 0x11447, 0x1145E, 0x1145F, 0x114B0, 0x114B1, 0x114B3, 0x114B9, 0x114BA, 0x114BB,
+    0x114BD, 0x114BE, 0x114BF, 0x114C1, 0x114C2, 0x114C4, 0x115AF, 0x115B0, 0x115B2, 0x115B6,
+    0x115B8, 0x115BC, 0x115BE, 0x115BF, 0x115C1, 0x115DC, 0x115DE, 0x11630, 0x11633, 0x1163B,
+    0x1163D, 0x1163E, 0x1163F, 0x11641, 0x116AB, 0x116AC, 0x116AD, 0x116AE, 0x116B0, 0x116B6,
+    0x116B7, 0x116B8, 0x1171D, 0x11720, 0x11722, 0x11726, 0x11727, 0x1172C, 0x1182C, 0x1182F,
+    0x11838, 0x11839, 0x1183B, 0x11930, 0x11931, 0x11936, 0x11937, 0x11939, 0x1193B, 0x1193D,
+    0x1193E, 0x1193F, 0x11940, 0x11941, 0x11942, 0x11943, 0x11944, 0x119D1, 0x119D4, 0x119D8,
+    0x119DA, 0x119DC, 0x119E0, 0x119E1, 0x119E4, 0x119E5, 0x11A01, 0x11A0B, 0x11A33, 0x11A39,
+    0x11A3A, 0x11A3B, 0x11A3F, 0x11A47, 0x11A48, 0x11A51, 0x11A57, 0x11A59, 0x11A5C, 0x11A84,
+    0x11A8A, 0x11A97, 0x11A98, 0x11A9A, 0x11C2F, 0x11C30, 0x11C37, 0x11C38, 0x11C3E, 0x11C3F,
+    0x11C40, 0x11C92, 0x11CA8, 0x11CA9, 0x11CAA, 0x11CB1, 0x11CB2, 0x11CB4, 0x11CB5, 0x11CB7,
+    0x11D31, 0x11D37, 0x11D3A, 0x11D3B, 0x11D3C, 0x11D3E, 0x11D3F, 0x11D46, 0x11D47, 0x11D48,
+    0x11D8A, 0x11D8F, 0x11D90, 0x11D92, 0x11D93, 0x11D95, 0x11D96, 0x11D97, 0x11D98, 0x11EF3,
+    0x11EF5, 0x11EF7, 0x13430, 0x13439, 0x16AF0, 0x16AF5, 0x16B30, 0x16B37, 0x16F4F, 0x16F50,
+    0x16F51, 0x16F88, 0x16F8F, 0x16F93, 0x16FE4, 0x16FE5, 0x16FF0, 0x16FF2, 0x1BC9D, 0x1BC9F,
+    0x1BCA0, 0x1BCA4, 0x1CF00, 0x1CF2E, 0x1CF30, 0x1CF47, 0x1D165, 0x1D166, 0x1D167, 0x1D16A,
+    0x1D16D, 0x1D16E, 0x1D173, 0x1D17B, 0x1D183, 0x1D185, 0x1D18C, 0x1D1AA, 0x1D1AE, 0x1D242,
+    0x1D245, 0x1DA00, 0x1DA37, 0x1DA3B, 0x1DA6D, 0x1DA75, 0x1DA76, 0x1DA84, 0x1DA85, 0x1DA9B,
+    0x1DAA0, 0x1DAA1, 0x1DAB0, 0x1E000, 0x1E007, 0x1E008, 0x1E019, 0x1E01B, 0x1E022, 0x1E023,
+    0x1E025, 0x1E026, 0x1E02B, 0x1E130, 0x1E137, 0x1E2AE, 0x1E2AF, 0x1E2EC, 0x1E2F0, 0x1E8D0,
+    0x1E8D7, 0x1E944, 0x1E94B, 0x1F000, 0x1F100, 0x1F10D, 0x1F110, 0x1F12F, 0x1F130, 0x1F16C,
+    0x1F172, 0x1F17E, 0x1F180, 0x1F18E, 0x1F18F, 0x1F191, 0x1F19B, 0x1F1AD, 0x1F1E6, 0x1F200,
+    0x1F201, 0x1F210, 0x1F21A, 0x1F21B, 0x1F22F, 0x1F230, 0x1F232, 0x1F23B, 0x1F23C, 0x1F240,
+    0x1F249, 0x1F3FB, 0x1F400, 0x1F53E, 0x1F546, 0x1F650, 0x1F680, 0x1F700, 0x1F774, 0x1F780,
+    0x1F7D5, 0x1F800, 0x1F80C, 0x1F810, 0x1F848, 0x1F850, 0x1F85A, 0x1F860, 0x1F888, 0x1F890,
+    0x1F8AE, 0x1F900, 0x1F90C, 0x1F93B, 0x1F93C, 0x1F946, 0x1F947, 0x1FB00, 0x1FC00, 0x1FFFE,
+    0xE0000, 0xE0020, 0xE0080, 0xE0100, 0xE01F0, 0xE1000,
+)
+GRAPHEME_BREAKS = (
+    3, 2, 3, 1, 3, 0, 3, 0, 14, 0, 3, 14, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 7, 0, 4, 0, 3,
+    0, 4, 0, 4, 0, 4, 7, 0, 4, 0, 4, 0, 4, 0, 7, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0,
+    4, 0, 4, 0, 7, 0, 4, 0, 4, 7, 4, 8, 0, 4, 8, 4, 0, 8, 4, 8, 4, 8, 0, 4, 0, 4, 0, 4, 8, 0, 4, 0,
+    4, 8, 4, 0, 8, 0, 8, 4, 0, 4, 0, 4, 0, 4, 0, 4, 8, 0, 4, 0, 8, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4,
+    0, 4, 8, 0, 4, 0, 8, 4, 0, 4, 8, 0, 8, 4, 0, 4, 0, 4, 0, 4, 8, 0, 4, 0, 4, 8, 4, 0, 8, 0, 8, 4,
+    0, 4, 0, 4, 0, 4, 0, 4, 8, 4, 8, 0, 8, 0, 8, 4, 0, 4, 0, 4, 8, 4, 0, 4, 0, 4, 8, 0, 4, 0, 4, 0,
+    4, 0, 4, 0, 4, 8, 0, 4, 0, 8, 4, 8, 4, 8, 0, 4, 8, 0, 8, 4, 0, 4, 0, 4, 0, 4, 8, 0, 4, 0, 4, 8,
+    4, 0, 8, 0, 8, 4, 7, 0, 4, 0, 4, 0, 4, 8, 0, 4, 0, 4, 8, 4, 0, 4, 0, 8, 4, 0, 8, 0, 4, 0, 8, 4,
+    0, 4, 0, 4, 0, 8, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 8, 0, 4, 8, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0,
+    4, 8, 4, 0, 4, 8, 4, 0, 8, 4, 0, 4, 0, 4, 0, 4, 0, 8, 4, 0, 4, 0, 4, 0, 9, 10, 11, 0, 4, 0, 4, 8,
+    0, 4, 8, 0, 4, 0, 4, 0, 4, 8, 4, 8, 4, 8, 4, 0, 4, 0, 4, 3, 4, 0, 4, 0, 4, 0, 4, 8, 4, 8, 0, 8,
+    4, 8, 4, 0, 4, 8, 4, 0, 8, 4, 8, 4, 0, 4, 0, 4, 0, 4, 8, 4, 0, 4, 0, 4, 0, 4, 8, 0, 4, 8, 4, 8,
+    4, 8, 0, 4, 0, 4, 8, 0, 8, 4, 8, 4, 8, 4, 0, 4, 8, 4, 8, 4, 8, 4, 8, 0, 8, 4, 8, 4, 0, 4, 0, 4,
+    8, 4, 0, 4, 0, 4, 0, 8, 4, 0, 4, 0, 3, 4, 5, 3, 0, 3, 0, 14, 0, 14, 0, 3, 0, 4, 0, 14, 0, 14, 0, 14,
+    0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14,
+    0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14,
+    0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 4, 0, 4, 0, 4, 0, 4, 14, 0, 14, 0, 4, 0, 14, 0, 14, 0,
+    4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 8, 4, 8, 0, 4, 0, 8, 0, 8, 4, 0, 4, 0, 4, 0, 4, 0, 4,
+    8, 0, 9, 0, 4, 8, 0, 4, 8, 4, 8, 4, 8, 0, 4, 0, 4, 8, 4, 8, 4, 0, 4, 0, 4, 8, 0, 4, 0, 4, 0, 4,
+    0, 4, 0, 4, 0, 4, 0, 8, 4, 8, 0, 8, 4, 0, 8, 4, 8, 4, 8, 0, 8, 4, 0, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12,
+    13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 12, 13, 0, 10, 0, 11, 0, 4, 0, 4, 0, 4, 0,
+    3, 0, 4, 0, 3, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0,
+    8, 4, 8, 0, 4, 0, 4, 0, 4, 0, 4, 8, 0, 8, 4, 8, 4, 0, 7, 0, 4, 0, 7, 0, 4, 0, 4, 8, 4, 0, 8, 0,
+    4, 0, 4, 8, 0, 8, 4, 8, 0, 7, 0, 4, 0, 8, 4, 0, 8, 4, 8, 4, 8, 4, 0, 4, 0, 4, 8, 4, 0, 4, 8, 0,
+    4, 0, 4, 8, 4, 8, 0, 8, 0, 8, 0, 4, 0, 8, 0, 4, 0, 4, 0, 8, 4, 8, 4, 8, 4, 0, 4, 0, 4, 8, 4, 8,
+    4, 8, 4, 8, 4, 8, 4, 0, 4, 8, 4, 0, 8, 4, 8, 4, 0, 4, 0, 8, 4, 8, 4, 8, 4, 0, 4, 8, 4, 8, 4, 8,
+    4, 0, 4, 0, 4, 8, 4, 0, 8, 4, 8, 4, 0, 4, 8, 0, 8, 0, 4, 8, 4, 7, 8, 7, 8, 4, 0, 8, 4, 0, 4, 8,
+    4, 0, 8, 0, 4, 0, 4, 8, 7, 4, 0, 4, 0, 4, 8, 4, 0, 7, 4, 8, 4, 0, 8, 4, 0, 4, 8, 4, 0, 4, 0, 8,
+    4, 8, 4, 8, 4, 0, 4, 0, 4, 0, 4, 0, 4, 7, 4, 0, 8, 0, 4, 0, 8, 4, 8, 4, 0, 4, 8, 0, 3, 0, 4, 0,
+    4, 0, 4, 0, 8, 0, 4, 0, 4, 0, 8, 0, 4, 0, 3, 0, 4, 0, 4, 0, 4, 8, 4, 0, 8, 4, 3, 4, 0, 4, 0, 4,
+    0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4, 0, 4,
+    0, 4, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 6, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 4,
+    14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 14, 0, 3, 4, 3, 4,
+    3, 0,
+)
@@ -16,7 +16,18 @@
 # limitations under the License.
 
 
-from math import cos, sin, tau
+from base64 import b64decode
+from functools import lru_cache
+from math import atan2, copysign, cos, hypot, sin, tau
+from re import compile as re_compile
+from zlib import decompress
+
+from ._color_tables import CGA_16_LUT, XTERM_256_LUT, CGA_16_RGB, XTERM_256_RGB
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional; see the array conversion functions
+    _np = None
 
 
 def decode_hex_color(value):
@@ -57,6 +68,193 @@ def decode_hex_color(value):
         raise ValueError(f"Unusable hex color code {value!r}")
 
 
+class Color(tuple):
+    """ Immutable RGB colour value, held as a tuple of `(red, green, blue,
+    alpha)`, where the colour components are integers within the range
+    0..255 inclusive and alpha is either None (fully opaque, with no alpha
+    channel) or also an integer within the range 0..255.
+
+    Colours can be passed directly to :py:meth:`pansi.SGR.for_color` and
+    anywhere else a colour value is accepted, avoiding the cost of
+    formatting and then re-parsing a hex string. The string form of a
+    colour is its hex value.
+
+    >>> Color(255, 128, 0)
+    Color(255, 128, 0)
+    >>> str(Color(255, 128, 0, 128))
+    '#FF800080'
+    >>> Color.parse("hsl(30 100% 50%)") == Color.parse("#FF8000")
+    True
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, red, green, blue, alpha=None):
+        return tuple.__new__(cls, (red, green, blue, alpha))
+
+    @classmethod
+    def rgb(cls, red, green, blue, alpha=None):
+        """ Construct a colour from component RGB values, accepting the
+        same argument forms as the :py:func:`rgb` function.
+        """
+        red = round(scalar(red, scale=255, clamp=True))
+        green = round(scalar(green, scale=255, clamp=True))
+        blue = round(scalar(blue, scale=255, clamp=True))
+        if str(alpha).lower() == "none":
+            return tuple.__new__(cls, (red, green, blue, None))
+        else:
+            alpha = round(255 * scalar(alpha, scale=1.0, clamp=True))
+            return tuple.__new__(cls, (red, green, blue, alpha))
+
+    @classmethod
+    def hsl(cls, hue, saturation, lightness, alpha=None):
+        """ Construct a colour from component HSL values, accepting the
+        same argument forms as the :py:func:`hsl` function.
+        """
+        saturation = scalar(saturation, scale=100, clamp=True) / 100
+        lightness = scalar(lightness, scale=100, clamp=True) / 100
+        return cls._from_srgb(_hsl_to_srgb(scalar(hue, scale=360), saturation, lightness), alpha)
+
+    @classmethod
+    def hwb(cls, hue, whiteness, blackness, alpha=None):
+        """ Construct a colour from component HWB values, accepting the
+        same argument forms as the :py:func:`hwb` function.
+        """
+        whiteness = scalar(whiteness, scale=100, clamp=True) / 100
+        blackness = scalar(blackness, scale=100, clamp=True) / 100
+        return cls._from_srgb(_hwb_to_srgb(scalar(hue, scale=360), whiteness, blackness), alpha)
+
+    @classmethod
+    def lab(cls, lightness, a, b, alpha=None):
+        """ Construct a colour from component CIE Lab values, accepting the
+        same argument forms as the :py:func:`lab` function.
+        """
+        lightness = scalar(lightness, scale=100, clamp=True)
+        a = scalar(a, scale=125)
+        b = scalar(b, scale=125)
+        return cls._from_srgb(_linear_to_srgb(*_lab_to_linear(lightness, a, b)), alpha)
+
+    @classmethod
+    def lch(cls, lightness, chroma, hue, alpha=None):
+        """ Construct a colour from component CIE LCH values, accepting the
+        same argument forms as the :py:func:`lch` function.
+        """
+        lightness = scalar(lightness, scale=100, clamp=True)
+        chroma = scalar(chroma, scale=150)
+        return cls.lab(*_polar_to_cartesian(lightness, chroma, scalar(hue, scale=360)), alpha=alpha)
+
+    @classmethod
+    def oklab(cls, lightness, a, b, alpha=None):
+        """ Construct a colour from component OkLab values, accepting the
+        same argument forms as the :py:func:`oklab` function.
+        """
+        lightness = scalar(lightness, scale=1.0, clamp=True)
+        a = scalar(a, scale=0.4)
+        b = scalar(b, scale=0.4)
+        return cls._from_srgb(_linear_to_srgb(*_oklab_to_linear(lightness, a, b)), alpha)
+
+    @classmethod
+    def oklch(cls, lightness, chroma, hue, alpha=None):
+        """ Construct a colour from component OkLCh values, accepting the
+        same argument forms as the :py:func:`oklch` function.
+        """
+        lightness = scalar(lightness, scale=1.0, clamp=True)
+        chroma = scalar(chroma, scale=0.4)
+        return cls.oklab(*_polar_to_cartesian(lightness, chroma, scalar(hue, scale=360)), alpha=alpha)
+
+    @classmethod
+    def _from_srgb(cls, color, alpha):
+        r, g, b = color
+        return cls.rgb(255 * r, 255 * g, 255 * b, alpha=alpha)
+
+    @classmethod
+    def parse(cls, value):
+        """ Return the colour described by a CSS colour string. This can be
+        a hex value (e.g. `'#FF8000'`), a named web colour, or a functional
+        notation such as `'rgb(255 128 0)'`, `'hsl(30, 100%, 50%)'` or
+        `'oklch(70% 0.2 50 / 50%)'`. A :py:class:`Color` or an RGB tuple may
+        also be passed.
+
+        Results for strings are held in a bounded cache.
+
+        :raises ValueError: if the value cannot be interpreted as a colour
+        """
+        if isinstance(value, Color):
+            return value
+        elif isinstance(value, (tuple, list)):
+            return cls.rgb(*value)
+        else:
+            return _parse_color(str(value))
+
+    def __repr__(self):
+        red, green, blue, alpha = self
+        if alpha is None:
+            return f"{type(self).__name__}({red}, {green}, {blue})"
+        else:
+            return f"{type(self).__name__}({red}, {green}, {blue}, {alpha})"
+
+    def __str__(self):
+        return self.hex
+
+    @property
+    def red(self) -> int:
+        return self[0]
+
+    @property
+    def green(self) -> int:
+        return self[1]
+
+    @property
+    def blue(self) -> int:
+        return self[2]
+
+    @property
+    def alpha(self):
+        return self[3]
+
+    @property
+    def hex(self) -> str:
+        """ Hex colour value string, in either '#RRGGBB' or '#RRGGBBAA' form.
+        """
+        red, green, blue, alpha = self
+        if alpha is None:
+            return f"#{red:02X}{green:02X}{blue:02X}"
+        else:
+            return f"#{red:02X}{green:02X}{blue:02X}{alpha:02X}"
+
+
+_FUNCTIONAL_NOTATION = re_compile(r"^([a-z]+)\(\s*([^/]*?)\s*(?:/\s*(\S+)\s*)?\)$")
+
+
+def _parse_color(value):
+    value = value.strip().lower()
+    if value.startswith("#"):
+        try:
+            return Color(*decode_hex_color(value))
+        except ValueError:
+            raise ValueError(f"Unusable hex color code {value!r}")
+    elif value in WEB_PALETTE:
+        return Color(*WEB_PALETTE[value])
+    match = _FUNCTIONAL_NOTATION.match(value)
+    if match:
+        name, args, alpha = match.groups()
+        args = args.replace(",", " ").split()
+        if not alpha and len(args) == 4 and name in ("rgb", "rgba", "hsl", "hsla"):
+            # legacy comma-separated form, with alpha as the fourth value
+            alpha = args.pop()
+        try:
+            function = _COLOR_FUNCTIONS[name]
+        except KeyError:
+            pass
+        else:
+            if len(args) == 3:
+                return function(*args, alpha=alpha)
+    raise ValueError(f"Unrecognised color {value!r}")
+
+
+_parse_color = lru_cache(maxsize=1024)(_parse_color)
+
+
 def rgb(red, green, blue, alpha=None) -> str:
     r""" Generate a hex colour value string from component RGB values.
 
@@ -78,50 +276,72 @@ def rgb(red, green, blue, alpha=None) -> str:
     :return: RGB hex color value string in either '#RRGGBB' or
         '#RRGGBBAA' form
     """
-    red = round(scalar(red, scale=255, clamp=True))
-    green = round(scalar(green, scale=255, clamp=True))
-    blue = round(scalar(blue, scale=255, clamp=True))
-    if str(alpha).lower() == "none":
-        return f"#{red:02X}{green:02X}{blue:02X}"
-    else:
-        alpha = round(255 * scalar(alpha, scale=1.0, clamp=True))
-        return f"#{red:02X}{green:02X}{blue:02X}{alpha:02X}"
+    return Color.rgb(red, green, blue, alpha).hex
 
 
 def hsl(hue, saturation, lightness, alpha=None) -> str:
-    """ Generate a hex colour value string from component RGB values.
+    """ Generate a hex colour value string from component HSL values.
 
-    .. todo::
-        Not yet implemented
+    :param hue: angular hue, measured in degrees
+    :param saturation: saturation, as a number between 0 and 100 or a
+        percentage string
+    :param lightness: lightness, as a number between 0 and 100 or a
+        percentage string
+    :param alpha:
+    :returns:
+
+    >>> hsl(30, "100%", "50%")
+    '#FF8000'
     """
-    raise NotImplementedError
+    return Color.hsl(hue, saturation, lightness, alpha).hex
 
 
 def hwb(hue, whiteness, blackness, alpha=None) -> str:
     """ Generate a hex colour value string from component HWB values.
 
-    .. todo::
-        Not yet implemented
+    :param hue: angular hue, measured in degrees
+    :param whiteness: whiteness, as a number between 0 and 100 or a
+        percentage string
+    :param blackness: blackness, as a number between 0 and 100 or a
+        percentage string
+    :param alpha:
+    :returns:
+
+    >>> hwb(30, 0, 0)
+    '#FF8000'
     """
-    raise NotImplementedError
+    return Color.hwb(hue, whiteness, blackness, alpha).hex
 
 
 def lab(lightness, a, b, alpha=None) -> str:
-    """ Generate a hex colour value string from component CIE Lab values.
+    """ Generate a hex colour value string from component CIE Lab values,
+    relative to a D50 white point (as in CSS).
+
+    :param lightness: lightness, as a number between 0 and 100 or a
+        percentage string
+    :param a: a axis value, where 100% is equivalent to 125
+    :param b: b axis value, where 100% is equivalent to 125
+    :param alpha:
+    :returns:
 
-    .. todo::
-        Not yet implemented
+    >>> lab(50, 0, 0)
+    '#777777'
     """
-    raise NotImplementedError
+    return Color.lab(lightness, a, b, alpha).hex
 
 
 def lch(lightness, chroma, hue, alpha=None) -> str:
-    """ Generate a hex colour value string from component CIE LCH values.
+    """ Generate a hex colour value string from component CIE LCH values,
+    relative to a D50 white point (as in CSS).
 
-    .. todo::
-        Not yet implemented
+    :param lightness: lightness, as a number between 0 and 100 or a
+        percentage string
+    :param chroma: chroma, where 100% is equivalent to 150
+    :param hue: angular hue, measured in degrees
+    :param alpha:
+    :returns:
     """
-    raise NotImplementedError
+    return Color.lch(lightness, chroma, hue, alpha).hex
 
 
 def oklab(lightness, a, b, alpha=None) -> str:
@@ -133,24 +353,7 @@ def oklab(lightness, a, b, alpha=None) -> str:
     :param alpha:
     :returns:
     """
-    lightness = scalar(lightness, scale=1.0, clamp=True)
-    a = scalar(a, scale=0.4)
-    b = scalar(b, scale=0.4)
-
-    l = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
-    m = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
-    s = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
-
-    # Convert linear RGB to sRGB
-    r = +4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s
-    g = -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s
-    b = -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s
-
-    # Gamma-adjust RGB values and hand off to rgb function
-    return rgb(255 * linear_to_gamma(r),
-               255 * linear_to_gamma(g),
-               255 * linear_to_gamma(b),
-               alpha=alpha)
+    return Color.oklab(lightness, a, b, alpha).hex
 
 
 def oklch(lightness, chroma, hue, alpha=None) -> str:
@@ -162,11 +365,21 @@ def oklch(lightness, chroma, hue, alpha=None) -> str:
     :param alpha:
     :returns:
     """
-    chroma = scalar(chroma, scale=0.4)
-    hue_rad = hue * tau / 360  # Convert from degrees to radians (TODO: allow other angular units)
-    a = chroma * cos(hue_rad)
-    b = chroma * sin(hue_rad)
-    return oklab(lightness, a, b, alpha=alpha)
+    return Color.oklch(lightness, chroma, hue, alpha).hex
+
+
+# Colour functions available in CSS functional notation
+_COLOR_FUNCTIONS = {
+    "rgb": Color.rgb,
+    "rgba": Color.rgb,
+    "hsl": Color.hsl,
+    "hsla": Color.hsl,
+    "hwb": Color.hwb,
+    "lab": Color.lab,
+    "lch": Color.lch,
+    "oklab": Color.oklab,
+    "oklch": Color.oklch,
+}
 
 
 def linear_to_gamma(c):
@@ -176,6 +389,13 @@ def linear_to_gamma(c):
         return 12.92 * c
 
 
+def gamma_to_linear(c):
+    if c >= 0.04045:
+        return ((c + 0.055) / 1.055) ** 2.4
+    else:
+        return c / 12.92
+
+
 def scalar(value, scale, clamp=False, reflect=False) -> int | float:
     """ Resolve a scalar numeric component value within the range (0..scale).
     The value can be supplied as a numeric value, a percentage string, or None
@@ -187,28 +407,32 @@ def scalar(value, scale, clamp=False, reflect=False) -> int | float:
     If the `reflect` argument is also set, subzero values will be clamped to
     -scale instead of zero.
     """
-    if not value:
-        return 0
-    str_value = str(value).lower()
-    if str_value == "none":
+    if value.__class__ is int or value.__class__ is float:
+        # Plain numbers need no parsing
+        pass
+    elif not value:
         return 0
-    if str_value.endswith("%"):
-        percentage = True
-        str_value = str_value.rstrip("%")
     else:
-        percentage = False
-    try:
-        if "." in str_value:
-            value = float(str_value)
+        str_value = str(value).lower()
+        if str_value == "none":
+            return 0
+        if str_value.endswith("%"):
+            percentage = True
+            str_value = str_value.rstrip("%")
         else:
-            value = int(str_value)
-    except ValueError:
-        raise ValueError(f"Cannot interpret value {value!r}")
-    if percentage:
-        value = (value / 100.0) * scale
-        int_value = int(value)
-        if value == int_value:
-            value = int_value
+            percentage = False
+        try:
+            if "." in str_value:
+                value = float(str_value)
+            else:
+                value = int(str_value)
+        except ValueError:
+            raise ValueError(f"Cannot interpret value {value!r}")
+        if percentage:
+            value = (value / 100.0) * scale
+            int_value = int(value)
+            if value == int_value:
+                value = int_value
     if clamp:
         if value < 0:
             if reflect and value < -scale:
@@ -220,6 +444,666 @@ def scalar(value, scale, clamp=False, reflect=False) -> int | float:
     return value
 
 
+# Colour space conversions
+#
+# Each conversion exists in two forms: a private function which converts a
+# single colour, passed as three separate components, and a public function
+# which converts a whole sequence of colours at once. The public functions
+# accept any array-like of shape (..., 3) and, where NumPy is available,
+# return a NumPy array of floats of the same shape. Without NumPy, a list of
+# tuples is returned instead.
+#
+# Units are as follows: sRGB and linear sRGB components are within 0..1;
+# HSL and HWB use a hue in degrees and other components within 0..1; CIE
+# Lab and LCH use a lightness within 0..100, relative to a D50 white point,
+# as in CSS; OkLab and OkLCh use a lightness within 0..1. All polar hues
+# are measured in degrees, within the range 0..360.
+
+# Linear sRGB to OkLab LMS
+_OKLAB_M1 = ((0.4122214708, 0.5363325363, 0.0514459929),
+             (0.2119034982, 0.6806995451, 0.1073969566),
+             (0.0883024619, 0.2817188376, 0.6299787005))
+
+# OkLab LMS (non-linear) to OkLab
+_OKLAB_M2 = ((0.2104542553, 0.7936177850, -0.0040720468),
+             (1.9779984951, -2.4285922050, 0.4505937099),
+             (0.0259040371, 0.7827717662, -0.8086757660))
+
+# OkLab to OkLab LMS (non-linear)
+_OKLAB_M2_INV = ((1.0, 0.3963377774, 0.2158037573),
+                 (1.0, -0.1055613458, -0.0638541728),
+                 (1.0, -0.0894841775, -1.2914855480))
+
+# OkLab LMS to linear sRGB
+_OKLAB_M1_INV = ((4.0767416621, -3.3077115913, 0.2309699292),
+                 (-1.2684380046, 2.6097574011, -0.3413193965),
+                 (-0.0041960863, -0.7034186147, 1.7076147010))
+
+# Linear sRGB to CIE XYZ, chromatically adapted to D50
+_XYZ_D50 = ((0.436065742825, 0.385151468834, 0.143078454423),
+            (0.222493191756, 0.716887053824, 0.060619790536),
+            (0.013923904501, 0.097081285666, 0.714099358401))
+
+# CIE XYZ (D50) to linear sRGB
+_XYZ_D50_INV = ((3.134135759893, -1.617385676966, -0.490662420293),
+                (-0.978795455904, 1.916254188588, 0.033442984116),
+                (0.071955412989, -0.228976674828, 1.405386011039))
+
+_D50_WHITE = (0.3457 / 0.3585, 1.0, (1.0 - 0.3457 - 0.3585) / 0.3585)
+_LAB_KAPPA = 24389 / 27
+_LAB_EPSILON = 216 / 24389
+
+
+def _transform(matrix, x, y, z):
+    (a, b, c), (d, e, f), (g, h, i) = matrix
+    return a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z
+
+
+def _cbrt(x):
+    return copysign(abs(x) ** (1 / 3), x)
+
+
+def _srgb_to_linear(r, g, b):
+    return gamma_to_linear(r), gamma_to_linear(g), gamma_to_linear(b)
+
+
+def _linear_to_srgb(r, g, b):
+    return linear_to_gamma(r), linear_to_gamma(g), linear_to_gamma(b)
+
+
+def _linear_to_oklab(r, g, b):
+    l, m, s = _transform(_OKLAB_M1, r, g, b)
+    return _transform(_OKLAB_M2, _cbrt(l), _cbrt(m), _cbrt(s))
+
+
+def _oklab_to_linear(lightness, a, b):
+    l, m, s = _transform(_OKLAB_M2_INV, lightness, a, b)
+    return _transform(_OKLAB_M1_INV, l ** 3, m ** 3, s ** 3)
+
+
+def _cartesian_to_polar(lightness, a, b):
+    return lightness, hypot(a, b), atan2(b, a) * 360 / tau % 360
+
+
+def _polar_to_cartesian(lightness, chroma, hue):
+    hue_rad = hue * tau / 360
+    return lightness, chroma * cos(hue_rad), chroma * sin(hue_rad)
+
+
+def _hue(r, g, b, max_value, delta):
+    if delta == 0:
+        return 0.0
+    elif max_value == r:
+        return 60 * ((g - b) / delta % 6)
+    elif max_value == g:
+        return 60 * ((b - r) / delta + 2)
+    else:
+        return 60 * ((r - g) / delta + 4)
+
+
+def _srgb_to_hsl(r, g, b):
+    max_value = max(r, g, b)
+    min_value = min(r, g, b)
+    lightness = (max_value + min_value) / 2
+    divisor = min(lightness, 1 - lightness)
+    saturation = (max_value - lightness) / divisor if divisor > 0 else 0.0
+    return _hue(r, g, b, max_value, max_value - min_value), saturation, lightness
+
+
+def _hsl_to_srgb(hue, saturation, lightness):
+    a = saturation * min(lightness, 1 - lightness)
+
+    def f(n):
+        k = (n + hue / 30) % 12
+        return lightness - a * max(-1, min(k - 3, 9 - k, 1))
+
+    return f(0), f(8), f(4)
+
+
+def _srgb_to_hwb(r, g, b):
+    max_value = max(r, g, b)
+    min_value = min(r, g, b)
+    return _hue(r, g, b, max_value, max_value - min_value), min_value, 1 - max_value
+
+
+def _hwb_to_srgb(hue, whiteness, blackness):
+    if whiteness + blackness >= 1:
+        grey = whiteness / (whiteness + blackness)
+        return grey, grey, grey
+    scale = 1 - whiteness - blackness
+    return tuple(c * scale + whiteness for c in _hsl_to_srgb(hue, 1, 0.5))
+
+
+def _lab_f(t):
+    return _cbrt(t) if t > _LAB_EPSILON else (_LAB_KAPPA * t + 16) / 116
+
+
+def _lab_f_inv(f):
+    cube = f ** 3
+    return cube if cube > _LAB_EPSILON else (116 * f - 16) / _LAB_KAPPA
+
+
+def _linear_to_lab(r, g, b):
+    x, y, z = _transform(_XYZ_D50, r, g, b)
+    fx = _lab_f(x / _D50_WHITE[0])
+    fy = _lab_f(y / _D50_WHITE[1])
+    fz = _lab_f(z / _D50_WHITE[2])
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def _lab_to_linear(lightness, a, b):
+    fy = (lightness + 16) / 116
+    x = _lab_f_inv(a / 500 + fy) * _D50_WHITE[0]
+    y = fy ** 3 if lightness > _LAB_KAPPA * _LAB_EPSILON else lightness / _LAB_KAPPA
+    z = _lab_f_inv(fy - b / 200) * _D50_WHITE[2]
+    return _transform(_XYZ_D50_INV, x, y, z)
+
+
+def _np_transform(matrix, colors):
+    return colors @ _np.array(matrix).T
+
+
+def _np_srgb_to_linear(c):
+    return _np.where(c >= 0.04045, ((_np.maximum(c, 0.04045) + 0.055) / 1.055) ** 2.4, c / 12.92)
+
+
+def _np_linear_to_srgb(c):
+    return _np.where(c >= 0.0031308, 1.055 * _np.maximum(c, 0.0031308) ** (1 / 2.4) - 0.055, 12.92 * c)
+
+
+def _np_linear_to_oklab(c):
+    return _np_transform(_OKLAB_M2, _np.cbrt(_np_transform(_OKLAB_M1, c)))
+
+
+def _np_oklab_to_linear(c):
+    return _np_transform(_OKLAB_M1_INV, _np_transform(_OKLAB_M2_INV, c) ** 3)
+
+
+def _np_cartesian_to_polar(c):
+    out = _np.empty_like(c)
+    out[..., 0] = c[..., 0]
+    out[..., 1] = _np.hypot(c[..., 1], c[..., 2])
+    out[..., 2] = _np.degrees(_np.arctan2(c[..., 2], c[..., 1])) % 360
+    return out
+
+
+def _np_polar_to_cartesian(c):
+    hue_rad = _np.radians(c[..., 2])
+    out = _np.empty_like(c)
+    out[..., 0] = c[..., 0]
+    out[..., 1] = c[..., 1] * _np.cos(hue_rad)
+    out[..., 2] = c[..., 1] * _np.sin(hue_rad)
+    return out
+
+
+def _np_hue(c, max_value, delta):
+    r, g, b = c[..., 0], c[..., 1], c[..., 2]
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        hue = _np.where(max_value == r, (g - b) / delta % 6,
+                        _np.where(max_value == g, (b - r) / delta + 2, (r - g) / delta + 4))
+    return _np.where(delta == 0, 0.0, 60 * hue)
+
+
+def _np_srgb_to_hsl(c):
+    max_value = c.max(axis=-1)
+    min_value = c.min(axis=-1)
+    lightness = (max_value + min_value) / 2
+    divisor = _np.minimum(lightness, 1 - lightness)
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        saturation = _np.where(divisor > 0, (max_value - lightness) / divisor, 0.0)
+    return _np.stack((_np_hue(c, max_value, max_value - min_value), saturation, lightness), axis=-1)
+
+
+def _np_hsl_to_srgb(c):
+    hue, saturation, lightness = c[..., 0:1], c[..., 1:2], c[..., 2:3]
+    a = saturation * _np.minimum(lightness, 1 - lightness)
+    k = (_np.array((0, 8, 4)) + hue / 30) % 12
+    return lightness - a * _np.clip(_np.minimum(k - 3, 9 - k), -1, 1)
+
+
+def _np_srgb_to_hwb(c):
+    max_value = c.max(axis=-1)
+    min_value = c.min(axis=-1)
+    return _np.stack((_np_hue(c, max_value, max_value - min_value), min_value, 1 - max_value), axis=-1)
+
+
+def _np_hwb_to_srgb(c):
+    whiteness, blackness = c[..., 1:2], c[..., 2:3]
+    total = whiteness + blackness
+    pure = _np.stack((c[..., 0], _np.ones_like(c[..., 0]), _np.full_like(c[..., 0], 0.5)), axis=-1)
+    with _np.errstate(divide="ignore", invalid="ignore"):
+        grey = whiteness / total
+    return _np.where(total >= 1, grey, _np_hsl_to_srgb(pure) * (1 - total) + whiteness)
+
+
+def _np_linear_to_lab(c):
+    xyz = _np_transform(_XYZ_D50, c) / _np.array(_D50_WHITE)
+    f = _np.where(xyz > _LAB_EPSILON, _np.cbrt(xyz), (_LAB_KAPPA * xyz + 16) / 116)
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+    return _np.stack((116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)), axis=-1)
+
+
+def _np_lab_to_linear(c):
+    lightness = c[..., 0]
+    fy = (lightness + 16) / 116
+    f = _np.stack((c[..., 1] / 500 + fy, fy, fy - c[..., 2] / 200), axis=-1)
+    xyz = _np.where(f ** 3 > _LAB_EPSILON, f ** 3, (116 * f - 16) / _LAB_KAPPA)
+    xyz[..., 1] = _np.where(lightness > _LAB_KAPPA * _LAB_EPSILON, fy ** 3, lightness / _LAB_KAPPA)
+    return _np_transform(_XYZ_D50_INV, xyz * _np.array(_D50_WHITE))
+
+
+def _convert(colors, functions, np_functions):
+    """ Apply a chain of conversions to a sequence of colours, using NumPy
+    where available.
+    """
+    if _np is None:
+        converted = []
+        for color in colors:
+            for function in functions:
+                color = function(*color)
+            converted.append(tuple(color))
+        return converted
+    colors = _np.asarray(colors, dtype=float)
+    for np_function in np_functions:
+        colors = np_function(colors)
+    return colors
+
+
+def srgb_to_linear(colors):
+    """ Convert gamma-encoded sRGB colours to linear sRGB.
+    """
+    return _convert(colors, [_srgb_to_linear], [_np_srgb_to_linear])
+
+
+def linear_to_srgb(colors):
+    """ Convert linear sRGB colours to gamma-encoded sRGB.
+    """
+    return _convert(colors, [_linear_to_srgb], [_np_linear_to_srgb])
+
+
+def linear_to_oklab(colors):
+    """ Convert linear sRGB colours to OkLab.
+    """
+    return _convert(colors, [_linear_to_oklab], [_np_linear_to_oklab])
+
+
+def oklab_to_linear(colors):
+    """ Convert OkLab colours to linear sRGB.
+    """
+    return _convert(colors, [_oklab_to_linear], [_np_oklab_to_linear])
+
+
+def srgb_to_oklab(colors):
+    """ Convert sRGB colours to OkLab.
+    """
+    return _convert(colors, [_srgb_to_linear, _linear_to_oklab],
+                    [_np_srgb_to_linear, _np_linear_to_oklab])
+
+
+def oklab_to_srgb(colors):
+    """ Convert OkLab colours to sRGB.
+    """
+    return _convert(colors, [_oklab_to_linear, _linear_to_srgb],
+                    [_np_oklab_to_linear, _np_linear_to_srgb])
+
+
+def oklab_to_oklch(colors):
+    """ Convert OkLab colours to OkLCh.
+    """
+    return _convert(colors, [_cartesian_to_polar], [_np_cartesian_to_polar])
+
+
+def oklch_to_oklab(colors):
+    """ Convert OkLCh colours to OkLab.
+    """
+    return _convert(colors, [_polar_to_cartesian], [_np_polar_to_cartesian])
+
+
+def srgb_to_oklch(colors):
+    """ Convert sRGB colours to OkLCh.
+    """
+    return _convert(colors, [_srgb_to_linear, _linear_to_oklab, _cartesian_to_polar],
+                    [_np_srgb_to_linear, _np_linear_to_oklab, _np_cartesian_to_polar])
+
+
+def oklch_to_srgb(colors):
+    """ Convert OkLCh colours to sRGB.
+    """
+    return _convert(colors, [_polar_to_cartesian, _oklab_to_linear, _linear_to_srgb],
+                    [_np_polar_to_cartesian, _np_oklab_to_linear, _np_linear_to_srgb])
+
+
+def srgb_to_hsl(colors):
+    """ Convert sRGB colours to HSL.
+    """
+    return _convert(colors, [_srgb_to_hsl], [_np_srgb_to_hsl])
+
+
+def hsl_to_srgb(colors):
+    """ Convert HSL colours to sRGB.
+
+    >>> srgb_to_hex(hsl_to_srgb([(30, 1.0, 0.5), (120, 1.0, 0.25)]))
+    ['#FF8000', '#008000']
+    """
+    return _convert(colors, [_hsl_to_srgb], [_np_hsl_to_srgb])
+
+
+def srgb_to_hwb(colors):
+    """ Convert sRGB colours to HWB.
+    """
+    return _convert(colors, [_srgb_to_hwb], [_np_srgb_to_hwb])
+
+
+def hwb_to_srgb(colors):
+    """ Convert HWB colours to sRGB.
+    """
+    return _convert(colors, [_hwb_to_srgb], [_np_hwb_to_srgb])
+
+
+def srgb_to_lab(colors):
+    """ Convert sRGB colours to CIE Lab (D50).
+    """
+    return _convert(colors, [_srgb_to_linear, _linear_to_lab],
+                    [_np_srgb_to_linear, _np_linear_to_lab])
+
+
+def lab_to_srgb(colors):
+    """ Convert CIE Lab (D50) colours to sRGB.
+    """
+    return _convert(colors, [_lab_to_linear, _linear_to_srgb],
+                    [_np_lab_to_linear, _np_linear_to_srgb])
+
+
+def lab_to_lch(colors):
+    """ Convert CIE Lab colours to CIE LCH.
+    """
+    return _convert(colors, [_cartesian_to_polar], [_np_cartesian_to_polar])
+
+
+def lch_to_lab(colors):
+    """ Convert CIE LCH colours to CIE Lab.
+    """
+    return _convert(colors, [_polar_to_cartesian], [_np_polar_to_cartesian])
+
+
+def srgb_to_lch(colors):
+    """ Convert sRGB colours to CIE LCH (D50).
+    """
+    return _convert(colors, [_srgb_to_linear, _linear_to_lab, _cartesian_to_polar],
+                    [_np_srgb_to_linear, _np_linear_to_lab, _np_cartesian_to_polar])
+
+
+def lch_to_srgb(colors):
+    """ Convert CIE LCH (D50) colours to sRGB.
+    """
+    return _convert(colors, [_polar_to_cartesian, _lab_to_linear, _linear_to_srgb],
+                    [_np_polar_to_cartesian, _np_lab_to_linear, _np_linear_to_srgb])
+
+
+def srgb_to_hex(colors) -> list:
+    """ Convert sRGB colours to a list of '#RRGGBB' hex colour value
+    strings, clamping out-of-gamut values.
+
+    >>> srgb_to_hex([(1.0, 0.5, 0.0), (0.0, 0.0, 0.0)])
+    ['#FF8000', '#000000']
+    """
+    if _np is None:
+        return [Color._from_srgb(color, None).hex for color in colors]
+    values = _np.clip(_np.rint(_np.asarray(colors, dtype=float) * 255), 0, 255).astype(_np.uint8)
+    return [f"#{r:02X}{g:02X}{b:02X}" for r, g, b in values.reshape(-1, 3).tolist()]
+
+
+class Gradient:
+    """ Colour gradient, interpolated between two or more colour stops in
+    either the OkLab or OkLCh colour space.
+
+    Each stop can be any value accepted by :py:meth:`Color.parse`, or a
+    `(position, colour)` pair, where position is a number between 0 and 1.
+    Stops without explicit positions are spread evenly.
+
+    The gradient is sampled into a table of `size` colours, and from those,
+    tables of ready-made escape sequences are built on demand for each
+    colour depth. Colouring a character therefore costs no more than a list
+    index.
+
+    >>> rainbow = Gradient("red", "yellow", "lime", space="oklch", size=4)
+    >>> list(map(str, rainbow))
+    ['#FF0000', '#FFBC00', '#D4FF00', '#00FF00']
+    >>> rainbow.paint("Hi!", color_depth=4)
+    '\\x1b[91mH\\x1b[93mi\\x1b[92m!\\x1b[39m'
+
+    :param stops: colour stops
+    :param space: interpolation colour space; either 'oklab' or 'oklch'
+    :param size: number of entries in the sampled colour table
+    """
+
+    def __init__(self, *stops, space="oklab", size=256):
+        if len(stops) < 2:
+            raise ValueError("A gradient requires at least two colour stops")
+        if space not in ("oklab", "oklch"):
+            raise ValueError(f"Unsupported interpolation space {space!r}")
+        if size < 2:
+            raise ValueError("A gradient table requires at least two entries")
+        positions = []
+        colors = []
+        for i, stop in enumerate(stops):
+            if isinstance(stop, tuple) and len(stop) == 2:
+                position, color = stop
+            else:
+                position, color = i / (len(stops) - 1), stop
+            positions.append(float(position))
+            colors.append(Color.parse(color))
+        if positions != sorted(positions):
+            raise ValueError("Gradient stop positions must be in ascending order")
+        self._space = space
+        self._positions = positions
+        self._stops = tuple(colors)
+        self._colors = self._sample(size)
+        self._escapes = {}
+
+    def __repr__(self):
+        stops = ", ".join(f"({position!r}, {str(color)!r})"
+                          for position, color in zip(self._positions, self._stops))
+        return f"{type(self).__name__}({stops}, space={self._space!r}, size={len(self)!r})"
+
+    def __len__(self):
+        return len(self._colors)
+
+    def __getitem__(self, index):
+        return self._colors[index]
+
+    def __iter__(self):
+        return iter(self._colors)
+
+    def _sample(self, size):
+        """ Sample the gradient at `size` evenly spaced points, returning a
+        tuple of :py:class:`Color` values.
+        """
+        to_space = srgb_to_oklch if self._space == "oklch" else srgb_to_oklab
+        points = [tuple(map(float, point)) for point in to_space([[c / 255 for c in color[:3]]
+                                                                   for color in self._stops])]
+        if self._space == "oklch":
+            # Achromatic stops have no meaningful hue, so take the hue of an
+            # adjacent stop to avoid a spurious sweep around the hue circle
+            for i, (lightness, chroma, hue) in enumerate(points):
+                if chroma < 1e-4:
+                    neighbour = points[i + 1] if i + 1 < len(points) else points[i - 1]
+                    points[i] = (lightness, chroma, neighbour[2])
+        polar = self._space == "oklch"
+        make = Color.oklch if polar else Color.oklab
+        positions = self._positions
+        last = len(positions) - 1
+        colors = []
+        segment = 0
+        for i in range(size):
+            t = i / (size - 1)
+            while segment < last - 1 and t > positions[segment + 1]:
+                segment += 1
+            start, end = positions[segment], positions[segment + 1]
+            if t <= start:
+                f = 0.0
+            elif t >= end:
+                f = 1.0
+            else:
+                f = (t - start) / (end - start)
+            (x0, y0, z0), (x1, y1, z1) = points[segment], points[segment + 1]
+            if polar:
+                z1 = z0 + ((z1 - z0 + 180) % 360 - 180)  # take the shorter arc
+            colors.append(make(x0 + (x1 - x0) * f, y0 + (y1 - y0) * f, z0 + (z1 - z0) * f))
+        return tuple(colors)
+
+    @property
+    def space(self) -> str:
+        return self._space
+
+    @property
+    def stops(self) -> tuple:
+        """ Tuple of `(position, colour)` pairs.
+        """
+        return tuple(zip(self._positions, self._stops))
+
+    def index(self, value) -> int:
+        """ Return the table index for a value between 0 and 1. Values
+        outside that range are clamped.
+        """
+        last = len(self._colors) - 1
+        if value <= 0:
+            return 0
+        elif value >= 1:
+            return last
+        return int(value * last + 0.5)
+
+    def escapes(self, color_depth=24, background=False) -> tuple:
+        """ Return the table of escape sequences for this gradient, at a
+        given colour depth. Tables are built once and then retained.
+        """
+        key = (color_depth, background)
+        try:
+            return self._escapes[key]
+        except KeyError:
+            from ._sgr import SGR
+            escapes = self._escapes[key] = tuple(str(SGR.for_color(color, background=background,
+                                                                   color_depth=color_depth))
+                                                 for color in self._colors)
+            return escapes
+
+    def escape(self, value, color_depth=24, background=False) -> str:
+        """ Return the escape sequence for a value between 0 and 1.
+        """
+        return self.escapes(color_depth, background)[self.index(value)]
+
+    def paint(self, text, color_depth=24, background=False) -> str:
+        """ Colour a string cell by cell, spreading the gradient across its
+        printable grapheme clusters (see
+        :func:`pansi._measurement.segment_cells`). Escape sequences and
+        other control characters already in the text are passed through
+        uncoloured, and do not take a share of the gradient. Escape
+        sequences are only emitted where the colour changes (or may have
+        been changed by the text itself), and the default colour is restored
+        at the end.
+        """
+        from ._measurement import segment_cells
+        units = segment_cells(text)
+        count = sum(1 for _, width in units if width)
+        if not count:
+            return text
+        escapes = self.escapes(color_depth, background)
+        last = len(escapes) - 1
+        scale = last / (count - 1) if count > 1 else 0
+        parts = []
+        current = None
+        i = 0
+        for unit, width in units:
+            if not width:
+                parts.append(unit)
+                current = None
+                continue
+            escape = escapes[int(i * scale + 0.5)]
+            if escape != current:
+                parts.append(escape)
+                current = escape
+            parts.append(unit)
+            i += 1
+        parts.append("\x1b[49m" if background else "\x1b[39m")
+        return "".join(parts)
+
+    def heatmap(self, rows, char="█", color_depth=24, background=False) -> list:
+        """ Render a grid of values between 0 and 1 as a list of lines, with
+        each value drawn as one character, coloured according to its
+        position on the gradient. Where NumPy is available, `rows` may also
+        be a two-dimensional array.
+        """
+        escapes = self.escapes(color_depth, background)
+        last = len(escapes) - 1
+        end = "\x1b[49m" if background else "\x1b[39m"
+        if _np is not None:
+            indexes = _np.rint(_np.clip(_np.asarray(rows, dtype=float), 0, 1) * last).astype(int).tolist()
+        else:
+            indexes = [[self.index(value) for value in row] for row in rows]
+        lines = []
+        for row in indexes:
+            parts = []
+            current = None
+            for i in row:
+                escape = escapes[i]
+                if escape != current:
+                    parts.append(escape)
+                    current = escape
+                parts.append(char)
+            parts.append(end)
+            lines.append("".join(parts))
+        return lines
+
+
+# Lookup tables of nearest palette indexes, indexed by 15-bit quantized RGB
+_CGA_16_LUT = decompress(b64decode(CGA_16_LUT))
+_XTERM_256_LUT = decompress(b64decode(XTERM_256_LUT))
+
+
+def xterm_256_index(red, green, blue) -> int:
+    """ Return the index of the xterm 256-colour palette entry perceptually
+    nearest to an RGB value, where each component is an integer within the
+    range 0..255 inclusive. Only the colour cube and greyscale ramp
+    (indexes 16 to 255) are considered, as the first sixteen colours vary
+    between terminals.
+
+    The result is read from a precomputed table, with each channel
+    quantized to 5 bits.
+
+    >>> xterm_256_index(255, 128, 0)
+    208
+    """
+    return _XTERM_256_LUT[(red >> 3) << 10 | (green >> 3) << 5 | blue >> 3]
+
+
+def cga_16_index(red, green, blue) -> int:
+    """ Return the index of the CGA 16-colour palette entry perceptually
+    nearest to an RGB value, where each component is an integer within the
+    range 0..255 inclusive. Indexes correspond to terminal colour numbers,
+    so index 0 is black, 1 is low intensity red (maroon), and so on up to
+    15 for high intensity white.
+
+    The result is read from a precomputed table, with each channel
+    quantized to 5 bits.
+
+    >>> cga_16_index(255, 0, 0)
+    9
+    """
+    return _CGA_16_LUT[(red >> 3) << 10 | (green >> 3) << 5 | blue >> 3]
+
+
+def xterm_256_rgb(index) -> (int, int, int):
+    """ Return the RGB value of an entry in the xterm 256-colour palette.
+    """
+    return XTERM_256_RGB[index]
+
+
+def cga_16_rgb(index) -> (int, int, int):
+    """ Return the RGB value of an entry in the CGA 16-colour palette.
+    """
+    return CGA_16_RGB[index]
+
+
 #: RGB values for named web colours
 #:
 #: - https://drafts.csswg.org/css-color/#named-colors
@@ -373,3 +1257,181 @@ WEB_PALETTE = {
     "yellow": (255, 255, 0),
     "yellowgreen": (154, 205, 50),
 }
+
+
+# Bounds of the sRGB gamut in OkLab space, slightly widened
+_OKLAB_GAMUT = ((0.0, 1.0), (-0.24, 0.28), (-0.32, 0.2))
+
+# Tolerance for rounding error in candidate selection, in squared OkLab units
+_EPSILON = 1e-12
+
+
+class ColorIndex:
+    """ Spatial index over a palette of named colours, for finding the
+    entry perceptually nearest to an arbitrary colour.
+
+    OkLab space is divided into a uniform grid of cells, covering the sRGB
+    gamut and every palette entry. Each cell holds a list of candidates:
+    every entry that could be nearest to some point within that cell. A
+    query therefore only compares the target against the few candidates in
+    its own cell. With NumPy available, all candidate lists are computed up
+    front; otherwise, each is computed on first use.
+
+    >>> index = ColorIndex({"black": (0, 0, 0), "white": (255, 255, 255)})
+    >>> index.nearest((200, 180, 190))
+    'white'
+
+    :param palette: mapping of keys (usually names) to RGB tuples, with
+        components in the range 0..255; where several entries have the
+        same value, the earliest takes precedence
+    :param cell_size: edge length of each grid cell, in OkLab units
+    """
+
+    def __init__(self, palette, cell_size=0.05):
+        keys = list(palette)
+        # An empty palette is allowed, but has no nearest entry to anything
+        points = srgb_to_oklab([[c / 255 for c in palette[key][:3]] for key in keys]) if keys else []
+        self._entries = [(tuple(map(float, point)), key) for point, key in zip(points, keys)]
+        self._size = len(keys)
+        self._cell_size = cell_size
+        bounds = [list(axis) for axis in _OKLAB_GAMUT]
+        for point, _ in self._entries:
+            for c, axis in zip(point, bounds):
+                axis[:] = min(axis[0], c), max(axis[1], c)
+        self._origin = tuple(low for low, _ in bounds)
+        self._shape = tuple(int((high - low) // cell_size) + 1 for low, high in bounds)
+        ni, nj, nk = self._shape
+        self._cells = [None] * (ni * nj * nk)
+        if _np is not None and self._entries:
+            self._fill_cells()
+
+    def __len__(self):
+        return self._size
+
+    def _fill_cells(self):
+        """ Compute the candidate lists for all cells at once.
+        """
+        size = self._cell_size
+        points = _np.array([point for point, _ in self._entries])
+        low = _np.asarray(self._origin) + _np.indices(self._shape).reshape(3, -1).T * size
+        nearest = _np.zeros((len(low), len(points)))
+        farthest = _np.zeros((len(low), len(points)))
+        for axis in range(3):
+            below = points[:, axis] - low[:, axis, None]
+            above = low[:, axis, None] + size - points[:, axis]
+            nearest += _np.maximum(0, -_np.minimum(below, above)) ** 2
+            farthest += _np.maximum(below, above) ** 2
+        candidates = nearest <= farthest.min(axis=1)[:, None] + _EPSILON
+        entries = self._entries
+        self._cells = [[entries[n] for n in _np.flatnonzero(row)] for row in candidates]
+
+    def _cell_candidates(self, i, j, k):
+        """ Return every entry that could be nearest to some point within
+        a given cell. No entry lying further from the cell than the
+        smallest farthest distance of any entry can qualify.
+        """
+        size = self._cell_size
+        low = [origin + n * size for origin, n in zip(self._origin, (i, j, k))]
+        distances = []
+        bound = float("inf")
+        for point, _ in self._entries:
+            nearest = farthest = 0.0
+            for c, c_low in zip(point, low):
+                below = c - c_low
+                above = c_low + size - c
+                nearest += max(0.0, -below, -above) ** 2
+                farthest += max(below, above) ** 2
+            distances.append(nearest)
+            bound = min(bound, farthest)
+        return [entry for entry, distance in zip(self._entries, distances) if distance <= bound + _EPSILON]
+
+    def _search(self, point):
+        if not self._size:
+            return None
+        x, y, z = point
+        size = self._cell_size
+        ox, oy, oz = self._origin
+        ni, nj, nk = self._shape
+        i, j, k = int((x - ox) // size), int((y - oy) // size), int((z - oz) // size)
+        if 0 <= i < ni and 0 <= j < nj and 0 <= k < nk:
+            n = (i * nj + j) * nk + k
+            candidates = self._cells[n]
+            if candidates is None:
+                candidates = self._cells[n] = self._cell_candidates(i, j, k)
+        else:
+            # Outside the grid, which only out-of-gamut values can reach
+            candidates = self._entries
+        best_key = None
+        best_distance = float("inf")
+        for (px, py, pz), key in candidates:
+            distance = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+            if distance < best_distance:
+                best_distance = distance
+                best_key = key
+        return best_key
+
+    def nearest(self, color):
+        """ Return the key of the palette entry nearest to a colour, or None
+        if the palette is empty. The colour can be any value accepted by
+        :py:meth:`Color.parse`.
+        """
+        r, g, b = Color.parse(color)[:3]
+        return self._search(_linear_to_oklab(*_srgb_to_linear(r / 255, g / 255, b / 255)))
+
+    def nearest_many(self, colors) -> list:
+        """ Return the keys of the palette entries nearest to each of a
+        sequence of RGB colours, with components in the range 0..255. With
+        NumPy available, `colors` can also be an array of shape (..., 3),
+        and the colour space conversion is vectorized.
+        """
+        if _np is not None:
+            points = srgb_to_oklab(_np.asarray(colors, dtype=float).reshape(-1, 3) / 255).tolist()
+        else:
+            points = srgb_to_oklab([[c / 255 for c in color[:3]] for color in colors])
+        search = self._search
+        return [search(point) for point in points]
+
+
+def _cga_palette_rgb():
+    from ._sgr import CGA_PALETTE
+    return {name: CGA_16_RGB[code - 30 if code < 90 else code - 82]
+            for name, (code, _) in CGA_PALETTE.items()}
+
+
+# Palette builders and grid cell sizes for each built-in palette index; the
+# sparse CGA palette searches faster with larger cells
+_PALETTES = {
+    "web": (lambda: WEB_PALETTE, 0.05),
+    "cga": (_cga_palette_rgb, 0.08),
+    "xterm-256": (lambda: {i: XTERM_256_RGB[i] for i in range(16, 256)}, 0.05),
+}
+
+
+@lru_cache(maxsize=None)
+def palette_index(palette="web") -> ColorIndex:
+    """ Return a shared :py:class:`ColorIndex` over one of the built-in
+    palettes, building it on first use. The palette can be `'web'` for the
+    named web colours, `'cga'` for the named CGA colours (keyed by the names
+    in :py:data:`pansi.CGA_PALETTE`), or `'xterm-256'` for the xterm colour
+    cube and greyscale ramp (keyed by colour index).
+
+    >>> palette_index("web").nearest("#FE0102")
+    'red'
+    >>> palette_index("xterm-256").nearest((255, 128, 0))
+    208
+    """
+    try:
+        entries, cell_size = _PALETTES[palette]
+    except KeyError:
+        raise ValueError(f"Unknown palette {palette!r}")
+    else:
+        return ColorIndex(entries(), cell_size=cell_size)
+
+
+def nearest_color_name(color) -> str:
+    """ Return the name of the web colour nearest to a colour.
+
+    >>> nearest_color_name("#6495EE")
+    'cornflowerblue'
+    """
+    return palette_index("web").nearest(color)
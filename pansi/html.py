@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Conversion of ANSI-styled text into HTML.
+
+Styled text is converted into ``<span>`` elements with CSS classes, one
+class per style property value, so that identical styles share the same
+classes and each CSS rule is generated only once. RGB colours, of which
+there may be any number, are given as inline styles instead, so that the
+stylesheet stays small. Input can be processed incrementally, in chunks of
+any size, using a constant amount of memory::
+
+    $ some-command | pansi-html > log.html
+
+"""
+
+
+from argparse import ArgumentParser
+from html import escape
+from sys import stdin, stdout
+
+from pansi._parsing import _SpanParser
+from pansi._sgr import CGA_PALETTE
+from pansi.color import cga_16_rgb
+
+
+# Hex values of the CGA palette, as rendered by the terminal, keyed by name
+_CGA_HEX = {name: "#{:02X}{:02X}{:02X}".format(*cga_16_rgb(code - 30 if code < 90 else code - 82))
+            for name, (code, _) in CGA_PALETTE.items()}
+
+
+class HTMLWriter:
+    r""" Writer that converts ANSI-styled text into HTML, writing the result
+    to an output stream.
+
+    The text is wrapped in a ``<pre>`` element. Once all text has been
+    written, :meth:`close` ends that element and appends a ``<style>``
+    element containing a CSS rule for each class used. Palette colours are
+    given the RGB values of the CGA palette, as used by terminals, rather
+    than those of the CSS colour keywords of the same names.
+
+    >>> from io import StringIO
+    >>> out = StringIO()
+    >>> with HTMLWriter(out) as writer:
+    ...     writer.write("\x1b[1;92mok\x1b[0m & done")
+    >>> print(out.getvalue(), end="")
+    <pre class="ansi"><span class="ansi-lime ansi-bold">ok</span> &amp; done</pre>
+    <style>
+    .ansi-lime { color: #55FF55 }
+    .ansi-bold { font-weight: bold }
+    </style>
+    """
+
+    def __init__(self, output, /, class_prefix="ansi", stylesheet=True):
+        self._output = output
+        self._prefix = class_prefix
+        self._stylesheet = stylesheet
+        self._parser = _SpanParser()
+        self._attributes = {}   # Style -> span attributes
+        self._rules = {}        # class name -> CSS declarations, for classes used
+        self._started = False
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, text):
+        """ Convert a chunk of ANSI-styled text, writing the resulting HTML
+        to the output. Escape sequences may be split across chunks.
+        """
+        if self._closed:
+            raise ValueError("HTML writer is closed")
+        parts = []
+        if not self._started:
+            parts.append(f'<pre class="{self._prefix}">')
+            self._started = True
+        for span, style in self._parser.feed(text):
+            span = escape(span, quote=False)
+            if style:
+                parts.append(f'<span{self._attributes_for(style)}>{span}</span>')
+            else:
+                parts.append(span)
+        if parts:
+            self._output.write("".join(parts))
+
+    def close(self):
+        """ End the ``<pre>`` element and, unless disabled, write the
+        stylesheet.
+        """
+        if self._closed:
+            return
+        if not self._started:
+            self.write("")
+        self._closed = True
+        self._output.write("</pre>\n")
+        if self._stylesheet:
+            self._output.write(self.stylesheet())
+
+    def stylesheet(self) -> str:
+        """ Return a ``<style>`` element containing CSS rules for all
+        classes used so far.
+        """
+        rules = "".join(f".{name} {{ {declarations} }}\n" for name, declarations in self._rules.items())
+        return f"<style>\n{rules}</style>\n"
+
+    def _attributes_for(self, style) -> str:
+        try:
+            return self._attributes[style]
+        except KeyError:
+            names = []
+            inline = []
+            for name, declarations in self._declarations(style):
+                if name is None:
+                    inline.append(declarations)
+                else:
+                    names.append(name)
+                    self._rules.setdefault(name, declarations)
+            value = ""
+            if names:
+                value += f' class="{" ".join(names)}"'
+            if inline:
+                value += f' style="{"; ".join(inline)}"'
+            if len(self._attributes) >= 4096:
+                self._attributes.clear()
+            self._attributes[style] = value
+            return value
+
+    def _declarations(self, style):
+        """ Generate a (class name, CSS declarations) pair for each
+        property of a style. The class name is None for declarations that
+        should be given inline, which is the case for RGB colours.
+        """
+        prefix = self._prefix
+        color = style.get("color")
+        if color is not None:
+            if color in CGA_PALETTE:
+                yield f"{prefix}-{color}", f"color: {_CGA_HEX[color]}"
+            else:
+                yield None, f"color: {color.upper()}"
+        background_color = style.get("background_color")
+        if background_color is not None:
+            if background_color in CGA_PALETTE:
+                yield f"{prefix}-bg-{background_color}", f"background-color: {_CGA_HEX[background_color]}"
+            else:
+                yield None, f"background-color: {background_color.upper()}"
+        font_weight = style.get("font_weight")
+        if font_weight == "bold":
+            yield f"{prefix}-bold", "font-weight: bold"
+        elif font_weight is not None:
+            yield f"{prefix}-light", "opacity: 0.67"
+        if style.get("font_style") == "italic":
+            yield f"{prefix}-italic", "font-style: italic"
+        # Text decorations are combined into a single class, since each
+        # would otherwise override the text-decoration of the others
+        decorations = style.get("text_decoration", "").split()
+        lines = [line for line in ("underline", "overline", "line-through", "blink") if line in decorations]
+        if lines:
+            double = "double" in decorations and "underline" in decorations
+            name = "-".join((["double"] if double else []) + lines)
+            yield (f"{prefix}-{name}",
+                   f"text-decoration: {' '.join(lines)}{' double' if double else ''}")
+
+
+def ansi_to_html(text, /, class_prefix="ansi", stylesheet=True) -> str:
+    """ Convert a complete string of ANSI-styled text into HTML.
+    """
+    from io import StringIO
+    out = StringIO()
+    with HTMLWriter(out, class_prefix=class_prefix, stylesheet=stylesheet) as writer:
+        writer.write(text)
+    return out.getvalue()
+
+
+def main():
+    parser = ArgumentParser(description="Convert ANSI-styled text to HTML.")
+    parser.add_argument("-p", "--class-prefix", default="ansi",
+                        help="prefix for generated CSS class names (default: ansi)")
+    parser.add_argument("-S", "--no-stylesheet", action="store_true",
+                        help="omit the generated stylesheet")
+    parser.add_argument("filename", nargs="?",
+                        help="file to convert (default: standard input)")
+    args = parser.parse_args()
+    source = open(args.filename, encoding="utf-8", errors="replace") if args.filename else stdin
+    try:
+        with HTMLWriter(stdout, class_prefix=args.class_prefix, stylesheet=not args.no_stylesheet) as writer:
+            for chunk in iter(lambda: source.read(65536), ""):
+                writer.write(chunk)
+    finally:
+        if source is not stdin:
+            source.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -18,17 +18,23 @@
 
 from argparse import ArgumentParser
 from array import array
-from base64 import b64encode
 from fcntl import ioctl
-from io import BytesIO
 from math import ceil
-from sys import stdin, stdout
+from sys import byteorder, stdin, stdout
 from termios import TIOCGWINSZ, tcgetattr, TCSADRAIN, tcsetattr
 from tty import setcbreak
-from uuid import uuid4
 
 from PIL import Image
 
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional; without it, the pure Python engine is used
+    _np = None
+
+from pansi._kitty import transmit
+from pansi._term import detect_color_depth
+from pansi.color import cga_16_index, xterm_256_index, _CGA_16_LUT, _XTERM_256_LUT
+
 
 class Terminal:
 
@@ -93,21 +99,17 @@ class TerminalImage:
     def height(self):
         return self.image.height
 
-    def print_pixels(self):
-        data = BytesIO()
-        self.image.save(data, format="PNG")
-        # TODO: Windows support
-        filename = f"/tmp/{uuid4()}.png"  # would use mkstemp here, but the mode isn't programmable :/
-        with open(filename, "wb") as f:
-            f.write(data.getvalue())
-        payload = b64encode(filename.encode("utf-8")).decode("ascii")
-        print(f"\x1B_Gf=100,t=t,a=T;{payload}\x1B\\")
-
-    def print_blocks(self, screen):
+    def print_pixels(self, medium="auto", compress=False):
+        print("".join(kitty_commands(self.image, medium=medium, compress=compress)))
+
+    def print_blocks(self, screen, color_depth=24, mode="half"):
         width, height = self.image.size
         lines = int(ceil(height / screen.cell_height))
         cols = int(ceil(width / screen.cell_width))
-        image = BlockImage(self.image, lines=lines, cols=cols)
+        if mode == "half":
+            image = BlockImage(self.image, lines=lines, cols=cols, color_depth=color_depth)
+        else:
+            image = MosaicImage(self.image, lines=lines, cols=cols, mode=mode, color_depth=color_depth)
         for line in image.ansi_lines():
             print(line)
 
@@ -135,6 +137,23 @@ class TerminalImage:
             return self
 
 
+def kitty_commands(image, /, medium="auto", compress=False):
+    """ Return the kitty graphics protocol commands that display an image
+    at the cursor position, transmitted as raw RGB or RGBA pixel data
+    (other image modes are converted) rather than as an encoded file.
+
+    The data is sent either within the commands themselves (the 'direct'
+    `medium`, optionally zlib-compressed if `compress` is true), or
+    through a POSIX shared memory object (the 'shared-memory' medium),
+    which only works where the terminal is on the same host. By default,
+    shared memory is used only when running directly within a local kitty.
+    """
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    return transmit(image.tobytes(), image.width, image.height, pixel_format=8 * len(image.mode),
+                    medium=medium, compress=compress)
+
+
 class Fragment:
 
     def __init__(self):
@@ -144,9 +163,9 @@ class Fragment:
 
     def append(self, ch, fg=None, bg=None):
         self.ch.append(ch)
-        if fg:
+        if fg is not None:
             self.fg = fg
-        if bg:
+        if bg is not None:
             self.bg = bg
 
     def pop(self):
@@ -157,28 +176,86 @@ class Fragment:
             self.fg = self.bg = None
 
     @classmethod
-    def to_ansi_text(cls, frag):
+    def to_ansi_text(cls, frag, color_depth=24):
+        """ Render a fragment as ANSI text. At a colour depth of 24 bits,
+        colours are RGB tuples; at lower depths, they are palette indexes.
+        """
         text, fg, bg = frag
         style = []
-        if fg:
-            style.append(f"\x1b[38;2;{fg[0]};{fg[1]};{fg[2]}m")
-        if bg:
-            style.append(f"\x1b[48;2;{bg[0]};{bg[1]};{bg[2]}m")
+        if color_depth >= 24:
+            if fg is not None:
+                style.append(f"\x1b[38;2;{fg[0]};{fg[1]};{fg[2]}m")
+            if bg is not None:
+                style.append(f"\x1b[48;2;{bg[0]};{bg[1]};{bg[2]}m")
+        elif color_depth >= 8:
+            if fg is not None:
+                style.append(f"\x1b[38;5;{fg}m")
+            if bg is not None:
+                style.append(f"\x1b[48;5;{bg}m")
+        else:
+            if fg is not None:
+                style.append(f"\x1b[{fg + 30 if fg < 8 else fg + 82}m")
+            if bg is not None:
+                style.append(f"\x1b[{bg + 40 if bg < 8 else bg + 92}m")
         return "".join(style) + text
 
 
 class BlockImage:
+    """ Image rendered as coloured half blocks, two pixels per character.
+
+    At a `color_depth` below 24 bits, each pixel is mapped to the nearest
+    entry in the xterm 256-colour (8 bits) or CGA 16-colour (4 bits)
+    palette as the image is loaded.
+
+    Two rendering engines are available, producing identical output. The
+    'numpy' engine holds the image as an array and works out block
+    characters and colour runs for the whole image with vectorized
+    operations. The 'python' engine works through the image one character
+    at a time. The NumPy engine only pays off for images that are both
+    tall enough to amortise its per-column overhead and busy enough that
+    the Python engine cannot cover them in a few long runs, so by default
+    it is chosen only for such images (and only where NumPy is installed).
+
+    In both cases, pixels are read straight from a single contiguous buffer
+    of RGB or RGBA data (other image modes are converted to RGB), rather
+    than as individual pixel tuples. The Python engine reads each pixel as
+    one integer through a memoryview, and the NumPy engine wraps the same
+    kind of buffer with `numpy.frombuffer`.
+    """
 
     blocks_per_char = 2
 
-    def __init__(self, image, lines, cols):
+    def __init__(self, image, lines, cols, color_depth=24, engine=None):
         self.lines = int(ceil(lines))
         self.width = cols
         self.height = self.blocks_per_char * lines
-        self.pixels = image.resize((self.width, self.height)).getdata()
+        self.color_depth = color_depth
+        resized = image.resize((self.width, self.height))
+        if resized.mode not in ("RGB", "RGBA"):
+            resized = resized.convert("RGBA" if "A" in resized.getbands() else "RGB")
+        # Four bytes per pixel (padding RGB to RGBX), so that each pixel can
+        # be read from a memoryview as a single integer
+        data = resized.tobytes("raw", "RGBX" if resized.mode == "RGB" else "RGBA")
+        if engine is None:
+            engine = _default_engine(data, self.width, self.lines)
+        if engine == "numpy":
+            pixels = _np.frombuffer(data, dtype=_np.uint8).reshape(resized.height, resized.width, 4)
+            self._alpha = resized.mode == "RGBA"
+            self.pixels = _pixel_ids(pixels if self._alpha else pixels[..., :3], color_depth)
+        elif engine == "python":
+            if color_depth < 24:
+                # One byte per pixel, holding a palette index
+                to_index = xterm_256_index if color_depth >= 8 else cga_16_index
+                self.pixels = bytes(map(to_index, data[0::4], data[1::4], data[2::4]))
+            else:
+                self.pixels = memoryview(data).cast("I")
+        else:
+            raise ValueError(f"Unknown rendering engine {engine!r}")
+        self.engine = engine
         self.line_numbers = range(int(ceil(self.lines)))
         self._offset = (0, 0)
         self._fragments = {}
+        self._rendered = {}
 
     @property
     def offset(self):
@@ -190,11 +267,24 @@ class BlockImage:
         old_x, old_y = self._offset
         if new_x != old_x:
             self._fragments.clear()
+            self._rendered.clear()
         self._offset = (new_x, new_y)
 
     def ansi_lines(self):
+        if self.engine == "numpy":
+            try:
+                rendered = self._rendered[self._offset[0]]
+            except KeyError:
+                rendered = self._rendered[self._offset[0]] = _render_block_lines(
+                    self.pixels[0::2, self._offset[0]:], self.pixels[1::2, self._offset[0]:], self.color_depth,
+                    self._alpha)
+            for n in self.line_numbers:
+                line_no = n + self._offset[1]
+                yield rendered[line_no] if line_no in self.line_numbers else "\x1b[0m"
+            return
         for line_no in self.line_numbers:
-            yield "".join(map(Fragment.to_ansi_text, self._get_line(line_no))) + "\x1b[0m"
+            yield "".join(Fragment.to_ansi_text(frag, self.color_depth)
+                          for frag in self._get_line(line_no)) + "\x1b[0m"
 
     def _get_line(self, n):
         line_no = n + self._offset[1]  # convert relative line number 'n' to real line number
@@ -208,65 +298,484 @@ class BlockImage:
             return []
 
     def _create_line_fragments(self, line_no):
+        # Pixels are read as integers: either palette indexes, or packed
+        # RGBA values which are unpacked only once per fragment
         hi = self.blocks_per_char * self.width * line_no + self._offset[0]
         lo = hi + ((self.blocks_per_char - 1) * self.width)
+        count = self.width - self._offset[0]
+        top = self.pixels[hi:hi + count]
+        bottom = self.pixels[lo:lo + count]
         fragments = []
         frag = Fragment()
-        for offset in range(self.width - self._offset[0]):
-            c0 = self.pixels[hi + offset]   # colour of top pixel
-            c1 = self.pixels[lo + offset]   # colour of bottom pixel
-            if frag.fg is None:
+        c0 = c1 = ch = None
+        for offset in range(count):
+            p0, p1 = c0, c1
+            c0 = top[offset]      # colour of top pixel
+            c1 = bottom[offset]   # colour of bottom pixel
+            if c0 == p0 and c1 == p1:
+                # a repeated pair of colours repeats the previous character,
+                # and leaves the fragment unchanged
+                frag.ch.append(ch)
+            elif frag.fg is None:
                 # palette contains zero colours
                 if c0 == c1:
-                    frag.append("█", fg=c0)
+                    ch = "█"
+                    frag.append(ch, fg=c0)
                 else:
-                    frag.append("▀", fg=c0, bg=c1)
+                    ch = "▀"
+                    frag.append(ch, fg=c0, bg=c1)
             elif frag.bg is None:
                 # palette contains one colour
                 if c0 == c1 == frag.fg:
-                    frag.append("█")
+                    ch = "█"
+                    frag.append(ch)
                 elif c0 == frag.fg:
-                    frag.append("▀", bg=c1)
+                    ch = "▀"
+                    frag.append(ch, bg=c1)
                 elif c1 == frag.fg:
-                    frag.append("▄", bg=c0)
+                    ch = "▄"
+                    frag.append(ch, bg=c0)
                 elif c0 == c1:
-                    frag.append(" ", bg=c0)
+                    ch = " "
+                    frag.append(ch, bg=c0)
                 else:
                     fragments.append(frag.pop())
-                    frag.append("▀", fg=c0, bg=c1)
+                    ch = "▀"
+                    frag.append(ch, fg=c0, bg=c1)
             else:
                 # palette contains two colours
                 if c0 == c1 == frag.fg:
-                    frag.append("█")
+                    ch = "█"
+                    frag.append(ch)
                 elif c0 == frag.fg and c1 == frag.bg:
-                    frag.append("▀")
+                    ch = "▀"
+                    frag.append(ch)
                 elif c1 == frag.fg and c0 == frag.bg:
-                    frag.append("▄")
+                    ch = "▄"
+                    frag.append(ch)
                 elif c0 == c1 == frag.bg:
-                    frag.append(" ")
+                    ch = " "
+                    frag.append(ch)
                 else:
                     fragments.append(frag.pop())
                     if c0 == c1:
-                        frag.append("█", fg=c0)
+                        ch = "█"
+                        frag.append(ch, fg=c0)
                     else:
-                        frag.append("▀", fg=c0, bg=c1)
+                        ch = "▀"
+                        frag.append(ch, fg=c0, bg=c1)
         trailing = frag.pop()
         if trailing:
             fragments.append(trailing)
+        if self.color_depth >= 24:
+            fragments = [(text, _unpack_rgb(fg), _unpack_rgb(bg)) for text, fg, bg in fragments]
         return fragments
 
 
+# The NumPy engine is chosen by default only for images of at least this
+# many lines, in which at least this proportion of horizontally adjacent
+# pixels differ; below either, the Python engine is typically faster
+_NUMPY_MIN_LINES = 16
+_NUMPY_MIN_CHANGES = 0.75
+
+
+def _default_engine(data, width, lines):
+    """ Choose the faster rendering engine for a buffer of pixel data, with
+    four bytes per pixel.
+    """
+    if _np is None or lines < _NUMPY_MIN_LINES or width < 2:
+        return "python"
+    pixels = _np.frombuffer(data, dtype=_np.uint32).reshape(-1, width)
+    changes = _np.count_nonzero(pixels[:, 1:] != pixels[:, :-1]) / (pixels.shape[0] * (width - 1))
+    return "numpy" if changes >= _NUMPY_MIN_CHANGES else "python"
+
+
+def _unpack_rgb(value):
+    """ Unpack an RGBA or RGBX pixel, read from a memoryview as a single
+    native-endian integer, into an RGB tuple.
+    """
+    if value is None:
+        return None
+    if _LITTLE_ENDIAN:
+        return value & 0xFF, value >> 8 & 0xFF, value >> 16 & 0xFF
+    else:
+        return value >> 24, value >> 16 & 0xFF, value >> 8 & 0xFF
+
+
+_LITTLE_ENDIAN = byteorder == "little"
+
+
+def _pixel_ids(pixels, color_depth):
+    """ Reduce an array of RGB or RGBA pixels, of shape (height, width,
+    channels), to a two-dimensional array of integer colour identifiers. At
+    24 bits, these are the channel values packed together (so that alpha
+    still distinguishes pixels, as it does in the pure Python engine); at
+    lower colour depths, they are palette indexes.
+    """
+    channels = pixels.astype(_np.int64)
+    r, g, b = channels[..., 0], channels[..., 1], channels[..., 2]
+    if color_depth >= 24:
+        ids = r << 16 | g << 8 | b
+        if channels.shape[-1] > 3:
+            ids = ids << 8 | channels[..., 3]
+        return ids
+    lut = _XTERM_256_LUT if color_depth >= 8 else _CGA_16_LUT
+    return _np.frombuffer(lut, dtype=_np.uint8)[(r >> 3) << 10 | (g >> 3) << 5 | b >> 3].astype(_np.int64)
+
+
+def _render_block_lines(top, bottom, color_depth, alpha=False):
+    """ Render lines of half block characters from two arrays of colour
+    identifiers, for the top and bottom halves of each character cell.
+
+    The output matches that of the pure Python engine: each line is split
+    into runs in which at most two colours appear, each run taking the top
+    colour of its first cell as foreground, and the other colour (if any)
+    as background. The run boundaries are found by stepping across the
+    columns of all lines together. The output bytes for every cell are then
+    laid out side by side in a fixed-width table, and the unused bytes
+    masked away, so that the text for all lines is assembled in one go.
+    """
+    n_lines, n_cols = top.shape
+    if n_cols == 0:
+        return ["\x1b[0m"] * n_lines
+    # Column-major copies, so that each step reads contiguous memory
+    top_t = _np.ascontiguousarray(top.T)
+    bottom_t = _np.ascontiguousarray(bottom.T)
+    solid = top_t == bottom_t
+    # Background colour for a cell that starts a run
+    fresh_bg = _np.where(solid, -1, bottom_t)
+    fg = _np.empty((n_cols, n_lines), dtype=_np.int64)
+    bg = _np.empty((n_cols, n_lines), dtype=_np.int64)
+    starts = _np.empty((n_cols, n_lines), dtype=bool)
+    fg[0] = f = top_t[0]
+    bg[0] = b = fresh_bg[0]
+    starts[0] = True
+    for j in range(1, n_cols):
+        c0 = top_t[j]
+        c1 = bottom_t[j]
+        c0_is_f = c0 == f
+        c1_is_f = c1 == f
+        no_b = b < 0
+        # A run continues for as long as it contains no more than two colours
+        new = ~_np.where(no_b, c0_is_f | c1_is_f | solid[j], (c0_is_f | (c0 == b)) & (c1_is_f | (c1 == b)))
+        fg_j = fg[j]
+        bg_j = bg[j]
+        _np.copyto(fg_j, f)
+        _np.copyto(fg_j, c0, where=new)
+        _np.copyto(bg_j, _np.where(no_b & ~(c0_is_f & c1_is_f), _np.where(c0_is_f, c1, c0), b))
+        _np.copyto(bg_j, fresh_bg[j], where=new)
+        starts[j] = new
+        f = fg_j
+        b = bg_j
+    fg = fg.T
+    bg = bg.T
+    starts = starts.T
+
+    # Block characters, and the colours of each run (which may only be
+    # settled by the final cell of the run) placed against its first cell
+    glyphs = ((top == fg) * 2 + (bottom == fg)).ravel()
+    starts = starts.ravel()
+    ends = _np.empty_like(starts)
+    ends[:-1] = starts[1:]
+    ends[-1] = True
+    run_ids = _np.cumsum(starts) - 1
+    fg = fg.ravel()[ends][run_ids]
+    bg = bg.ravel()[ends][run_ids]
+    has_bg = starts & (bg >= 0)
+    line_ends = _np.zeros(starts.shape, dtype=bool)
+    line_ends[n_cols - 1::n_cols] = True
+
+    segments = (_escape_segments(fg, starts, color_depth, alpha, background=False) +
+                _escape_segments(_np.maximum(bg, 0), has_bg, color_depth, alpha, background=True) +
+                [(_GLYPH_BYTES[glyphs], _GLYPH_LENGTHS[glyphs]),
+                 _constant_segment("\x1b[0m", line_ends)])
+    table = _np.concatenate([data for data, _ in segments], axis=1)
+    mask = _np.concatenate([_np.arange(data.shape[1]) < lengths[:, None] for data, lengths in segments], axis=1)
+    data = table[mask].tobytes()
+    line_sizes = sum(lengths for _, lengths in segments).reshape(n_lines, n_cols).sum(axis=1).tolist()
+    lines = []
+    offset = 0
+    for size in line_sizes:
+        lines.append(data[offset:offset + size].decode("utf-8"))
+        offset += size
+    return lines
+
+
+def _constant_segment(text, present):
+    data = _np.frombuffer(text.encode("ascii"), dtype=_np.uint8)
+    return _np.broadcast_to(data, (len(present), len(data))), _np.where(present, len(data), 0)
+
+
+def _number_segment(values, present):
+    return _DIGITS[values], _np.where(present, _DIGIT_COUNTS[values], 0)
+
+
+def _escape_segments(values, present, color_depth, alpha, background):
+    """ Return output segments for SGR colour sequences, as written by
+    :meth:`Fragment.to_ansi_text`, for an array of colour identifiers.
+    """
+    if color_depth >= 24:
+        if alpha:
+            values = values >> 8
+        return [_constant_segment("\x1b[48;2;" if background else "\x1b[38;2;", present),
+                _number_segment(values >> 16 & 0xFF, present),
+                _constant_segment(";", present),
+                _number_segment(values >> 8 & 0xFF, present),
+                _constant_segment(";", present),
+                _number_segment(values & 0xFF, present),
+                _constant_segment("m", present)]
+    elif color_depth >= 8:
+        return [_constant_segment("\x1b[48;5;" if background else "\x1b[38;5;", present),
+                _number_segment(values, present),
+                _constant_segment("m", present)]
+    else:
+        codes = _np.where(values < 8, values + (40 if background else 30), values + (92 if background else 82))
+        return [_constant_segment("\x1b[", present),
+                _number_segment(codes, present),
+                _constant_segment("m", present)]
+
+
+if _np is not None:
+    # Decimal representations of 0..255, left aligned and padded to three bytes
+    _DIGITS = _np.array([list(str(n).ljust(3).encode("ascii")) for n in range(256)], dtype=_np.uint8)
+    _DIGIT_COUNTS = _np.array([len(str(n)) for n in range(256)])
+    # UTF-8 encodings of the block characters, indexed by whether the top
+    # and bottom halves take the foreground colour
+    _GLYPH_BYTES = _np.array([list(char.encode("utf-8").ljust(3)) for char in " ▄▀█"], dtype=_np.uint8)
+    _GLYPH_LENGTHS = _np.array([len(char.encode("utf-8")) for char in " ▄▀█"])
+
+
+def _quadrant_glyphs():
+    return " ▘▝▀▖▌▞▛▗▚▐▜▄▙▟█"
+
+
+def _sextant_glyphs():
+    # The Unicode sextant block omits the four patterns that already exist
+    # elsewhere: empty, full, left half and right half
+    glyphs = []
+    for mask in range(64):
+        if mask == 0:
+            glyphs.append(" ")
+        elif mask == 63:
+            glyphs.append("█")
+        elif mask == 21:
+            glyphs.append("▌")
+        elif mask == 42:
+            glyphs.append("▐")
+        else:
+            glyphs.append(chr(0x1FB00 + mask - 1 - (mask > 21) - (mask > 42)))
+    return "".join(glyphs)
+
+
+def _braille_glyphs():
+    # Braille dot values, for pixels in row-major order
+    dots = (0x01, 0x08, 0x02, 0x10, 0x04, 0x20, 0x40, 0x80)
+    glyphs = [" "]
+    for mask in range(1, 256):
+        glyphs.append(chr(0x2800 + sum(dot for i, dot in enumerate(dots) if mask >> i & 1)))
+    return "".join(glyphs)
+
+
+# Cell width and height in pixels, glyphs indexed by a mask of foreground
+# pixels (in row-major order), and whether the glyphs are solid, such that
+# inverting the mask and swapping the colours gives the same appearance
+_MOSAIC_MODES = {
+    "quadrant": (2, 2, _quadrant_glyphs(), True),
+    "sextant": (2, 3, _sextant_glyphs(), True),
+    "braille": (2, 4, _braille_glyphs(), False),
+}
+
+
+class MosaicImage:
+    """ Image rendered as a mosaic of two-colour character cells, each
+    covering more than the two pixels of a :class:`BlockImage`. Three modes
+    are available: 'quadrant' (2×2 pixels per character), 'sextant' (2×3)
+    and 'braille' (2×4). Sextant characters were added in Unicode 13, and
+    so may be missing from older fonts; braille characters are widely
+    available, but show the background colour between the dots.
+
+    The pixels of each cell are split into two groups, across the colour
+    channel with the widest range, and the mean colour of each group is
+    used as foreground or background. The character is then looked up
+    from a precomputed table, indexed by which pixels take the foreground
+    colour. For the solid block modes, the colours are swapped where that
+    avoids a change of colour from the previous character.
+
+    As with :class:`BlockImage`, pixels are split with NumPy if it is
+    installed (the 'numpy' engine) or in pure Python otherwise (the
+    'python' engine), with identical results.
+    """
+
+    def __init__(self, image, lines, cols, mode="quadrant", color_depth=24, engine=None):
+        try:
+            self.cell_width, self.cell_height, self._glyphs, self._solid = _MOSAIC_MODES[mode]
+        except KeyError:
+            raise ValueError(f"Unknown mosaic mode {mode!r}")
+        self.mode = mode
+        self.lines = int(ceil(lines))
+        self.cols = cols
+        self.color_depth = color_depth
+        resized = image.convert("RGB").resize((self.cell_width * self.cols, self.cell_height * self.lines))
+        if engine is None:
+            engine = "python" if _np is None else "numpy"
+        if engine == "numpy":
+            self.cells = _np_mosaic_cells(resized, self.cell_width, self.cell_height, color_depth)
+        elif engine == "python":
+            self.cells = _mosaic_cells(resized, self.cell_width, self.cell_height, color_depth)
+        else:
+            raise ValueError(f"Unknown rendering engine {engine!r}")
+        self.engine = engine
+        self._escapes = {}
+
+    def _escape(self, color, background):
+        # SGR sequences are cached per image, as a photographic image may
+        # hold many thousands of distinct colours
+        key = (color, background)
+        try:
+            return self._escapes[key]
+        except KeyError:
+            value = self._escapes[key] = _color_escape(color, self.color_depth, background)
+            return value
+
+    def ansi_lines(self):
+        glyphs = self._glyphs
+        full = len(glyphs) - 1
+        escape = self._escape
+        for masks, fgs, bgs in self.cells:
+            out = []
+            fg = bg = None
+            for mask, c0, c1 in zip(masks, fgs, bgs):
+                if c0 == c1:
+                    mask = 0
+                # Number of colour changes required, as is, and with the
+                # mask inverted and the colours swapped
+                cost = (mask != 0 and c0 != fg) + ((mask != full or not self._solid) and c1 != bg)
+                if self._solid and cost:
+                    if (mask != full and c1 != fg) + (mask != 0 and c0 != bg) < cost:
+                        mask, c0, c1 = full ^ mask, c1, c0
+                if mask != 0 and c0 != fg:
+                    fg = c0
+                    out.append(escape(fg, False))
+                if (mask != full or not self._solid) and c1 != bg:
+                    bg = c1
+                    out.append(escape(bg, True))
+                out.append(glyphs[mask])
+            out.append("\x1b[0m")
+            yield "".join(out)
+
+
+def _color_escape(color, color_depth, background):
+    """ Return an SGR sequence, as written by :meth:`Fragment.to_ansi_text`,
+    for a colour that is either a palette index or (at 24 bits) an RGB value
+    packed into a single integer.
+    """
+    if color_depth >= 24:
+        color = (color >> 16, color >> 8 & 0xFF, color & 0xFF)
+    return Fragment.to_ansi_text(("", None, color) if background else ("", color, None), color_depth)
+
+
+def _mosaic_cells(image, cell_width, cell_height, color_depth):
+    """ Split each cell of an RGB image into two colours, returning a list
+    of lines, each holding a list of foreground masks, a list of foreground
+    colours and a list of background colours.
+    """
+    data = image.tobytes()
+    stride = 3 * image.width
+    to_index = None if color_depth >= 24 else xterm_256_index if color_depth >= 8 else cga_16_index
+    # Byte offsets of each pixel in a cell, relative to its top left corner
+    offsets = [y * stride + 3 * x for y in range(cell_height) for x in range(cell_width)]
+    lines = []
+    for top in range(0, len(data), cell_height * stride):
+        masks = []
+        fgs = []
+        bgs = []
+        for left in range(top, top + stride, 3 * cell_width):
+            pixels = [data[left + offset:left + offset + 3] for offset in offsets]
+            lo = [min(p[c] for p in pixels) for c in range(3)]
+            hi = [max(p[c] for p in pixels) for c in range(3)]
+            ranges = [hi[c] - lo[c] for c in range(3)]
+            c = ranges.index(max(ranges))
+            threshold = lo[c] + hi[c]
+            mask = 0
+            sums = [[0, 0, 0], [0, 0, 0]]
+            counts = [0, 0]
+            for i, p in enumerate(pixels):
+                group = 2 * p[c] > threshold
+                mask |= group << i
+                counts[group] += 1
+                s = sums[group]
+                s[0] += p[0]
+                s[1] += p[1]
+                s[2] += p[2]
+            colors = []
+            for s, n in zip(sums, counts):
+                if n == 0:
+                    colors.append(None)
+                elif to_index is None:
+                    colors.append(s[0] // n << 16 | s[1] // n << 8 | s[2] // n)
+                else:
+                    colors.append(to_index(s[0] // n, s[1] // n, s[2] // n))
+            masks.append(mask)
+            bgs.append(colors[0])
+            fgs.append(colors[1])
+        lines.append((masks, fgs, bgs))
+    return lines
+
+
+def _np_mosaic_cells(image, cell_width, cell_height, color_depth):
+    """ NumPy equivalent of :func:`_mosaic_cells`.
+    """
+    lines = image.height // cell_height
+    cols = image.width // cell_width
+    k = cell_width * cell_height
+    pixels = _np.frombuffer(image.tobytes(), dtype=_np.uint8).astype(_np.int64).reshape(
+        lines, cell_height, cols, cell_width, 3).transpose(0, 2, 1, 3, 4).reshape(lines, cols, k, 3)
+    lo = pixels.min(axis=2)
+    hi = pixels.max(axis=2)
+    c = (hi - lo).argmax(axis=-1)[..., None]
+    values = _np.take_along_axis(pixels, c[..., None], axis=-1)[..., 0]
+    threshold = _np.take_along_axis(lo, c, axis=-1) + _np.take_along_axis(hi, c, axis=-1)
+    groups = 2 * values > threshold
+    masks = (groups << _np.arange(k)).sum(axis=-1)
+    colors = []
+    for selected in (~groups, groups):
+        n = selected.sum(axis=-1)
+        means = (pixels * selected[..., None]).sum(axis=2) // _np.maximum(n, 1)[..., None]
+        r, g, b = means[..., 0], means[..., 1], means[..., 2]
+        if color_depth >= 24:
+            ids = r << 16 | g << 8 | b
+        else:
+            lut = _XTERM_256_LUT if color_depth >= 8 else _CGA_16_LUT
+            ids = _np.frombuffer(lut, dtype=_np.uint8)[(r >> 3) << 10 | (g >> 3) << 5 | b >> 3].astype(_np.int64)
+        colors.append(_np.where(n == 0, -1, ids).tolist())
+    bgs, fgs = colors
+    return [(line_masks, [None if color < 0 else color for color in line_fgs],
+             [None if color < 0 else color for color in line_bgs])
+            for line_masks, line_fgs, line_bgs in zip(masks.tolist(), fgs, bgs)]
+
+
 def main():
     parser = ArgumentParser()
     parser.add_argument("-B", "--force-blocks", action="store_true")
+    parser.add_argument("-d", "--color-depth", type=int, choices=(24, 8, 4),
+                        help="colour depth for block output (detected by default)")
+    parser.add_argument("-m", "--mode", default="half", choices=("half", *_MOSAIC_MODES),
+                        help="characters used for block output: half blocks (default), quadrants, "
+                             "sextants or braille")
+    parser.add_argument("-t", "--transmission", default="auto", choices=("auto", "direct", "shared-memory"),
+                        help="how pixel data is sent to the terminal: directly within escape codes, through "
+                             "shared memory, or (by default) through shared memory only within a local kitty")
+    parser.add_argument("-z", "--compress", action="store_true",
+                        help="compress pixel data sent directly within escape codes")
     parser.add_argument("filename")
     args = parser.parse_args()
     screen = Terminal()
     term_image = TerminalImage(Image.open(args.filename))
     if args.force_blocks or not Terminal.supports_graphics_protocol():
-        term_image.to_fit(screen).print_blocks(screen)
+        color_depth = args.color_depth or detect_color_depth()
+        term_image.to_fit(screen).print_blocks(screen, color_depth=color_depth, mode=args.mode)
     else:
-        term_image.to_fit(screen).print_pixels()
+        term_image.to_fit(screen).print_pixels(medium=args.transmission, compress=args.compress)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,311 @@
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from pansi import detect_color_depth
+from pansi import color
+from pansi.color import (Color, ColorIndex, Gradient, palette_index, nearest_color_name, cga_16_index, cga_16_rgb, xterm_256_index, xterm_256_rgb,
+                         rgb, hsl, hwb, lab, lch, oklab, oklch,
+                         srgb_to_hex, srgb_to_hsl, hsl_to_srgb, srgb_to_hwb, hwb_to_srgb,
+                         srgb_to_oklab, oklab_to_srgb, srgb_to_oklch, oklch_to_srgb,
+                         srgb_to_lab, lab_to_srgb, srgb_to_lch, lch_to_srgb)
+
+
+class PaletteLookupTest(TestCase):
+
+    def test_cga_palette_maps_to_itself(self):
+        for i in range(16):
+            self.assertEqual(cga_16_index(*cga_16_rgb(i)), i)
+
+    def test_xterm_color_cube_maps_to_itself(self):
+        for i in range(16, 232):
+            r, g, b = xterm_256_rgb(i)
+            if not r == g == b:  # greys may map to the greyscale ramp instead
+                self.assertEqual(xterm_256_index(r, g, b), i)
+
+    def test_xterm_excludes_system_colors(self):
+        self.assertEqual(xterm_256_index(0, 0, 0), 16)
+        self.assertEqual(xterm_256_index(255, 255, 255), 231)
+
+    def test_nearest(self):
+        self.assertEqual(xterm_256_index(250, 10, 5), 196)
+        self.assertEqual(cga_16_index(20, 20, 180), 4)
+
+
+class DetectColorDepthTest(TestCase):
+
+    def test_truecolor(self):
+        self.assertEqual(detect_color_depth({"COLORTERM": "truecolor", "TERM": "xterm"}), 24)
+        self.assertEqual(detect_color_depth({"TERM": "xterm-direct"}), 24)
+
+    def test_256_colors(self):
+        self.assertEqual(detect_color_depth({"TERM": "screen-256color"}), 8)
+
+    def test_16_colors(self):
+        self.assertEqual(detect_color_depth({"TERM": "linux"}), 4)
+        self.assertEqual(detect_color_depth({"TERM": "xterm-16color"}), 4)
+
+    def test_unknown_defaults_to_truecolor(self):
+        self.assertEqual(detect_color_depth({"TERM": "xterm"}), 24)
+        self.assertEqual(detect_color_depth({"TERM": "tmux"}), 24)
+        self.assertEqual(detect_color_depth({}), 24)
+
+
+class ColorTest(TestCase):
+
+    def test_components(self):
+        color = Color(255, 128, 0)
+        self.assertEqual(tuple(color), (255, 128, 0, None))
+        self.assertEqual((color.red, color.green, color.blue, color.alpha), (255, 128, 0, None))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            Color(0, 0, 0).red = 1
+        with self.assertRaises(AttributeError):
+            Color(0, 0, 0).name = "black"
+
+    def test_hex(self):
+        self.assertEqual(str(Color(255, 128, 0)), "#FF8000")
+        self.assertEqual(Color(255, 128, 0, 64).hex, "#FF800040")
+
+    def test_constructors_match_functions(self):
+        self.assertEqual(Color.rgb("100%", 128, 0, alpha=0.5).hex, rgb("100%", 128, 0, alpha=0.5))
+        self.assertEqual(Color.oklab(0.7, 0.1, 0.1).hex, oklab(0.7, 0.1, 0.1))
+        self.assertEqual(Color.oklch(0.7, 0.1, 30).hex, oklch(0.7, 0.1, 30))
+        self.assertEqual(Color.hsl(210, 50, 25).hex, hsl(210, 50, 25))
+
+    def test_parse(self):
+        self.assertEqual(Color.parse("#FF8000"), Color(255, 128, 0))
+        self.assertEqual(Color.parse("#f80"), Color(255, 136, 0))
+        self.assertEqual(Color.parse("Orange"), Color(255, 165, 0))
+        self.assertEqual(Color.parse("rgb(255 128 0 / 50%)"), Color(255, 128, 0, 128))
+        self.assertEqual(Color.parse("rgba(255, 128, 0, 0.5)"), Color(255, 128, 0, 128))
+        self.assertEqual(Color.parse("hsl(30, 100%, 50%)"), Color(255, 128, 0))
+        self.assertEqual(Color.parse("hwb(0 50% 50%)"), Color(128, 128, 128))
+        self.assertEqual(Color.parse("oklch(0.7 0.1 30)"), Color.oklch(0.7, 0.1, 30))
+        self.assertEqual(Color.parse((255, "50%", 0)), Color(255, 128, 0))
+
+    def test_parse_is_cached(self):
+        self.assertIs(Color.parse("rgb(1 2 3)"), Color.parse("rgb(1 2 3)"))
+
+    def test_parse_invalid(self):
+        for value in ("", "#12345", "nocolor", "rgb(1 2)", "foo(1 2 3)"):
+            with self.subTest(value):
+                with self.assertRaises(ValueError):
+                    Color.parse(value)
+
+
+class ColorFunctionTest(TestCase):
+
+    def test_hsl(self):
+        self.assertEqual(hsl(0, "100%", "50%"), "#FF0000")
+        self.assertEqual(hsl(210, 50, 25), "#204060")
+        self.assertEqual(hsl(0, 0, 100, alpha=0.5), "#FFFFFF80")
+
+    def test_hwb(self):
+        self.assertEqual(hwb(120, 0, 0), "#00FF00")
+        self.assertEqual(hwb(0, 60, 60), "#808080")
+
+    def test_lab(self):
+        self.assertEqual(lab(100, 0, 0), "#FFFFFF")
+        self.assertEqual(lab(0, 0, 0), "#000000")
+        self.assertEqual(lab(54.29, 80.8, 69.89), "#FF0000")
+
+    def test_lch(self):
+        self.assertEqual(lch(54.29, 106.84, 40.85), "#FF0000")
+
+
+class ColorConversionTest(TestCase):
+
+    samples = [(0.0, 0.0, 0.0), (1.0, 1.0, 1.0), (1.0, 0.5, 0.0), (0.2, 0.4, 0.6),
+               (0.9, 0.1, 0.7), (0.5, 0.5, 0.5), (0.0, 0.0, 1.0)]
+
+    def assertColorsAlmostEqual(self, actual, expected):
+        for x, y in zip(actual, expected):
+            for a, b in zip(x, y):
+                self.assertAlmostEqual(float(a), float(b), places=5)
+
+    def check_round_trips(self):
+        for forward, backward in [(srgb_to_hsl, hsl_to_srgb),
+                                  (srgb_to_hwb, hwb_to_srgb),
+                                  (srgb_to_oklab, oklab_to_srgb),
+                                  (srgb_to_oklch, oklch_to_srgb),
+                                  (srgb_to_lab, lab_to_srgb),
+                                  (srgb_to_lch, lch_to_srgb)]:
+            with self.subTest(forward.__name__):
+                self.assertColorsAlmostEqual(backward(forward(self.samples)), self.samples)
+
+    def check_matches_scalar_functions(self):
+        oklab_values = srgb_to_oklab(self.samples)
+        expected = [oklab(*map(float, value)) for value in oklab_values]
+        self.assertEqual(srgb_to_hex(oklab_to_srgb(oklab_values)), expected)
+        self.assertEqual(srgb_to_hex(hsl_to_srgb([(210, 0.5, 0.25)])), [hsl(210, 50, 25)])
+
+    def test_round_trips(self):
+        self.check_round_trips()
+
+    def test_round_trips_without_numpy(self):
+        with patch.object(color, "_np", None):
+            self.check_round_trips()
+
+    def test_matches_scalar_functions(self):
+        self.check_matches_scalar_functions()
+
+    def test_matches_scalar_functions_without_numpy(self):
+        with patch.object(color, "_np", None):
+            self.check_matches_scalar_functions()
+
+    def test_fallback_returns_tuples(self):
+        with patch.object(color, "_np", None):
+            self.assertEqual(srgb_to_hsl([(1.0, 0.5, 0.0)]), [(30.0, 1.0, 0.5)])
+
+    @skipIf(color._np is None, "NumPy is not installed")
+    def test_numpy_preserves_shape(self):
+        import numpy
+        frame = numpy.random.default_rng(0).random((4, 5, 3))
+        self.assertEqual(srgb_to_oklab(frame).shape, (4, 5, 3))
+        numpy.testing.assert_allclose(oklab_to_srgb(srgb_to_oklab(frame)), frame, atol=1e-5)
+        self.assertColorsAlmostEqual(srgb_to_lch(frame[0]), color.srgb_to_lch(frame[0].tolist()))
+
+
+class GradientTest(TestCase):
+
+    def test_endpoints(self):
+        gradient = Gradient("red", "#0000FF", size=16)
+        self.assertEqual(len(gradient), 16)
+        self.assertEqual(gradient[0], Color(255, 0, 0))
+        self.assertEqual(gradient[-1], Color(0, 0, 255))
+
+    def test_explicit_positions(self):
+        gradient = Gradient((0.0, "black"), (0.5, "white"), (1.0, "white"), size=5)
+        self.assertEqual(gradient[2], Color(255, 255, 255))
+        self.assertEqual(gradient[4], Color(255, 255, 255))
+
+    def test_oklch_takes_shorter_hue_arc(self):
+        gradient = Gradient(Color.oklch(0.7, 0.1, 350), Color.oklch(0.7, 0.1, 10), space="oklch", size=3)
+        self.assertEqual(gradient[1], Color.oklch(0.7, 0.1, 0))
+
+    def test_oklch_grey_stop_keeps_hue(self):
+        gradient = Gradient("white", "red", space="oklch", size=3)
+        _, _, hue = srgb_to_oklch([[c / 255 for c in gradient[1][:3]]])[0]
+        _, _, red_hue = srgb_to_oklch([(1.0, 0.0, 0.0)])[0]
+        self.assertAlmostEqual(float(hue), float(red_hue), delta=2)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Gradient("red")
+        with self.assertRaises(ValueError):
+            Gradient("red", "blue", space="hsl")
+        with self.assertRaises(ValueError):
+            Gradient((1.0, "red"), (0.0, "blue"))
+
+    def test_escapes_are_retained(self):
+        gradient = Gradient("red", "blue")
+        self.assertIs(gradient.escapes(8), gradient.escapes(8))
+        self.assertEqual(gradient.escape(0), "\x1b[38;2;255;0;0m")
+        self.assertEqual(gradient.escape(2.0, background=True), "\x1b[48;2;0;0;255m")
+
+    def test_paint(self):
+        gradient = Gradient("red", "blue", size=3)
+        self.assertEqual(gradient.paint("abc"), "\x1b[38;2;255;0;0ma" + gradient.escape(0.5) + "b"
+                         "\x1b[38;2;0;0;255mc\x1b[39m")
+        self.assertEqual(gradient.paint(""), "")
+
+    def test_paint_merges_runs(self):
+        gradient = Gradient("red", "red")
+        self.assertEqual(gradient.paint("abc"), "\x1b[38;2;255;0;0mabc\x1b[39m")
+
+    def test_paint_keeps_clusters_together(self):
+        gradient = Gradient("red", "blue", size=2)
+        self.assertEqual(gradient.paint("e\u0301x"),
+                         "\x1b[38;2;255;0;0me\u0301\x1b[38;2;0;0;255mx\x1b[39m")
+
+    def test_paint_passes_escape_sequences_through(self):
+        gradient = Gradient("red", "blue", size=2)
+        self.assertEqual(gradient.paint("a\x1b[1mb"),
+                         "\x1b[38;2;255;0;0ma\x1b[1m\x1b[38;2;0;0;255mb\x1b[39m")
+        self.assertEqual(gradient.paint("\x1b[1m"), "\x1b[1m")
+
+    def check_heatmap(self):
+        gradient = Gradient("black", "white", size=3)
+        self.assertEqual(gradient.heatmap([[0, 0, 1], [0.5, -1, 2]], char="#"), [
+            "\x1b[38;2;0;0;0m##\x1b[38;2;255;255;255m#\x1b[39m",
+            gradient.escape(0.5) + "#\x1b[38;2;0;0;0m#\x1b[38;2;255;255;255m#\x1b[39m",
+        ])
+
+    def test_heatmap(self):
+        self.check_heatmap()
+
+    def test_heatmap_without_numpy(self):
+        with patch.object(color, "_np", None):
+            self.check_heatmap()
+
+
+class ColorIndexTest(TestCase):
+
+    @staticmethod
+    def brute_force(palette, color):
+        target = srgb_to_oklab([[c / 255 for c in color]])[0]
+
+        def distance(key):
+            point = srgb_to_oklab([[c / 255 for c in palette[key]]])[0]
+            return sum((float(a) - float(b)) ** 2 for a, b in zip(point, target))
+
+        return distance, min(palette, key=distance)
+
+    def test_empty_palette(self):
+        index = ColorIndex({})
+        self.assertEqual(len(index), 0)
+        self.assertIsNone(index.nearest("#FF0000"))
+        self.assertEqual(index.nearest_many([(0, 0, 0), (255, 255, 255)]), [None, None])
+
+    def test_matches_brute_force(self):
+        from random import Random
+        rnd = Random(0)
+        palette = color.WEB_PALETTE
+        index = palette_index("web")
+        for _ in range(200):
+            rgb_value = tuple(rnd.randrange(256) for _ in range(3))
+            distance, expected = self.brute_force(palette, rgb_value)
+            self.assertEqual(distance(index.nearest(rgb_value)), distance(expected))
+
+    def test_every_palette_matches_brute_force(self):
+        from random import Random
+        rnd = Random(1)
+        palettes = {name: color._PALETTES[name][0]() for name in color._PALETTES}
+        palettes["random"] = {n: tuple(rnd.randrange(256) for _ in range(3)) for n in range(50)}
+        colors = [tuple(rnd.randrange(256) for _ in range(3)) for _ in range(40)]
+        for numpy in (color._np, None):
+            for name, palette in palettes.items():
+                with self.subTest(palette=name, numpy=numpy is not None), patch.object(color, "_np", numpy):
+                    index = ColorIndex(palette)
+                    for rgb_value in colors:
+                        distance, expected = self.brute_force(palette, rgb_value)
+                        self.assertEqual(distance(index.nearest(rgb_value)), distance(expected))
+
+    def test_exact_matches(self):
+        index = palette_index("web")
+        self.assertEqual(index.nearest("#FF0000"), "red")
+        self.assertEqual(index.nearest(Color(0, 255, 255)), "aqua")  # earliest of aqua and cyan
+        self.assertEqual(palette_index("cga").nearest((0xAA, 0x55, 0)), "olive")
+        self.assertEqual(palette_index("xterm-256").nearest((95, 135, 175)), 67)
+
+    def test_nearest_many(self):
+        index = palette_index("cga")
+        self.assertEqual(index.nearest_many([(0, 0, 0), (250, 250, 250), (250, 80, 80)]),
+                         ["black", "white", "red"])
+
+    def test_nearest_many_without_numpy(self):
+        with patch.object(color, "_np", None):
+            self.test_nearest_many()
+
+    def test_nearest_color_name(self):
+        self.assertEqual(nearest_color_name("#FF7F51"), "coral")
+
+    def test_unknown_palette(self):
+        with self.assertRaises(ValueError):
+            palette_index("vga")
+
+    def test_single_entry(self):
+        index = ColorIndex({"only": (10, 20, 30)})
+        self.assertEqual(index.nearest((255, 255, 255)), "only")
+        self.assertEqual(len(index), 1)
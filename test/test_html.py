@@ -0,0 +1,42 @@
+from io import StringIO
+from unittest import TestCase
+
+from pansi import red, reset, markup
+from pansi.html import HTMLWriter, ansi_to_html
+
+
+class HTMLWriterTest(TestCase):
+
+    def test_plain_text_is_escaped(self):
+        self.assertEqual(ansi_to_html("<a & b>", stylesheet=False), '<pre class="ansi">&lt;a &amp; b&gt;</pre>\n')
+
+    def test_palette_names(self):
+        html = ansi_to_html(markup("[red on navy]x[/][gray]y[/]"))
+        self.assertIn('<span class="ansi-red ansi-bg-navy">x</span>', html)
+        self.assertIn(".ansi-red { color: #FF5555 }", html)
+        self.assertIn(".ansi-bg-navy { background-color: #0000AA }", html)
+        self.assertIn(".ansi-gray { color: #555555 }", html)
+
+    def test_rgb_colours_are_inline(self):
+        html = ansi_to_html(markup("[#FFA500]y[/][bold #123456 on #abcdef]z[/]"))
+        self.assertIn('<span style="color: #FFA500">y</span>', html)
+        self.assertIn('<span class="ansi-bold" style="color: #123456; background-color: #ABCDEF">z</span>', html)
+        self.assertEqual(html.count("{"), 1)
+
+    def test_rules_are_deduplicated(self):
+        html = ansi_to_html(f"{red}a{reset} b {red}c{reset}")
+        self.assertEqual(html.count(".ansi-red {"), 1)
+        self.assertEqual(html.count('<span class="ansi-red">'), 2)
+
+    def test_chunked_input(self):
+        out = StringIO()
+        with HTMLWriter(out, class_prefix="x") as writer:
+            for chunk in ["one \x1b[", "91mtwo\x1b", "[0m three"]:
+                writer.write(chunk)
+        self.assertTrue(out.getvalue().startswith('<pre class="x">one <span class="x-red">two</span> three</pre>\n'))
+
+    def test_write_after_close(self):
+        writer = HTMLWriter(StringIO())
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write("x")
@@ -0,0 +1,153 @@
+from random import Random
+from unittest import TestCase, skipIf
+
+from PIL import Image
+
+from pansi import image
+from pansi.image import BlockImage, MosaicImage
+
+
+def sample_image(width, height, mode="RGB", colors=4, seed=0):
+    """ Generate an image from a small set of colours, so that runs of
+    repeated colours (and so multi-cell fragments) are common.
+    """
+    rnd = Random(seed)
+    channels = len(mode)
+    palette = [tuple(rnd.randrange(256) for _ in range(channels)) for _ in range(colors)]
+    if channels == 1:
+        palette = [value for value, in palette]
+    im = Image.new(mode, (width, height))
+    im.putdata([palette[min(rnd.randrange(colors), rnd.randrange(colors))] for _ in range(width * height)])
+    return im
+
+
+class BlockImageTest(TestCase):
+
+    def test_solid_colour(self):
+        block_image = BlockImage(Image.new("RGB", (4, 4), (255, 128, 0)), lines=2, cols=4, engine="python")
+        self.assertEqual(list(block_image.ansi_lines()), ["\x1b[38;2;255;128;0m████\x1b[0m"] * 2)
+
+    def test_half_blocks(self):
+        im = Image.new("RGB", (2, 2))
+        im.putdata([(255, 0, 0), (0, 0, 255), (0, 0, 255), (255, 0, 0)])
+        block_image = BlockImage(im, lines=1, cols=2, engine="python")
+        self.assertEqual(list(block_image.ansi_lines()),
+                         ["\x1b[38;2;255;0;0m\x1b[48;2;0;0;255m▀▄\x1b[0m"])
+
+    def test_grey_image(self):
+        block_image = BlockImage(Image.new("L", (2, 2), 128), lines=1, cols=2, engine="python")
+        self.assertEqual(list(block_image.ansi_lines()), ["\x1b[38;2;128;128;128m██\x1b[0m"])
+
+    def test_repeated_runs(self):
+        im = Image.new("RGB", (9, 2), (0, 0, 0))
+        for x in range(3, 9):
+            im.putpixel((x, 1), (255, 255, 255))
+        block_image = BlockImage(im, lines=1, cols=9, engine="python")
+        self.assertEqual(list(block_image.ansi_lines()),
+                         ["\x1b[38;2;0;0;0m\x1b[48;2;255;255;255m███▀▀▀▀▀▀\x1b[0m"])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            BlockImage(Image.new("RGB", (2, 2)), lines=1, cols=2, engine="fortran")
+
+
+class MosaicImageTest(TestCase):
+
+    def test_solid_colour(self):
+        mosaic = MosaicImage(Image.new("RGB", (4, 4), (255, 128, 0)), lines=2, cols=2, engine="python")
+        self.assertEqual(list(mosaic.ansi_lines()), ["\x1b[48;2;255;128;0m  \x1b[0m"] * 2)
+
+    def test_quadrants(self):
+        im = Image.new("RGB", (4, 2))
+        im.putdata([(255, 0, 0), (0, 0, 255), (0, 0, 255), (0, 0, 255),
+                    (0, 0, 255), (0, 0, 255), (0, 0, 255), (255, 0, 0)])
+        mosaic = MosaicImage(im, lines=1, cols=2, mode="quadrant", engine="python")
+        self.assertEqual(list(mosaic.ansi_lines()),
+                         ["\x1b[38;2;255;0;0m\x1b[48;2;0;0;255m▘▗\x1b[0m"])
+
+    def test_swapped_colours_avoid_escapes(self):
+        im = Image.new("RGB", (4, 2))
+        im.putdata([(255, 0, 0), (0, 0, 255), (255, 0, 0), (255, 255, 255),
+                    (255, 0, 0), (0, 0, 255), (255, 0, 0), (255, 255, 255)])
+        mosaic = MosaicImage(im, lines=1, cols=2, mode="quadrant", engine="python")
+        self.assertEqual(list(mosaic.ansi_lines()),
+                         ["\x1b[38;2;255;0;0m\x1b[48;2;0;0;255m▌\x1b[48;2;255;255;255m▌\x1b[0m"])
+
+    def test_sextants(self):
+        im = Image.new("RGB", (2, 3), (0, 0, 0))
+        im.putpixel((1, 2), (255, 255, 255))
+        mosaic = MosaicImage(im, lines=1, cols=1, mode="sextant", engine="python")
+        self.assertEqual(list(mosaic.ansi_lines()),
+                         ["\x1b[38;2;255;255;255m\x1b[48;2;0;0;0m\U0001FB1E\x1b[0m"])
+
+    def test_braille(self):
+        im = Image.new("RGB", (2, 4), (0, 0, 0))
+        im.putpixel((0, 0), (255, 255, 255))
+        im.putpixel((1, 3), (255, 255, 255))
+        mosaic = MosaicImage(im, lines=1, cols=1, mode="braille", engine="python")
+        self.assertEqual(list(mosaic.ansi_lines()),
+                         ["\x1b[38;2;255;255;255m\x1b[48;2;0;0;0m⢁\x1b[0m"])
+
+    def test_lower_depth_merges_colours(self):
+        im = Image.new("RGB", (2, 2), (250, 0, 0))
+        im.putpixel((0, 0), (255, 0, 0))
+        mosaic = MosaicImage(im, lines=1, cols=1, color_depth=8, engine="python")
+        self.assertEqual(list(mosaic.ansi_lines()), ["\x1b[48;5;196m \x1b[0m"])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            MosaicImage(Image.new("RGB", (2, 2)), lines=1, cols=1, mode="octant")
+
+
+@skipIf(image._np is None, "NumPy is not installed")
+class NumPyEngineTest(TestCase):
+
+    def assertEnginesMatch(self, im, lines, cols, color_depth=24, offsets=((0, 0),)):
+        expected = BlockImage(im, lines=lines, cols=cols, color_depth=color_depth, engine="python")
+        actual = BlockImage(im, lines=lines, cols=cols, color_depth=color_depth, engine="numpy")
+        for offset in offsets:
+            expected.offset = actual.offset = offset
+            self.assertEqual(list(actual.ansi_lines()), list(expected.ansi_lines()))
+
+    def test_default_engine(self):
+        busy = sample_image(40, 40, colors=64)
+        self.assertEqual(BlockImage(busy, lines=20, cols=40).engine, "numpy")
+        # Too short to amortise the NumPy engine's overhead
+        self.assertEqual(BlockImage(busy, lines=4, cols=40).engine, "python")
+        # Few enough colour changes for the Python engine to be faster
+        self.assertEqual(BlockImage(Image.new("RGB", (40, 40), (255, 0, 0)), lines=20, cols=40).engine, "python")
+
+    def test_matches_python_engine_for_other_modes(self):
+        for mode in ("L", "LA", "P"):
+            with self.subTest(mode=mode):
+                im = sample_image(20, 10, mode="L" if mode == "P" else mode, colors=3).convert(mode)
+                self.assertEnginesMatch(im, lines=5, cols=20)
+
+    def test_matches_python_engine(self):
+        for colors in (1, 2, 3, 8):
+            with self.subTest(colors=colors):
+                self.assertEnginesMatch(sample_image(40, 20, colors=colors, seed=colors), lines=10, cols=40)
+
+    def test_matches_python_engine_with_alpha(self):
+        self.assertEnginesMatch(sample_image(30, 12, mode="RGBA", colors=5), lines=6, cols=30)
+
+    def test_matches_python_engine_at_lower_depths(self):
+        im = sample_image(30, 12, colors=12)
+        for color_depth in (8, 4):
+            with self.subTest(color_depth=color_depth):
+                self.assertEnginesMatch(im, lines=6, cols=30, color_depth=color_depth)
+
+    def test_matches_python_engine_with_offsets(self):
+        self.assertEnginesMatch(sample_image(20, 10, colors=3), lines=5, cols=20,
+                                offsets=((0, 0), (3, 1), (0, -2), (20, 0)))
+
+    def test_mosaic_matches_python_engine(self):
+        im = sample_image(40, 24, colors=6)
+        for mode in ("quadrant", "sextant", "braille"):
+            for color_depth in (24, 8, 4):
+                with self.subTest(mode=mode, color_depth=color_depth):
+                    expected = MosaicImage(im, lines=6, cols=20, mode=mode, color_depth=color_depth,
+                                           engine="python")
+                    actual = MosaicImage(im, lines=6, cols=20, mode=mode, color_depth=color_depth,
+                                         engine="numpy")
+                    self.assertEqual(list(actual.ansi_lines()), list(expected.ansi_lines()))
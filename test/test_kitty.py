@@ -0,0 +1,150 @@
+from base64 import b64decode
+from io import StringIO
+from multiprocessing.shared_memory import SharedMemory
+from os import environ, pipe, close
+from re import findall
+from subprocess import run
+from sys import executable
+from unittest import TestCase
+from unittest.mock import patch
+from zlib import decompress
+
+from PIL import Image
+
+from pansi import Reactor, Terminal
+from pansi._kitty import is_local_kitty, transmit, transmit_direct, transmit_shared_memory
+from pansi.image import kitty_commands
+
+
+def parse_commands(commands):
+    """ Split graphics commands into (controls, payload) pairs.
+    """
+    parsed = []
+    for command in commands:
+        keys, _, payload = command[3:-2].partition(";")
+        parsed.append((dict(key.split("=") for key in keys.split(",")), payload))
+    return parsed
+
+
+class TransmitDirectTest(TestCase):
+
+    def test_single_chunk(self):
+        self.assertEqual(transmit_direct(b"\xff\x00\x00", 1, 1),
+                         ["\x1b_Ga=T,q=2,f=24,s=1,v=1,m=0;/wAA\x1b\\"])
+
+    def test_chunks(self):
+        data = bytes(range(256)) * 20
+        commands = parse_commands(transmit_direct(data, 40, 32, pixel_format=32))
+        self.assertEqual([controls for controls, _ in commands],
+                         [{"a": "T", "q": "2", "f": "32", "s": "40", "v": "32", "m": "1"},
+                          {"q": "2", "m": "0"}])
+        self.assertEqual(len(commands[0][1]), 4096)
+        self.assertEqual(b64decode("".join(payload for _, payload in commands)), data)
+
+    def test_compression(self):
+        data = b"\x00\x80\xff" * 10000
+        commands = parse_commands(transmit_direct(data, 100, 100, compress=True))
+        self.assertEqual(len(commands), 1)
+        self.assertEqual(commands[0][0]["o"], "z")
+        self.assertEqual(decompress(b64decode(commands[0][1])), data)
+
+    def test_controls_can_be_overridden(self):
+        controls, _ = parse_commands(transmit_direct(b"\x00\x00\x00", 1, 1, a="t", i=7))[0]
+        self.assertEqual((controls["a"], controls["i"]), ("t", "7"))
+
+
+class TransmitSharedMemoryTest(TestCase):
+
+    def test_shared_memory(self):
+        data = bytes(range(48))
+        [(controls, payload)] = parse_commands(transmit_shared_memory(data, 4, 4))
+        self.assertEqual((controls["t"], controls["S"], controls["f"]), ("s", "48", "24"))
+        name = b64decode(payload).decode("utf-8")
+        self.assertTrue(name.startswith("/pansi-"))
+        # Stand in for the terminal, which reads and then unlinks the object
+        memory = SharedMemory(name=name[1:])
+        try:
+            self.assertEqual(bytes(memory.buf[:48]), data)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_shared_memory_outlives_process(self):
+        # The resource tracker of the transmitting process must not remove
+        # the object when that process exits, before the terminal reads it
+        script = "from pansi._kitty import transmit_shared_memory; print(transmit_shared_memory(b'abc', 1, 1)[0])"
+        command = run([executable, "-c", script], capture_output=True, text=True, check=True).stdout
+        [(_, payload)] = parse_commands([command.rstrip("\n")])
+        memory = SharedMemory(name=b64decode(payload).decode("utf-8")[1:])
+        try:
+            self.assertEqual(bytes(memory.buf[:3]), b"abc")
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_is_local_kitty(self):
+        self.assertTrue(is_local_kitty({"TERM": "xterm-kitty", "KITTY_WINDOW_ID": "1"}))
+        self.assertFalse(is_local_kitty({"TERM": "xterm-kitty"}))
+        self.assertFalse(is_local_kitty({"KITTY_WINDOW_ID": "1", "SSH_TTY": "/dev/pts/1"}))
+        self.assertFalse(is_local_kitty({"KITTY_WINDOW_ID": "1", "TMUX": "/tmp/tmux-0/default,1,0"}))
+
+    def test_auto_medium_is_direct_outside_kitty(self):
+        with patch.dict(environ, clear=True):
+            [(controls, _)] = parse_commands(transmit(b"\x00\x00\x00", 1, 1))
+        self.assertNotIn("t", controls)
+
+    def test_unknown_medium(self):
+        with self.assertRaises(ValueError):
+            transmit(b"\x00\x00\x00", 1, 1, medium="carrier-pigeon")
+
+
+class KittyCommandsTest(TestCase):
+
+    def test_rgba_image(self):
+        commands = kitty_commands(Image.new("RGBA", (2, 1), (255, 0, 0, 128)), medium="direct")
+        [(controls, payload)] = parse_commands(commands)
+        self.assertEqual((controls["f"], controls["s"], controls["v"]), ("32", "2", "1"))
+        self.assertEqual(b64decode(payload), b"\xff\x00\x00\x80" * 2)
+
+    def test_other_modes_are_converted(self):
+        [(controls, payload)] = parse_commands(kitty_commands(Image.new("L", (1, 1), 64), medium="direct"))
+        self.assertEqual(controls["f"], "24")
+        self.assertEqual(b64decode(payload), b"\x40\x40\x40")
+
+
+class TerminalDrawTest(TestCase):
+
+    def setUp(self):
+        self.reactor = Reactor()
+        self.r, self.w = pipe()
+        self.output = StringIO()
+        self.terminal = Terminal(self.r, self.output, reactor=self.reactor, color_depth=24)
+        self.terminal.resize(20, 10, 160, 160)
+
+    def tearDown(self):
+        self.reactor.close()
+        close(self.r)
+        close(self.w)
+
+    def test_draw_kitty(self):
+        self.terminal.draw(Image.new("RGB", (1, 1), (0, 0, 255)), method="kitty", medium="direct")
+        self.assertEqual(self.output.getvalue(), "\x1b_Ga=T,q=2,f=24,s=1,v=1,m=0;AAD/\x1b\\\r\n")
+
+    def test_draw_blocks(self):
+        self.terminal.draw(Image.new("RGB", (16, 32), (255, 0, 0)), method="half")
+        self.assertEqual(self.output.getvalue(), "\x1b[38;2;255;0;0m██\x1b[0m\r\n" * 2)
+
+    def test_draw_mosaic_is_scaled_to_fit(self):
+        self.terminal.draw(Image.new("RGB", (320, 32), (255, 0, 0)), method="quadrant")
+        lines = self.output.getvalue().split("\r\n")[:-1]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(len(findall(" ", lines[0])), 20)
+
+    def test_draw_auto_falls_back_to_blocks_without_response(self):
+        self.terminal._response_timeout = 0.01
+        self.terminal.draw(Image.new("RGB", (16, 32), (255, 0, 0)))
+        self.assertTrue(self.output.getvalue().endswith("\x1b[38;2;255;0;0m██\x1b[0m\r\n" * 2))
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            self.terminal.draw(Image.new("RGB", (1, 1)), method="sixel")
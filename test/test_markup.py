@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from pansi import Markup, compile_markup, markup, measure_text, bold, green, red, red_bg, reset
+
+
+class MarkupTest(TestCase):
+
+    def test_plain_text(self):
+        self.assertEqual(markup("hello"), "hello")
+
+    def test_tags_use_sgr_codes(self):
+        self.assertEqual(markup("[green]ok[/]"), f"{green}ok{reset}")
+        self.assertEqual(markup("[bold on red]!![/]"), f"{red_bg}{bold}!!{reset}")
+
+    def test_nested_tags_restore_outer_style(self):
+        self.assertEqual(markup("[bold]a[red]b[/]c[/]"), f"{bold}a{red}b{reset}{bold}c{reset}")
+
+    def test_unclosed_tags_are_closed(self):
+        self.assertEqual(markup("[red]error"), f"{red}error{reset}")
+
+    def test_unbalanced_close(self):
+        with self.assertRaises(ValueError):
+            markup("oops[/]")
+
+    def test_unknown_style(self):
+        with self.assertRaises(ValueError):
+            markup("[sparkly]hi[/]")
+
+    def test_escaped_bracket(self):
+        self.assertEqual(markup("[[not a tag]"), "[not a tag]")
+
+    def test_format_fields(self):
+        self.assertEqual(markup("[red]{name}[/] {0:>3} {items[1]}", 7, name="x", items="ab"),
+                         f"{red}x{reset}   7 b")
+
+    def test_automatic_field_numbering(self):
+        self.assertEqual(markup("{} and {}", 1, 2), "1 and 2")
+
+    def test_measure(self):
+        self.assertEqual(measure_text(markup("[bold red]{}[/] ok", "日本")), [7])
+
+    def test_compiled_once(self):
+        self.assertIs(compile_markup("[red]{}[/]"), compile_markup("[red]{}[/]"))
+
+    def test_color_depth(self):
+        self.assertEqual(Markup("[#FF8000]x", color_depth=8).format(), "\x1b[38;5;208mx\x1b[0m")
+
+    def test_markup_color_depth(self):
+        for color_depth, expected in [(24, "\x1b[38;2;255;128;0m"), (8, "\x1b[38;5;208m"), (4, "\x1b[91m")]:
+            with self.subTest(color_depth=color_depth):
+                self.assertEqual(markup("[#FF8000]{}[/]", "x", color_depth=color_depth), f"{expected}x\x1b[0m")
+
+    def test_compiled_once_per_color_depth(self):
+        self.assertIsNot(compile_markup("[red]{}[/]", 8), compile_markup("[red]{}[/]", 4))
+        self.assertIs(compile_markup("[red]{}[/]", 8), compile_markup("[red]{}[/]", 8))
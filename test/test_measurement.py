@@ -0,0 +1,126 @@
+from unicodedata import category, east_asian_width, unidata_version
+from unittest import TestCase, skipUnless
+
+from pansi import measure_text, segment_cells, char_width, wrap_text, truncate, pad, clip, green, red, reset
+from pansi._unicode_tables import UNICODE_VERSION
+
+
+class MeasureTextTest(TestCase):
+
+    def test_ascii(self):
+        self.assertEqual(measure_text("hello, world"), [12])
+
+    def test_styled(self):
+        self.assertEqual(measure_text(f"hello, {green}world{reset}"), [12])
+
+    def test_full_width(self):
+        self.assertEqual(measure_text(f"hello, {green}ｗｏｒｌｄ{reset}"), [17])
+
+    def test_multiple_lines(self):
+        self.assertEqual(measure_text("hello\r\nworld\n"), [5, 5, 0])
+
+    def test_tabs_and_backspaces(self):
+        self.assertEqual(measure_text("ab\tc\b\bde"), [9])
+
+    def test_incomplete_escape_sequence(self):
+        self.assertEqual(measure_text("abc\x1b[1;"), [3])
+
+
+class UnicodeTablesTest(TestCase):
+
+    @skipUnless(unidata_version == UNICODE_VERSION, "Unicode version differs from generated tables")
+    def test_width_table_matches_unicode_database(self):
+        for code_point in range(0x20, 0x30000):
+            ch = chr(code_point)
+            if code_point < 0x7F:
+                expected = 1
+            else:
+                major, minor = category(ch)
+                if major in {'L', 'N', 'P', 'S'} or (major, minor) == ('Z', 's'):
+                    expected = 2 if east_asian_width(ch) in {'F', 'W'} else 1
+                else:
+                    expected = 0
+            self.assertEqual(char_width(ch), expected, f"U+{code_point:04X}")
+
+
+class GraphemeClusterTest(TestCase):
+
+    def test_combining_marks(self):
+        self.assertEqual(segment_cells("éx"), [("é", 1), ("x", 1)])
+
+    def test_zwj_emoji_sequence(self):
+        family = "\U0001F468‍\U0001F469‍\U0001F467"
+        self.assertEqual(segment_cells(family), [(family, 2)])
+        self.assertEqual(measure_text(f"[{family}]"), [4])
+
+    def test_flags(self):
+        self.assertEqual(segment_cells("\U0001F1EC\U0001F1E7\U0001F1EB\U0001F1F7"),
+                         [("\U0001F1EC\U0001F1E7", 2), ("\U0001F1EB\U0001F1F7", 2)])
+
+    def test_emoji_presentation_selector(self):
+        self.assertEqual(measure_text("❤️"), [2])
+
+    def test_hangul_jamo(self):
+        self.assertEqual(segment_cells("각"), [("각", 2)])
+
+    def test_crlf(self):
+        self.assertEqual(segment_cells("a\r\nb"), [("a", 1), ("\r\n", 0), ("b", 1)])
+
+    def test_tab(self):
+        self.assertEqual(segment_cells("ab\tc"), [("a", 1), ("b", 1), ("\t", 6), ("c", 1)])
+
+
+class WrapTextTest(TestCase):
+
+    def test_word_wrap(self):
+        self.assertEqual(wrap_text("the quick brown fox jumps over the lazy dog", 10),
+                         ["the quick", "brown fox", "jumps over", "the lazy", "dog"])
+
+    def test_long_words_are_broken(self):
+        self.assertEqual(wrap_text("supercalifragilistic", 10), ["supercalif", "ragilistic"])
+
+    def test_wide_characters(self):
+        self.assertEqual(wrap_text("漢字漢字漢字", 5), ["漢字", "漢字", "漢字"])
+
+    def test_hard_breaks_are_kept(self):
+        self.assertEqual(wrap_text("one\ntwo three", 5), ["one", "two", "three"])
+
+    def test_styles_are_carried_across_lines(self):
+        self.assertEqual(wrap_text(f"ab {red}cd ef gh{reset} ij", 5),
+                         ["ab \x1b[91mcd\x1b[0m", "\x1b[91mef gh\x1b[0m", "ij"])
+
+
+class TruncateAndPadTest(TestCase):
+
+    def test_truncate(self):
+        self.assertEqual(truncate("hello, world", 8), "hello, …")
+
+    def test_truncate_short_text(self):
+        self.assertEqual(truncate("hello", 8), "hello")
+
+    def test_truncate_keeps_escape_sequences(self):
+        self.assertEqual(truncate(f"{green}hello, world{reset}", 8), "\x1b[32mhello, …\x1b[0m")
+
+    def test_truncate_wide_characters(self):
+        self.assertEqual(truncate("漢字漢字", 6, ellipsis="..."), "漢...")
+
+    def test_pad(self):
+        self.assertEqual(pad("ab\n漢", 4), "ab  \n漢  ")
+
+    def test_pad_right(self):
+        self.assertEqual(pad(f"{green}hello{reset}", 8, align="right"), "   \x1b[32mhello\x1b[0m")
+
+    def test_pad_center(self):
+        self.assertEqual(pad("ab", 5, align="center", fillchar="."), ".ab..")
+
+
+class ClipTest(TestCase):
+
+    def test_clip(self):
+        self.assertEqual(clip("hello, world", 2, 9), "llo, wo")
+
+    def test_clip_wide_characters(self):
+        self.assertEqual(clip("日本語", 1, 5), " 本 ")
+
+    def test_clip_keeps_escape_sequences(self):
+        self.assertEqual(clip(f"{green}hello{reset}", 1, 3), f"{green}el{reset}")
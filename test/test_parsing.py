@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from pansi import Style, markup, parse_spans, strip_ansi, red, reset, CSI, OSC, ST
+
+
+class StripAnsiTest(TestCase):
+
+    def test_plain_text_unchanged(self):
+        text = "hello\tworld\n"
+        self.assertIs(strip_ansi(text), text)
+
+    def test_strip_sgr(self):
+        self.assertEqual(strip_ansi(f"{red}hello{reset} world"), "hello world")
+
+    def test_strip_other_sequences(self):
+        self.assertEqual(strip_ansi(f"{CSI}2J{CSI}1;1H{OSC}0;title{ST}ok\x9b31m!"), "ok!")
+
+    def test_nel_is_kept(self):
+        self.assertEqual(strip_ansi("a\x85b\x84c"), "a\x85bc")
+
+
+class ParseSpansTest(TestCase):
+
+    def test_unstyled(self):
+        self.assertEqual(list(parse_spans("hello")), [("hello", Style())])
+
+    def test_styles_are_shared(self):
+        spans = list(parse_spans(f"{red}a{reset}b{red}c"))
+        self.assertIs(spans[0][1], spans[2][1])
+
+    def test_cga_colors(self):
+        self.assertEqual(list(parse_spans("\x1b[31;104mx")),
+                         [("x", Style(color="maroon", background_color="blue"))])
+
+    def test_extended_colors(self):
+        self.assertEqual(list(parse_spans("\x1b[38;2;255;128;0;48;5;196mx")),
+                         [("x", Style(color="#FF8000", background_color="#FF0000"))])
+
+    def test_partial_resets(self):
+        spans = list(parse_spans("\x1b[1;3;4ma\x1b[22;23mb\x1b[24mc"))
+        self.assertEqual(spans, [("a", Style(font_weight="bold", font_style="italic", text_decoration="underline")),
+                                 ("b", Style(text_decoration="underline")),
+                                 ("c", Style())])
+
+    def test_stream_with_split_sequences(self):
+        chunks = ["one \x1b[", "91mtwo\x1b", "[0m three\x1b]0;ti", "tle\x1b\\!"]
+        spans = list(parse_spans(iter(chunks)))
+        self.assertEqual("".join(text for text, _ in spans), "one two three!")
+        self.assertEqual([style for text, style in spans if text == "two"], [Style(color="red")])
+
+    def test_stream_with_split_8bit_csi(self):
+        spans = list(parse_spans(iter(["one \x9b9", "1mtwo\x9b", "0m three"])))
+        self.assertEqual(spans, [("one ", Style()), ("two", Style(color="red")), (" three", Style())])
+
+    def test_round_trip(self):
+        source = markup("[bold red]error:[/] [italic #FF8000 on navy]{}[/] done", "disk full")
+        rendered = "".join(style.prefix() + text + style.suffix() for text, style in parse_spans(source))
+        self.assertEqual(list(parse_spans(rendered)), list(parse_spans(source)))
+        self.assertEqual(strip_ansi(rendered), "error: disk full done")
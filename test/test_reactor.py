@@ -0,0 +1,65 @@
+from io import StringIO
+from os import pipe, write, close
+from re import compile as re_compile
+from unittest import TestCase
+
+from pansi import Reactor, Terminal
+
+
+class ReactorTest(TestCase):
+
+    def setUp(self):
+        self.reactor = Reactor()
+        self.fds = []
+
+    def tearDown(self):
+        self.reactor.close()
+        for fd in self.fds:
+            close(fd)
+
+    def terminal(self):
+        r, w = pipe()
+        self.fds.extend((r, w))
+        return Terminal(r, StringIO(), reactor=self.reactor), w
+
+    def test_many_terminals_share_one_reactor(self):
+        sessions = [self.terminal() for _ in range(100)]
+        self.assertEqual(len(self.reactor), 100)
+        for i, (_, w) in enumerate(sessions):
+            write(w, f"{i}\x1b[A".encode("utf-8"))
+        for i, (terminal, _) in enumerate(sessions):
+            keys = []
+            terminal.add_event_listener("keypress", lambda event: keys.append(event.key))
+            self.assertEqual(terminal.loop(break_key="\x1b[A", timeout=5), "\x1b[A")
+            self.assertEqual("".join(keys), str(i))
+
+    def test_escape_sequence_split_across_reads(self):
+        terminal, w = self.terminal()
+        write(w, b"\x1b[1;")
+        self.assertIsNone(terminal.loop(break_key=re_compile(r"\x1b\["), timeout=0.1))
+        write(w, b"5C")
+        self.assertEqual(terminal.loop(break_key=re_compile(r"\x1b\[1;5C"), timeout=5).group(), "\x1b[1;5C")
+
+    def test_explicit_resize(self):
+        terminal, _ = self.terminal()
+        events = []
+        terminal.add_event_listener("resize", events.append)
+        terminal.resize(132, 43)
+        terminal.loop(timeout=0.1)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(tuple(terminal.measure()), (0, 0, 132, 43))
+
+    def test_arrow_key_split_after_escape(self):
+        terminal, w = self.terminal()
+        keys = []
+        terminal.add_event_listener("keypress", lambda event: keys.append(event.key))
+        write(w, b"\x1b")
+        self.assertIsNone(terminal.loop(timeout=0.01))
+        write(w, b"[A")
+        self.assertEqual(terminal.loop(break_key="\x1b[A", timeout=5), "\x1b[A")
+        self.assertEqual(keys, [])
+
+    def test_lone_escape_after_timeout(self):
+        terminal, w = self.terminal()
+        write(w, b"x\x1b")
+        self.assertEqual(terminal.loop(break_key="\x1b", timeout=5), "\x1b")
@@ -0,0 +1,198 @@
+from io import StringIO
+from os import pipe, close
+from unittest import TestCase
+
+from pansi import Box, Container, Reactor, Rect, Screen, Style, Terminal
+
+
+class BoxTest(TestCase):
+
+    def test_measurement_is_lazy(self):
+        box = Box("hello\nworld!")
+        self.assertIsNone(box._lines)
+        self.assertEqual(box.measure(), Rect(0, 0, 6, 2))
+        self.assertEqual(list(box.lines()), ["hello ", "world!"])
+
+    def test_set_content(self):
+        box = Box("hello")
+        self.assertEqual(box.measure(), Rect(0, 0, 5, 1))
+        box.set_content("hi")
+        self.assertEqual(box.measure(), Rect(0, 0, 2, 1))
+
+
+class ScreenTestCase(TestCase):
+
+    def setUp(self):
+        self.reactor = Reactor()
+        self.r, self.w = pipe()
+        self.output = StringIO()
+        self.terminal = Terminal(self.r, self.output, reactor=self.reactor)
+        self.terminal.resize(20, 10)
+
+    def tearDown(self):
+        self.reactor.close()
+        close(self.r)
+        close(self.w)
+
+    def render(self, screen):
+        self.output.seek(0)
+        self.output.truncate()
+        screen.render()
+        return self.output.getvalue()
+
+
+class ScreenLayoutTest(ScreenTestCase):
+
+    def test_layout(self):
+        screen = Screen(self.terminal)
+        screen.paste("title", display="block", align="center")
+        screen.paste("a")
+        screen.paste("bc")
+        screen.paste("right", display="block", align="right")
+        self.assertEqual(screen.layout(), [Rect(7, 0, 5, 1), Rect(0, 1, 1, 1),
+                                           Rect(1, 1, 2, 1), Rect(15, 2, 5, 1)])
+
+    def test_changed_box_invalidates_following_boxes_only(self):
+        screen = Screen(self.terminal)
+        first = screen.paste("one")
+        second = screen.paste("two")
+        screen.paste("three")
+        screen.layout()
+        second.set_content("2")
+        self.assertEqual(len(screen._layout), 1)
+        self.assertEqual(screen.layout(), [Rect(0, 0, 3, 1), Rect(3, 0, 1, 1), Rect(4, 0, 5, 1)])
+        self.assertIsNotNone(first._lines)
+
+    def test_resize_only_realigns(self):
+        screen = Screen(self.terminal)
+        box = screen.paste("title", display="block", align="center")
+        self.assertEqual(screen.layout(), [Rect(7, 0, 5, 1)])
+        box._content = "changed without invalidation"
+        self.terminal.resize(40, 10)
+        self.assertEqual(screen.layout(), [Rect(17, 0, 5, 1)])
+
+
+class ContainerTest(TestCase):
+
+    def test_measure(self):
+        container = Container()
+        container.paste("ab")
+        container.paste("cde")
+        container.paste("wide line", display="block", align="center")
+        self.assertEqual(container.measure(), Rect(0, 0, 9, 2))
+        self.assertEqual(container.layout(), [Rect(0, 0, 2, 1), Rect(2, 0, 3, 1), Rect(0, 1, 9, 1)])
+
+    def test_change_propagates_to_parent(self):
+        inner = Container()
+        box = inner.paste("ab")
+        outer = Container(inner)
+        self.assertEqual(outer.measure(), Rect(0, 0, 2, 1))
+        box.set_content("abcd")
+        self.assertEqual(outer.measure(), Rect(0, 0, 4, 1))
+
+
+class ScreenRenderTest(ScreenTestCase):
+
+    def test_first_render_paints_everything(self):
+        screen = Screen(self.terminal)
+        screen.paste("one")
+        screen.add(Container(Box("two"), Box("three")))
+        output = self.render(screen)
+        self.assertIn("\x1b[2J", output)
+        for text in ("one", "two", "three"):
+            self.assertIn(text, output)
+
+    def test_unchanged_screen_writes_nothing(self):
+        screen = Screen(self.terminal)
+        screen.paste("one")
+        self.render(screen)
+        self.assertEqual(self.render(screen), "")
+
+    def test_only_dirty_box_is_repainted(self):
+        screen = Screen(self.terminal)
+        screen.paste("one", display="block")
+        status = screen.add(Container(display="block")).paste("ready")
+        screen.paste("three", display="block")
+        self.render(screen)
+        status.set_content("done!")
+        self.assertEqual(self.render(screen), "\x1b[2;2Hdone!")
+
+    def test_moved_box_is_erased_and_repainted(self):
+        screen = Screen(self.terminal)
+        first = screen.paste("one")
+        screen.paste("two")
+        self.render(screen)
+        first.set_content("1")
+        self.assertEqual(self.render(screen), "\x1b[1;1H   \x1b[1;4H   \x1b[1;1H1\x1b[1;2Htwo")
+
+    def test_removed_box_is_erased(self):
+        screen = Screen(self.terminal)
+        box = screen.paste("one", display="block")
+        self.render(screen)
+        screen.remove(box)
+        self.assertEqual(self.render(screen), "\x1b[1;2H   ")
+
+    def test_resize_repaints_everything(self):
+        screen = Screen(self.terminal)
+        screen.paste("one")
+        self.render(screen)
+        self.terminal.resize(30, 10)
+        self.assertIn("one", self.render(screen))
+
+
+class ScreenClippingTest(ScreenTestCase):
+
+    def test_lines_below_viewport_are_skipped(self):
+        screen = Screen(self.terminal)
+        screen.paste("\n".join(f"line {i}" for i in range(20)))
+        output = self.render(screen)
+        self.assertIn("line 9", output)
+        self.assertNotIn("line 10", output)
+
+    def test_box_outside_viewport_is_skipped(self):
+        screen = Screen(self.terminal)
+        screen.paste("\n" * 9 + "x", display="block")
+        box = screen.paste("hidden", display="block")
+        output = self.render(screen)
+        self.assertNotIn("hidden", output)
+        self.assertIsNone(box.rect and box._painted)
+
+    def test_partial_line_is_cut_to_viewport(self):
+        screen = Screen(self.terminal)
+        screen.paste("x" * 17)
+        screen.paste("日本語")
+        output = self.render(screen)
+        self.assertTrue(output.endswith("\x1b[1;18H日 "), output)
+
+    def test_box_with_hidden_overflow(self):
+        screen = Screen(self.terminal)
+        screen.paste("hello\nworld\nagain", width=3, height=2, overflow="hidden")
+        screen.paste("!")
+        output = self.render(screen)
+        self.assertTrue(output.endswith("\x1b[1;1Hhel\x1b[2;1Hwor\x1b[1;4H!"), output)
+
+    def test_container_with_hidden_overflow(self):
+        screen = Screen(self.terminal)
+        screen.add(Container(Box("abcdef"), width=4, overflow="hidden"))
+        output = self.render(screen)
+        self.assertTrue(output.endswith("\x1b[1;1Habcd"), output)
+
+    def test_visible_overflow_is_painted(self):
+        screen = Screen(self.terminal)
+        screen.paste("abcdef", width=2)
+        screen.paste("!")
+        output = self.render(screen)
+        self.assertTrue(output.endswith("\x1b[1;1Habcdef\x1b[1;3H!"), output)
+
+
+class ScreenStyleTest(ScreenTestCase):
+
+    def test_box_with_style(self):
+        screen = Screen(self.terminal)
+        screen.paste("hi", style=Style(color="red"))
+        self.assertTrue(self.render(screen).endswith("\x1b[1;1H\x1b[91mhi\x1b[0m"))
+
+    def test_style_inherited_from_container(self):
+        screen = Screen(self.terminal)
+        screen.add(Container(Box("hi", font_weight="bold"), color="red"))
+        self.assertTrue(self.render(screen).endswith("\x1b[1;1H\x1b[91m\x1b[1mhi\x1b[0m"))
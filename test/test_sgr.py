@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from pansi import SGR, red, red_bg, default_fg
+from pansi.color import Color
+from pansi._text import color, background_color, font_weight, font_style, text_decoration
+
+
+class SGRTest(TestCase):
+
+    def test_str(self):
+        self.assertEqual(str(SGR(38, 2, 1, 2, 3, reset=39)), "\x1b[38;2;1;2;3m")
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            red.parameters = (31,)  # noqa
+        with self.assertRaises(AttributeError):
+            red.foo = 1  # noqa
+
+    def test_invert(self):
+        self.assertEqual(str(~red), "\x1b[39m")
+
+    def test_for_color_interned(self):
+        self.assertIs(SGR.for_color("red"), red)
+        self.assertIs(SGR.for_color("red", background=True), red_bg)
+        self.assertIs(SGR.for_color("default"), default_fg)
+
+    def test_for_color_cached(self):
+        self.assertIs(SGR.for_color("#FF8000"), SGR.for_color("#FF8000"))
+        self.assertEqual(str(SGR.for_color("#FF8000")), "\x1b[38;2;255;128;0m")
+
+    def test_for_color_web_palette_only(self):
+        self.assertEqual(str(SGR.for_color("red", web_palette_only=True)), "\x1b[38;2;255;0;0m")
+
+    def test_for_color_unhashable(self):
+        self.assertEqual(str(SGR.for_color([255, 128, 0])), "\x1b[38;2;255;128;0m")
+
+    def test_for_color_accepts_color(self):
+        self.assertEqual(str(SGR.for_color(Color(255, 128, 0))), "\x1b[38;2;255;128;0m")
+        self.assertEqual(str(SGR.for_color(Color(255, 0, 0), color_depth=4)), "\x1b[91m")
+
+    def test_for_color_functional_notation(self):
+        self.assertEqual(str(SGR.for_color("hsl(30 100% 50%)", background=True)), "\x1b[48;2;255;128;0m")
+
+    def test_for_color_unknown(self):
+        with self.assertRaises(ValueError):
+            SGR.for_color("not-a-color")
+
+
+class TextStyleTest(TestCase):
+
+    def test_color(self):
+        self.assertEqual(color("red"), "\x1b[91m")
+        self.assertEqual(color("not-a-color"), "")
+        self.assertEqual(background_color(" Lime "), "\x1b[102m")
+
+    def test_font_weight(self):
+        self.assertEqual(font_weight("bold"), "\x1b[1m")
+        self.assertEqual(font_weight(700), "\x1b[1m")
+        self.assertEqual(font_weight(300), "\x1b[2m")
+        self.assertEqual(font_weight("normal"), "\x1b[22m")
+        self.assertEqual(font_weight(None), "")
+
+    def test_font_style(self):
+        self.assertEqual(font_style("oblique"), "\x1b[3m")
+        self.assertEqual(font_style("normal"), "\x1b[23m")
+
+    def test_text_decoration(self):
+        self.assertEqual(text_decoration("Double Underline blink"), "\x1b[21m\x1b[5m")
+
+
+class ColorDepthTest(TestCase):
+
+    def test_truecolor(self):
+        self.assertEqual(str(SGR.for_color("#FF8000", color_depth=24)), "\x1b[38;2;255;128;0m")
+
+    def test_256_colors(self):
+        self.assertEqual(str(SGR.for_color("#FF8000", color_depth=8)), "\x1b[38;5;208m")
+        self.assertEqual(str(SGR.for_color("black", background=True, web_palette_only=True, color_depth=8)),
+                         "\x1b[48;5;16m")
+
+    def test_16_colors(self):
+        self.assertEqual(str(SGR.for_color("#FF5555", color_depth=4)), "\x1b[91m")
+        self.assertEqual(str(SGR.for_color("#0000AA", background=True, color_depth=4)), "\x1b[44m")
+
+    def test_named_cga_colors_unaffected(self):
+        self.assertIs(SGR.for_color("red", color_depth=8), red)
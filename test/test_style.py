@@ -0,0 +1,74 @@
+from io import StringIO
+from unittest import TestCase
+
+from pansi import Style, StyleSheet, TerminalOutput
+
+
+class StyleTest(TestCase):
+
+    def test_prefix_and_suffix(self):
+        style = Style(color="red", font_weight="bold")
+        self.assertEqual(style.prefix(), "\x1b[91m\x1b[1m")
+        self.assertEqual(style.suffix(), "\x1b[0m")
+
+    def test_empty_style(self):
+        self.assertFalse(Style())
+        self.assertEqual(Style().prefix(), "")
+        self.assertEqual(Style().suffix(), "")
+
+    def test_unknown_property(self):
+        with self.assertRaises(TypeError):
+            Style(colour="red")
+
+    def test_inheritance(self):
+        base = Style(color="red", font_style="italic")
+        derived = Style(base, color="blue")
+        self.assertEqual(derived, Style(color="blue", font_style="italic"))
+        self.assertEqual(base.derive(color="blue"), derived)
+
+    def test_composition(self):
+        self.assertEqual(Style(color="red") + Style(font_weight="bold", color="blue"),
+                         Style(color="blue", font_weight="bold"))
+
+    def test_compiled_once(self):
+        style = Style(color="red")
+        self.assertIs(style.compile(), style.compile())
+        self.assertIsNot(style.compile(8), style.compile(24))
+
+    def test_list_colours_are_hashable(self):
+        style = Style(color=[255, 0, 0], background_color=[0, 0, 255])
+        self.assertEqual(hash(style), hash(Style(color=(255, 0, 0), background_color=(0, 0, 255))))
+        self.assertEqual(style.prefix(), "\x1b[38;2;255;0;0m\x1b[48;2;0;0;255m")
+
+    def test_vertical_align(self):
+        self.assertEqual(Style(vertical_align="sub").compile()("H2O"), "H₂O")
+
+
+class StyleSheetTest(TestCase):
+
+    def test_define_and_inherit(self):
+        sheet = StyleSheet(base=Style(font_style="italic"))
+        sheet.define("error", "base", color="red")
+        self.assertEqual(sheet["error"], Style(font_style="italic", color="red"))
+
+    def test_composed_names(self):
+        sheet = StyleSheet(error=Style(color="red"), header=Style(font_weight="bold"))
+        self.assertEqual(sheet["error header"], Style(color="red", font_weight="bold"))
+        self.assertIs(sheet["error header"], sheet["error header"])
+
+    def test_unknown_name(self):
+        with self.assertRaises(KeyError):
+            _ = StyleSheet()["missing"]
+
+
+class StyledOutputTest(TestCase):
+
+    def test_write_with_style(self):
+        sio = StringIO()
+        TerminalOutput(sio, color_depth=24).write("hello", style=Style(color="red"))
+        self.assertEqual(sio.getvalue(), "\x1b[91mhello\x1b[0m")
+
+    def test_write_with_style_and_keywords(self):
+        sio = StringIO()
+        TerminalOutput(sio, color_depth=24).write("hello", style=Style(color="red"), font_weight="bold")
+        self.assertEqual(sio.getvalue(), "\x1b[91m\x1b[1mhello\x1b[0m")
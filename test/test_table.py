@@ -0,0 +1,52 @@
+from io import StringIO
+from unittest import TestCase
+
+from pansi import Column, TableWriter, TerminalOutput
+
+
+class TableWriterTest(TestCase):
+
+    def test_widths_estimated_from_sample(self):
+        out = StringIO()
+        with TableWriter(out, sample_size=2, end="\n") as table:
+            table.write_row(["a", "bb"])
+            self.assertEqual(out.getvalue(), "")
+            table.write_row(["ccc", "d"])
+            table.write_row(["eeeee", "f"])
+        self.assertEqual(out.getvalue(), "a   bb\nccc d\nee… f\n")
+
+    def test_declared_widths_stream_immediately(self):
+        out = StringIO()
+        table = TableWriter(out, [3, Column(4, align="right")], end="\n")
+        table.write_row(["x", 1])
+        self.assertEqual(out.getvalue(), "x      1\n")
+
+    def test_wrapped_cells(self):
+        out = StringIO()
+        with TableWriter(out, [Column(5, overflow="wrap"), 1], end="\n") as table:
+            table.write_row(["one two", "x"])
+        self.assertEqual(out.getvalue(), "one   x\ntwo\n")
+
+    def test_wide_characters(self):
+        out = StringIO()
+        with TableWriter(out, [5, 1], end="\n") as table:
+            table.write_row(["漢字漢字", "x"])
+        self.assertEqual(out.getvalue(), "漢字… x\n")
+
+    def test_styled_column(self):
+        out = StringIO()
+        with TableWriter(out, [Column(3, color="red")], end="\n") as table:
+            table.write_row(["ab"])
+        self.assertEqual(out.getvalue(), "\x1b[91mab\x1b[0m\n")
+
+    def test_styled_column_at_output_color_depth(self):
+        out = StringIO()
+        with TableWriter(TerminalOutput(out, color_depth=8), [Column(3, color="#FF8000")], end="\n") as table:
+            table.write_row(["ab"])
+        self.assertEqual(out.getvalue(), "\x1b[38;5;208mab\x1b[0m\n")
+
+    def test_wide_ellipsis(self):
+        out = StringIO()
+        with TableWriter(out, [Column(4, ellipsis="〜")], end="\n") as table:
+            table.write_row(["abcdef"])
+        self.assertEqual(out.getvalue(), "ab〜\n")
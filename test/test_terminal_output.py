@@ -1,7 +1,8 @@
 from io import StringIO
+from os import pipe, close
 from unittest import TestCase
 
-from pansi import TerminalOutput
+from pansi import Reactor, Terminal, TerminalOutput
 
 
 def decorate(text, **style):
@@ -22,3 +23,136 @@ class TerminalOutputTest(TestCase):
         self.assertEqual(
             decorate("one\ntwo", color="red"),
             "\x1b[91mone\x1b[0m\n\x1b[91mtwo\x1b[0m")
+
+    def test_blank_lines_are_not_styled(self):
+        self.assertEqual(
+            decorate("one\n\ntwo\n", color="red"),
+            "\x1b[91mone\x1b[0m\n\n\x1b[91mtwo\x1b[0m\n")
+
+    def test_writelines_writes_once(self):
+        writes = []
+        sio = StringIO()
+        sio.write = writes.append
+        to = TerminalOutput(sio)
+        to.writelines(["one\n", "two\n"], font_weight="bold")
+        self.assertEqual(writes, ["\x1b[1mone\x1b[0m\n\x1b[1mtwo\x1b[0m\n"])
+
+    def test_flush_within_frame_is_deferred(self):
+        calls = []
+        sio = StringIO()
+        sio.write = lambda s: calls.append(("write", s))
+        sio.flush = lambda: calls.append(("flush",))
+        to = TerminalOutput(sio)
+        with to.frame():
+            to.write("one")
+            to.flush()
+            with to.frame():
+                to.write("two")
+                to.flush()
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [("write", "onetwo"), ("flush",)])
+
+    def test_color_depth(self):
+        for color_depth, expected in [(24, "\x1b[38;2;255;128;0m"), (8, "\x1b[38;5;208m"), (4, "\x1b[91m")]:
+            sio = StringIO()
+            to = TerminalOutput(sio, color_depth=color_depth)
+            to.write("x", color="#FF8000")
+            self.assertEqual(sio.getvalue(), f"{expected}x\x1b[0m")
+
+
+class ThreadedTerminalOutputTest(TestCase):
+
+    def test_writes_from_many_threads_are_not_interleaved(self):
+        from threading import Thread
+        sio = StringIO()
+        to = TerminalOutput(sio, threaded=True)
+
+        def worker(n):
+            for i in range(50):
+                with to.frame():
+                    to.write(f"<{n}:")
+                    to.write(f"{i}", color="red")
+                    to.write(">")
+
+        threads = [Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        to.flush()
+        chunks = sio.getvalue().split(">")[:-1]
+        self.assertEqual(len(chunks), 8 * 50)
+        for chunk in chunks:
+            self.assertRegex(chunk, r"^<\d+:\x1b\[91m\d+\x1b\[0m$")
+        to.close()
+
+    def test_flush_waits_for_output(self):
+        sio = StringIO()
+        to = TerminalOutput(sio, threaded=True)
+        to.write("hello, world")
+        to.flush()
+        self.assertEqual(sio.getvalue(), "hello, world")
+        to.close()
+
+
+    def test_flush_within_frame_is_deferred(self):
+        sio = StringIO()
+        to = TerminalOutput(sio, threaded=True)
+        with to.frame():
+            to.write("hello, ")
+            to.flush()
+            self.assertEqual(sio.getvalue(), "")
+            to.write("world")
+        to.flush()
+        self.assertEqual(sio.getvalue(), "hello, world")
+        to.close()
+
+
+class TerminalPrintTest(TestCase):
+
+    def setUp(self):
+        self.reactor = Reactor()
+        self.r, self.w = pipe()
+        self.writes = []
+        out = StringIO()
+        out.write = self.writes.append
+        self.terminal = Terminal(self.r, out, reactor=self.reactor)
+
+    def tearDown(self):
+        self.reactor.close()
+        close(self.r)
+        close(self.w)
+
+    def test_print_writes_once(self):
+        self.terminal.print("one", 2, "three", color="red")
+        self.assertEqual(self.writes, ["\x1b[91mone\x1b[0m \x1b[91m2\x1b[0m \x1b[91mthree\x1b[0m\r\n"])
+
+    def test_print_sep_and_end(self):
+        self.terminal.print("one", "two", sep=", ", end="!\n")
+        self.terminal.print()
+        self.assertEqual(self.writes, ["one, two!\n", "\r\n"])
+
+    def test_print_many_writes_once(self):
+        self.terminal.print_many([("one", 1), ("two", 2), "three"], font_weight="bold")
+        self.assertEqual(len(self.writes), 1)
+
+    def test_print_many_writes_in_batches(self):
+        self.terminal._batch_size = 10
+        self.terminal.print_many(["one", "two", "three", "four"])
+        self.assertEqual(self.writes, ["one\r\ntwo\r\n", "three\r\nfour\r\n"])
+
+    def test_print_many_matches_print(self):
+        rows = [("one", 1), ("two", 2), "three", ()]
+        for options in [{}, {"sep": "|", "end": "\n"}, {"color": "red", "sep": ""}]:
+            with self.subTest(**options):
+                for row in rows:
+                    self.terminal.print(*((row,) if isinstance(row, str) else row), **options)
+                expected = "".join(self.writes)
+                self.writes.clear()
+                self.terminal.print_many(rows, **options)
+                self.assertEqual("".join(self.writes), expected)
+                self.writes.clear()
+
+    def test_print_many_consumes_rows_lazily(self):
+        self.terminal.print_many(str(i) for i in range(3))
+        self.assertEqual(self.writes, ["0\r\n1\r\n2\r\n"])
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Generator for pansi/_color_tables.py.
+
+The tables map quantized RGB values to the nearest entry in each of the
+xterm 256-colour and CGA 16-colour palettes, using Euclidean distance in
+OkLab space as a measure of perceptual difference. Each channel is reduced
+to LUT_BITS bits, and the table is indexed by the concatenation of the
+reduced red, green and blue values. Re-run this script after changing the
+palettes or the resolution of the tables::
+
+    python tools/generate_color_tables.py
+
+"""
+
+
+from base64 import b64encode
+from os import path
+from textwrap import wrap
+from zlib import compress
+
+
+TARGET = path.join(path.dirname(path.dirname(path.abspath(__file__))), "pansi", "_color_tables.py")
+
+LUT_BITS = 5
+
+HEADER = '''\
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# This file is generated by tools/generate_color_tables.py -- do not edit.
+'''
+
+#: CGA palette, in order of terminal colour index (see pansi._sgr.CGA_PALETTE)
+CGA_16_RGB = [
+    (0x00, 0x00, 0x00), (0xAA, 0x00, 0x00), (0x00, 0xAA, 0x00), (0xAA, 0x55, 0x00),
+    (0x00, 0x00, 0xAA), (0xAA, 0x00, 0xAA), (0x00, 0xAA, 0xAA), (0xAA, 0xAA, 0xAA),
+    (0x55, 0x55, 0x55), (0xFF, 0x55, 0x55), (0x55, 0xFF, 0x55), (0xFF, 0xFF, 0x55),
+    (0x55, 0x55, 0xFF), (0xFF, 0x55, 0xFF), (0x55, 0xFF, 0xFF), (0xFF, 0xFF, 0xFF),
+]
+
+
+def xterm_256_rgb():
+    """ Return the RGB values of the xterm 256-colour palette. The first
+    sixteen entries are taken from the CGA palette, although these vary
+    between terminals in practice.
+    """
+    levels = [0, 95, 135, 175, 215, 255]
+    colors = list(CGA_16_RGB)
+    colors.extend((r, g, b) for r in levels for g in levels for b in levels)
+    colors.extend((8 + 10 * i,) * 3 for i in range(24))
+    return colors
+
+
+def gamma_to_linear(c):
+    if c >= 0.04045:
+        return ((c + 0.055) / 1.055) ** 2.4
+    else:
+        return c / 12.92
+
+
+def rgb_to_oklab(r, g, b):
+    r = gamma_to_linear(r / 255)
+    g = gamma_to_linear(g / 255)
+    b = gamma_to_linear(b / 255)
+    l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+            1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+            0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s)
+
+
+def nearest_table(palette, first=0):
+    """ Build a lookup table of nearest palette indexes for every quantized
+    RGB value, considering only palette entries from `first` onwards.
+    """
+    candidates = [(i, rgb_to_oklab(*palette[i])) for i in range(first, len(palette))]
+    levels = 1 << LUT_BITS
+    # Represent each quantization cell by a value spread evenly across the
+    # full range, so that pure black and pure white are mapped exactly.
+    channel = [round(i * 255 / (levels - 1)) for i in range(levels)]
+    table = bytearray()
+    for r in channel:
+        for g in channel:
+            for b in channel:
+                l0, a0, b0 = rgb_to_oklab(r, g, b)
+                best = min(candidates, key=lambda c: ((c[1][0] - l0) ** 2 +
+                                                      (c[1][1] - a0) ** 2 +
+                                                      (c[1][2] - b0) ** 2))
+                table.append(best[0])
+    return bytes(table)
+
+
+def format_palette(name, palette):
+    lines = [f"{name} = ("]
+    for i in range(0, len(palette), 6):
+        lines.append("    " + " ".join(f"{rgb!r}," for rgb in palette[i:i + 6]))
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def format_table(name, table):
+    encoded = b64encode(compress(table, 9)).decode("ascii")
+    lines = [f"{name} = ("]
+    lines.extend(f"    b\"{chunk}\"" for chunk in wrap(encoded, 100))
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def generate():
+    xterm = xterm_256_rgb()
+    parts = [
+        HEADER,
+        "",
+        "#: Number of bits per channel used to index the lookup tables. An RGB",
+        "#: value (r, g, b) is looked up at index",
+        "#: ``(r >> 3) << 10 | (g >> 3) << 5 | (b >> 3)``.",
+        f"LUT_BITS = {LUT_BITS}",
+        "",
+        "#: RGB values of the CGA 16-colour palette, in terminal colour order.",
+        format_palette("CGA_16_RGB", CGA_16_RGB),
+        "",
+        "#: RGB values of the xterm 256-colour palette.",
+        format_palette("XTERM_256_RGB", xterm),
+        "",
+        "#: Nearest CGA palette index for each quantized RGB value, as a",
+        "#: base64-encoded, zlib-compressed byte string.",
+        format_table("CGA_16_LUT", nearest_table(CGA_16_RGB)),
+        "",
+        "#: Nearest xterm palette index for each quantized RGB value, as a",
+        "#: base64-encoded, zlib-compressed byte string. Only the colour cube and",
+        "#: greyscale ramp (indexes 16 to 255) are used, since the first sixteen",
+        "#: colours vary between terminals.",
+        format_table("XTERM_256_LUT", nearest_table(xterm, first=16)),
+        "",
+    ]
+    return "\n".join(parts)
+
+
+def main():
+    with open(TARGET, "w", encoding="utf-8") as f:
+        f.write(generate())
+
+
+if __name__ == "__main__":
+    main()
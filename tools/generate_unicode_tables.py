@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+""" Generator for pansi/_unicode_tables.py.
+
+The tables are derived from the Unicode Character Database bundled with the
+running Python interpreter, and are labelled with that database's version.
+Re-run this script with a newer Python to move to a newer version of
+Unicode::
+
+    python tools/generate_unicode_tables.py
+
+"""
+
+
+from os import path
+from unicodedata import category, east_asian_width, unidata_version
+
+
+TARGET = path.join(path.dirname(path.dirname(path.abspath(__file__))), "pansi", "_unicode_tables.py")
+
+MAX_CODE_POINT = 0x10FFFF
+
+HEADER = '''\
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+#
+# Copyright 2020, Nigel Small
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# This file is generated by tools/generate_unicode_tables.py -- do not edit.
+'''
+
+
+def char_width(code_point):
+    """ Number of cells occupied by a single code point, when printed on
+    its own. Control characters are given zero width here; those that move
+    the cursor are handled separately, by measure_text.
+    """
+    if code_point < 0x20:
+        return 0
+    elif code_point < 0x7F:
+        return 1
+    ch = chr(code_point)
+    major, minor = category(ch)
+    if major in {'L', 'N', 'P', 'S'} or (major, minor) == ('Z', 's'):
+        return 2 if east_asian_width(ch) in {'F', 'W'} else 1
+    else:
+        return 0
+
+
+# Grapheme_Cluster_Break property values, as used in the generated tables.
+# Extended_Pictographic is a separate property in the Unicode Character
+# Database, but no code point has both that property and a
+# Grapheme_Cluster_Break value other than Other, so they can be combined.
+GRAPHEME_BREAK_PROPERTIES = [
+    "OTHER",
+    "CR",
+    "LF",
+    "CONTROL",
+    "EXTEND",
+    "ZWJ",
+    "REGIONAL_INDICATOR",
+    "PREPEND",
+    "SPACING_MARK",
+    "L",
+    "V",
+    "T",
+    "LV",
+    "LVT",
+    "EXTENDED_PICTOGRAPHIC",
+]
+
+# The following properties are not available through unicodedata, so are
+# declared here, following the Unicode data files for UNICODE_VERSION.
+#
+# - https://www.unicode.org/reports/tr29/#Grapheme_Cluster_Break_Property_Values
+# - https://www.unicode.org/Public/UCD/latest/ucd/emoji/emoji-data.txt
+# - https://www.unicode.org/Public/UCD/latest/ucd/PropList.txt
+
+# Prepended_Concatenation_Mark
+PREPENDED_CONCATENATION_MARKS = [
+    (0x0600, 0x0605), (0x06DD, 0x06DD), (0x070F, 0x070F), (0x0890, 0x0891),
+    (0x08E2, 0x08E2), (0x110BD, 0x110BD), (0x110CD, 0x110CD),
+]
+
+# Grapheme_Cluster_Break = Prepend
+PREPEND = PREPENDED_CONCATENATION_MARKS + [
+    (0x0D4E, 0x0D4E), (0x111C2, 0x111C3), (0x1193F, 0x1193F), (0x11941, 0x11941),
+    (0x11A3A, 0x11A3A), (0x11A84, 0x11A89), (0x11D46, 0x11D46),
+]
+
+# Other_Grapheme_Extend, plus other code points with Grapheme_Cluster_Break
+# = Extend outside general categories Mn and Me
+OTHER_EXTEND = [
+    (0x09BE, 0x09BE), (0x09D7, 0x09D7), (0x0B3E, 0x0B3E), (0x0B57, 0x0B57),
+    (0x0BBE, 0x0BBE), (0x0BD7, 0x0BD7), (0x0CC2, 0x0CC2), (0x0CD5, 0x0CD6),
+    (0x0D3E, 0x0D3E), (0x0D57, 0x0D57), (0x0DCF, 0x0DCF), (0x0DDF, 0x0DDF),
+    (0x1B35, 0x1B35), (0x200C, 0x200C), (0x302E, 0x302F), (0xFF9E, 0xFF9F),
+    (0x1133E, 0x1133E), (0x11357, 0x11357), (0x114B0, 0x114B0), (0x114BD, 0x114BD),
+    (0x115AF, 0x115AF), (0x11930, 0x11930), (0x1D165, 0x1D165), (0x1D16E, 0x1D172),
+    (0x1F3FB, 0x1F3FF), (0xE0020, 0xE007F),
+]
+
+# Code points in general category Mc that are not SpacingMark
+NOT_SPACING_MARK = [
+    (0x102B, 0x102C), (0x1038, 0x1038), (0x1062, 0x1064), (0x1067, 0x106D),
+    (0x1083, 0x1083), (0x1087, 0x108C), (0x108F, 0x108F), (0x109A, 0x109C),
+    (0x1A61, 0x1A61), (0x1A63, 0x1A64), (0xAA7B, 0xAA7B), (0xAA7D, 0xAA7D),
+    (0x11720, 0x11721),
+]
+
+# Extended_Pictographic
+EXTENDED_PICTOGRAPHIC = [
+    (0x00A9, 0x00A9), (0x00AE, 0x00AE), (0x203C, 0x203C), (0x2049, 0x2049),
+    (0x2122, 0x2122), (0x2139, 0x2139), (0x2194, 0x2199), (0x21A9, 0x21AA),
+    (0x231A, 0x231B), (0x2328, 0x2328), (0x2388, 0x2388), (0x23CF, 0x23CF),
+    (0x23E9, 0x23F3), (0x23F8, 0x23FA), (0x24C2, 0x24C2), (0x25AA, 0x25AB),
+    (0x25B6, 0x25B6), (0x25C0, 0x25C0), (0x25FB, 0x25FE), (0x2600, 0x2605),
+    (0x2607, 0x2612), (0x2614, 0x2685), (0x2690, 0x2705), (0x2708, 0x2712),
+    (0x2714, 0x2714), (0x2716, 0x2716), (0x271D, 0x271D), (0x2721, 0x2721),
+    (0x2728, 0x2728), (0x2733, 0x2734), (0x2744, 0x2744), (0x2747, 0x2747),
+    (0x274C, 0x274C), (0x274E, 0x274E), (0x2753, 0x2755), (0x2757, 0x2757),
+    (0x2763, 0x2767), (0x2795, 0x2797), (0x27A1, 0x27A1), (0x27B0, 0x27B0),
+    (0x27BF, 0x27BF), (0x2934, 0x2935), (0x2B05, 0x2B07), (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B50), (0x2B55, 0x2B55), (0x3030, 0x3030), (0x303D, 0x303D),
+    (0x3297, 0x3297), (0x3299, 0x3299), (0x1F000, 0x1F0FF), (0x1F10D, 0x1F10F),
+    (0x1F12F, 0x1F12F), (0x1F16C, 0x1F171), (0x1F17E, 0x1F17F), (0x1F18E, 0x1F18E),
+    (0x1F191, 0x1F19A), (0x1F1AD, 0x1F1E5), (0x1F201, 0x1F20F), (0x1F21A, 0x1F21A),
+    (0x1F22F, 0x1F22F), (0x1F232, 0x1F23A), (0x1F23C, 0x1F23F), (0x1F249, 0x1F3FA),
+    (0x1F400, 0x1F53D), (0x1F546, 0x1F64F), (0x1F680, 0x1F6FF), (0x1F774, 0x1F77F),
+    (0x1F7D5, 0x1F7FF), (0x1F80C, 0x1F80F), (0x1F848, 0x1F84F), (0x1F85A, 0x1F85F),
+    (0x1F888, 0x1F88F), (0x1F8AE, 0x1F8FF), (0x1F90C, 0x1F93A), (0x1F93C, 0x1F945),
+    (0x1F947, 0x1FAFF), (0x1FC00, 0x1FFFD),
+]
+
+
+def in_ranges(code_point, range_list):
+    return any(lo <= code_point <= hi for lo, hi in range_list)
+
+
+def grapheme_break(code_point):
+    """ Grapheme_Cluster_Break property value (or Extended_Pictographic)
+    of a single code point, as an index into GRAPHEME_BREAK_PROPERTIES.
+    """
+    def value(name):
+        return GRAPHEME_BREAK_PROPERTIES.index(name)
+
+    if code_point == 0x0D:
+        return value("CR")
+    elif code_point == 0x0A:
+        return value("LF")
+    elif code_point == 0x200D:
+        return value("ZWJ")
+    elif 0x1F1E6 <= code_point <= 0x1F1FF:
+        return value("REGIONAL_INDICATOR")
+    elif in_ranges(code_point, PREPEND):
+        return value("PREPEND")
+    elif in_ranges(code_point, OTHER_EXTEND):
+        return value("EXTEND")
+    elif 0x1100 <= code_point <= 0x115F or 0xA960 <= code_point <= 0xA97C:
+        return value("L")
+    elif 0x1160 <= code_point <= 0x11A7 or 0xD7B0 <= code_point <= 0xD7C6:
+        return value("V")
+    elif 0x11A8 <= code_point <= 0x11FF or 0xD7CB <= code_point <= 0xD7FB:
+        return value("T")
+    elif 0xAC00 <= code_point <= 0xD7A3:
+        return value("LV") if (code_point - 0xAC00) % 28 == 0 else value("LVT")
+    elif in_ranges(code_point, EXTENDED_PICTOGRAPHIC):
+        return value("EXTENDED_PICTOGRAPHIC")
+    elif code_point in {0x0E33, 0x0EB3}:
+        return value("SPACING_MARK")
+    gc = category(chr(code_point))
+    if gc in {"Mn", "Me"}:
+        return value("EXTEND")
+    elif gc == "Mc":
+        return value("OTHER") if in_ranges(code_point, NOT_SPACING_MARK) else value("SPACING_MARK")
+    elif gc in {"Cc", "Cf", "Zl", "Zp"}:
+        return value("CONTROL")
+    elif gc == "Cn" and (0xE0000 <= code_point <= 0xE0FFF or 0xFFF0 <= code_point <= 0xFFF8
+                         or code_point == 0x2065):
+        # Unassigned, but Default_Ignorable_Code_Point
+        return value("CONTROL")
+    else:
+        return value("OTHER")
+
+
+def ranges(f):
+    """ Collapse the values of a function over all code points into a pair
+    of lists: range start points and the value for each range.
+    """
+    starts = []
+    values = []
+    for code_point in range(MAX_CODE_POINT + 1):
+        value = f(code_point)
+        if not values or value != values[-1]:
+            starts.append(code_point)
+            values.append(value)
+    return starts, values
+
+
+def format_table(name, values, formatter, per_line):
+    lines = [f"{name} = ("]
+    for i in range(0, len(values), per_line):
+        lines.append("    " + " ".join(f"{formatter(value)}," for value in values[i:i + per_line]))
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def generate():
+    width_starts, widths = ranges(char_width)
+    grapheme_break_starts, grapheme_breaks = ranges(grapheme_break)
+    return "\n".join([
+        HEADER,
+        "",
+        "#: Version of the Unicode Character Database from which these tables",
+        "#: were generated.",
+        f"UNICODE_VERSION = {unidata_version!r}",
+        "",
+        "#: Display width (0, 1 or 2 cells) of each code point, as a pair of",
+        "#: parallel tables. WIDTHS[i] applies to all code points from",
+        "#: WIDTH_STARTS[i] up to (but not including) WIDTH_STARTS[i + 1].",
+        format_table("WIDTH_STARTS", width_starts, lambda value: f"0x{value:05X}", 10),
+        format_table("WIDTHS", widths, str, 32),
+        "",
+        "#: Grapheme_Cluster_Break property values (UAX #29), with",
+        "#: Extended_Pictographic included as an additional value.",
+        *(f"GCB_{name} = {i}" for i, name in enumerate(GRAPHEME_BREAK_PROPERTIES)),
+        "",
+        "#: Grapheme_Cluster_Break property of each code point, as a pair of",
+        "#: parallel tables, arranged in the same way as the width tables.",
+        format_table("GRAPHEME_BREAK_STARTS", grapheme_break_starts, lambda value: f"0x{value:05X}", 10),
+        format_table("GRAPHEME_BREAKS", grapheme_breaks, str, 32),
+        "",
+    ])
+
+
+def main():
+    with open(TARGET, "w", encoding="utf-8") as f:
+        f.write(generate())
+
+
+if __name__ == "__main__":
+    main()